@@ -0,0 +1,344 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import asyncio
+import io
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar, Union
+
+from botocore.exceptions import ClientError
+
+from ..Decorators.Retryable import Retryable
+from ..Tools import logger
+from .AwsClientHub import AwsClientHub
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import AioSession
+    AIOBOTOCORE_AVAILABLE = True
+except ImportError:
+    AioConfig = None
+    AioSession = None
+    AIOBOTOCORE_AVAILABLE = False
+
+T = TypeVar('T')
+
+
+class AsyncS3ServiceGateway:
+    """
+    Asyncio counterpart of S3ServiceGateway for high-concurrency workloads on many small objects. All calls share one
+    aiobotocore client and its connection pool, and a semaphore bounds the number of requests in flight. Retries use
+    non-blocking sleeps, so one process can keep thousands of requests in flight.
+
+    Unlike the synchronous gateways this class is not a singleton, because its client is bound to the event loop it
+    was opened in. Use it as an async context manager, or call :meth:`close` when done.
+
+    Requires the optional `aiobotocore` package.
+
+    **Example**::
+
+        >>> async with AsyncS3ServiceGateway(max_concurrency=256) as s3:
+        ...     thumbnails = await s3.map(lambda key: s3.get_object('bucket', key), keys)
+    """
+
+    def __init__(self, max_concurrency: int = 100, max_pool_connections: Optional[int] = None,
+                 config: Optional['AioConfig'] = None, endpoint_url: Optional[str] = None):
+        """
+        Initializes the gateway. The client itself is created on first use inside the running event loop.
+
+        Region and endpoint are taken from the AwsClientHub's S3 client and credentials (access key, secret key and
+        session token, from whichever source the hub's session resolved them) from its session, so both gateways
+        talk to the same account and endpoint. Temporary credentials are frozen when the client opens;
+        reopen the gateway to pick up refreshed ones.
+
+        :param max_concurrency: The maximum number of S3 requests in flight through this gateway.
+        :type max_concurrency: int
+        :param max_pool_connections: The size of the shared HTTP connection pool. Defaults to `max_concurrency`.
+        :type max_pool_connections: int, optional
+        :param config: Optional aiobotocore configuration; overrides `max_pool_connections`.
+        :type config: AioConfig, optional
+        :param endpoint_url: Optional S3 endpoint, e.g. for S3 compatible local storage. Defaults to the endpoint of
+                             the hub's S3 client.
+        :type endpoint_url: str, optional
+        """
+        if not AIOBOTOCORE_AVAILABLE:
+            raise ImportError("The 'aiobotocore' package is required for AsyncS3ServiceGateway.")
+        client_manager = AwsClientHub()
+        sync_client = client_manager.get_s3_client()
+        self.region_name = sync_client.meta.region_name
+        self.aws_profile = client_manager.get_config().aws_profile
+        session = client_manager.aws_session_client
+        self._credentials = session.get_credentials() if session is not None else None
+        self.max_concurrency = max_concurrency
+        self.config = config or AioConfig(max_pool_connections=max_pool_connections or max_concurrency)
+        self.endpoint_url = endpoint_url or sync_client.meta.endpoint_url
+        self.s3_client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def open(self) -> 'AsyncS3ServiceGateway':
+        """Creates the shared S3 client if it is not open yet."""
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self.s3_client is None:
+                self._exit_stack = AsyncExitStack()
+                session = AioSession(profile=self.aws_profile)
+                if self._credentials is not None:
+                    frozen = self._credentials.get_frozen_credentials()
+                    session.set_credentials(frozen.access_key, frozen.secret_key, frozen.token)
+                self.s3_client = await self._exit_stack.enter_async_context(
+                    session.create_client('s3', region_name=self.region_name, config=self.config,
+                                          endpoint_url=self.endpoint_url))
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                logger.debug("AsyncS3ServiceGateway initialized with S3 client.")
+        return self
+
+    async def close(self) -> None:
+        """Closes the shared S3 client and its connection pool."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self.s3_client = None
+
+    async def __aenter__(self) -> 'AsyncS3ServiceGateway':
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _call(self, operation: str, **kwargs) -> Any:
+        """Runs a single client operation within the concurrency limit."""
+        await self.open()
+        async with self._semaphore:
+            return await getattr(self.s3_client, operation)(**kwargs)
+
+    async def gather(self, awaitables: Iterable[Awaitable[T]], limit: Optional[int] = None,
+                     return_exceptions: bool = False) -> List[T]:
+        """
+        Awaits many awaitables with at most `limit` of them running at once and returns their results in order.
+
+        Gateway calls are additionally bounded by the gateway's own `max_concurrency`.
+
+        :param awaitables: The coroutines or futures to await.
+        :type awaitables: Iterable[Awaitable]
+        :param limit: The maximum number of awaitables running at once. Defaults to `max_concurrency`.
+        :type limit: int, optional
+        :param return_exceptions: Whether to return exceptions as results instead of raising the first one.
+        :type return_exceptions: bool
+        :returns: The results in the order of `awaitables`.
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_concurrency)
+
+        async def bounded(awaitable: Awaitable[T]) -> T:
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(*(bounded(awaitable) for awaitable in awaitables),
+                                    return_exceptions=return_exceptions)
+
+    async def map(self, func: Callable[[Any], Awaitable[T]], items: Iterable[Any], limit: Optional[int] = None,
+                  return_exceptions: bool = False) -> List[T]:
+        """
+        Applies an async function to every item with bounded concurrency. `limit` workers pull items from `items`,
+        so each call (and each item of a generator) is only created once a worker is free. Without
+        `return_exceptions`, workers stop taking new items after the first failure and that exception is raised.
+
+        :param func: The async function to apply, e.g. ``lambda key: s3.get_object(bucket, key)``.
+        :type func: Callable[[Any], Awaitable]
+        :param items: The items to process.
+        :type items: Iterable
+        :param limit: The maximum number of calls running at once. Defaults to `max_concurrency`.
+        :type limit: int, optional
+        :param return_exceptions: Whether to return exceptions as results instead of raising the first one.
+        :type return_exceptions: bool
+        :returns: The results in the order of `items`.
+        :rtype: list
+        """
+        pending = enumerate(items)
+        results = {}
+        failed = False
+
+        async def worker() -> None:
+            nonlocal failed
+            for index, item in pending:
+                if failed:
+                    return
+                try:
+                    results[index] = await func(item)
+                except Exception as e:
+                    if not return_exceptions:
+                        failed = True
+                        raise
+                    results[index] = e
+
+        await asyncio.gather(*(worker() for _ in range(limit or self.max_concurrency)))
+        return [results[index] for index in range(len(results))]
+
+    async def upload_file(self, file: Union[str, Path, bytes, bytearray, memoryview, io.IOBase], bucket_name: str,
+                          object_key: str, return_url: bool = False) -> Union[None, str]:
+        """
+        Uploads a small object to S3 with a single PUT.
+
+        The content is read once, from the current position of a file-like object, before the PUT is sent; only the
+        PUT itself is retried, so retries always resend the complete body.
+
+        :param file: The file path, bytes-like object or binary file-like object to upload.
+        :type file: Union[str, Path, bytes, bytearray, memoryview, io.IOBase]
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param return_url: Whether to return the S3 URL of the uploaded file.
+        :type return_url: bool
+        :return: The S3 URL of the uploaded file if `return_url` is True, otherwise None.
+        :rtype: Union[None, str]
+        """
+        if isinstance(file, (str, Path)):
+            body = await asyncio.to_thread(Path(file).read_bytes)
+        elif isinstance(file, (bytes, bytearray, memoryview)):
+            body = file
+        elif hasattr(file, 'read') and callable(file.read):
+            body = await asyncio.to_thread(file.read)
+        else:
+            raise ValueError("The file parameter must be a file path, bytes-like object or file-like object.")
+        if len(body) == 0:
+            raise ValueError("The content is empty.")
+
+        logger.debug(f"Uploading object to bucket: {bucket_name} as object: {object_key}")
+        await self._put_object(bucket_name, object_key, bytes(body))
+        logger.debug(f"File uploaded to bucket: {bucket_name} as object: {object_key}")
+        if return_url:
+            return f"https://{bucket_name}.s3.amazonaws.com/{object_key}"
+
+    @Retryable()
+    async def _put_object(self, bucket_name: str, object_key: str, body: bytes) -> None:
+        """Sends one PUT of an in-memory body."""
+        await self._call('put_object', Bucket=bucket_name, Key=object_key, Body=body)
+
+    @Retryable()
+    async def get_object(self, bucket_name: str, object_key: str) -> io.BytesIO:
+        """
+        Retrieves an object from S3 and returns its content as a file stream.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :returns: The content of the object as a BytesIO stream.
+        :rtype: io.BytesIO
+        """
+        logger.debug(f"Attempting to retrieve object: {object_key} from bucket: {bucket_name}")
+        await self.open()
+        async with self._semaphore:
+            obj = await self.s3_client.get_object(Bucket=bucket_name, Key=object_key)
+            async with obj['Body'] as stream:
+                content = await stream.read()
+        logger.debug(f"Object retrieved: {object_key} from bucket: {bucket_name}")
+        return io.BytesIO(content)
+
+    @Retryable()
+    async def check_object_existence(self, bucket_name: str, object_key: str) -> bool:
+        """
+        Checks if an object exists in an S3 bucket.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :returns: True if the object exists, False otherwise.
+        :rtype: bool
+        """
+        try:
+            await self._call('head_object', Bucket=bucket_name, Key=object_key)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == "404":
+                return False
+            raise
+
+    @Retryable()
+    async def list_objects(self, bucket_name: str, prefix: str = None) -> list:
+        """
+        Lists objects in an S3 bucket, optionally filtered by a prefix.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param prefix: The prefix to filter the objects.
+        :type prefix: str, optional
+        :returns: A list of object keys.
+        :rtype: list
+        """
+        logger.debug(f"Listing objects in bucket: {bucket_name} with prefix: {prefix}")
+        await self.open()
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        object_list = []
+        async with self._semaphore:
+            async for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix or ''):
+                object_list.extend(item['Key'] for item in page.get('Contents', []))
+        logger.debug(f"Objects listed in bucket: {bucket_name} with prefix: {prefix}")
+        return object_list
+
+    @Retryable()
+    async def copy_object(self, src_bucket_name: str, src_object_key: str, dst_bucket_name: str,
+                          dst_object_key: str) -> None:
+        """
+        Copies an object from one S3 bucket to another.
+
+        :param src_bucket_name: The source S3 bucket name.
+        :type src_bucket_name: str
+        :param src_object_key: The key of the source object in the source S3 bucket.
+        :type src_object_key: str
+        :param dst_bucket_name: The destination S3 bucket name.
+        :type dst_bucket_name: str
+        :param dst_object_key: The key of the object in the destination S3 bucket.
+        :type dst_object_key: str
+        """
+        logger.debug(f"Copying object: {src_object_key} from {src_bucket_name} to {dst_bucket_name}/{dst_object_key}")
+        await self._call('copy_object', Bucket=dst_bucket_name, Key=dst_object_key,
+                         CopySource={'Bucket': src_bucket_name, 'Key': src_object_key})
+
+    @Retryable()
+    async def delete_object(self, bucket_name: str, object_key: str) -> None:
+        """
+        Deletes an object from S3.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        """
+        logger.debug(f"Deleting object: {object_key} from bucket: {bucket_name}")
+        await self._call('delete_object', Bucket=bucket_name, Key=object_key)
+
+    async def get_signed_url(self, bucket_name: str, object_key: str, expiration_seconds: int = 3600) -> str:
+        """
+        Generate a signed URL for an S3 object. Signing happens locally, so no request is made.
+
+        :param bucket_name: Name of the S3 bucket
+        :type bucket_name: str
+        :param object_key: Key of the S3 object
+        :type object_key: str
+        :param expiration_seconds: Time in seconds for the presigned URL to remain valid
+        :type expiration_seconds: int
+        :return: Presigned URL as a string
+        :rtype: str
+        """
+        await self.open()
+        return await self.s3_client.generate_presigned_url('get_object',
+                                                           Params={'Bucket': bucket_name, 'Key': object_key},
+                                                           ExpiresIn=expiration_seconds)
@@ -1,17 +1,28 @@
+import csv
+import io
+import itertools
 import json
 import math
-from datetime import datetime, timedelta
-from typing import Optional, Any, Union, List, Tuple
-from uuid import UUID
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Union, List, Tuple, Iterable, Iterator, Callable, Dict, Set
+from uuid import UUID, uuid4
 
 import psycopg2
 import psycopg2.extensions
 import psycopg2.extras
 from mypy_boto3_rds.client import RDSClient
+from psycopg2 import sql
 from psycopg2.pool import ThreadedConnectionPool
 from .AwsClientHub import AwsClientHub
+from .S3ServiceGateway import S3ServiceGateway
 from ..Decorators.SingletonClass import SingletonClass
 from ..Tools import logger
+from .._Internal._ChunkedStream import (_ChunkedStreamReader, _decompress_chunks, _detect_compression, _iter_lines,
+                                        DEFAULT_CHUNK_SIZE)
+from .._Internal._SpillBuffer import _SpillBuffer
 
 try:
     import pandas as pd
@@ -21,6 +32,32 @@ except ImportError:
     PANDAS_AVAILABLE = False
     DataFrame = object
 
+
+_UUID_PATTERN = r'(?:urn:uuid:)?\{?[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}\}?'
+_NUMERIC_KINDS = ('integer', 'floating', 'mixed-integer', 'mixed-integer-float', 'decimal', 'complex', 'boolean')
+
+
+def _to_uuid_strings(series: 'pd.Series') -> 'pd.Series':
+    """
+    Validates a Series of UUIDs, UUID strings or 16-byte values and returns their canonical string forms, using string
+    operations over the whole column. Numbers are rejected.
+    """
+    if pd.api.types.infer_dtype(series, skipna=True) in _NUMERIC_KINDS:
+        value = series.dropna().iloc[0]
+        raise TypeError(f"{type(value).__name__} value {value!r} is not a valid UUID")
+    raw = series.map(type).eq(bytes)
+    text = series.mask(raw).astype('string').str.lower()
+    invalid = text.notna() & ~text.str.fullmatch(_UUID_PATTERN).fillna(False).astype(bool)
+    if invalid.any():
+        value = series[invalid].iloc[0]
+        raise TypeError(f"{type(value).__name__} value {value!r} is not a valid UUID")
+    digits = text.str.replace(r'^urn:uuid:|[{}-]', '', regex=True)
+    if raw.any():
+        digits = digits.mask(raw, series[raw].map(lambda value: UUID(bytes=value).hex))
+    return (digits.str[:8] + '-' + digits.str[8:12] + '-' + digits.str[12:16] + '-' + digits.str[16:20] + '-' +
+            digits.str[20:])
+
+
 @SingletonClass
 class RdsServiceGateway:
     """
@@ -30,7 +67,9 @@ class RdsServiceGateway:
 
     psycopg2.extras.register_uuid()
 
-    def __init__(self, multithreaded: bool = False, min_pool_size: int = 1, max_pool_size: int = 10):
+    def __init__(self, multithreaded: bool = False, min_pool_size: int = 1, max_pool_size: int = 10,
+            schema_cache_ttl: int = 300, result_memory_budget: Optional[int] = None,
+            spill_directory: Optional[str] = None):
         """
         Initializes the RdsServiceGateway by establishing a connection or connection pool
         depending on the multithreading mode.
@@ -41,8 +80,22 @@ class RdsServiceGateway:
         :type min_pool_size: int
         :param max_pool_size: Maximum number of connections in the pool (only if multithreaded is True).
         :type max_pool_size: int
+        :param schema_cache_ttl: Seconds a table's introspected column types are cached for.
+        :type schema_cache_ttl: int
+        :param result_memory_budget: Approximate number of bytes a `get_data(fetchall=True)` result may hold in memory
+                                     before its rows are spilled to disk. None disables the budget.
+        :type result_memory_budget: int, optional
+        :param spill_directory: The directory spilled results are written to. Defaults to the system temp directory.
+        :type spill_directory: str, optional
         """
         self.multithreaded = multithreaded
+        self.result_memory_budget = result_memory_budget
+        self.spill_directory = spill_directory
+        self.schema_cache_ttl = schema_cache_ttl
+        self._schema_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._result_descriptions: Dict[Tuple[str, tuple], List[Tuple[str, int]]] = {}
+        self._schema_lock = threading.Lock()
+        self._state_tables: Set[str] = set()
         client_manager = AwsClientHub()
         self.config = client_manager.get_config()
         self.db_uri = client_manager.get_db_uri()
@@ -79,9 +132,16 @@ class RdsServiceGateway:
             show_query: bool = False, raise_on_error: bool = False) -> Optional[Any]:
         """
         Fetch data from the database based on the input query and parameters.
+
+        If the gateway has a `result_memory_budget`, read queries with `fetchall` are streamed through a server-side
+        cursor. Results within the budget are returned as a list as usual; larger results are spilled to a
+        memory-mapped file and returned as a lazily indexed, list-like object (rows are tuples if `return_dict` is
+        False). Call ``close()`` on it to delete the file early.
         """
         conn = self.get_connection()
         try:
+            if fetchall and self.result_memory_budget and self._is_read_query(query):
+                return self._fetch_within_budget(conn, query, payload, return_dict, show_query)
             with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
                 if show_query:
                     logger.context("Mogrified Query:", cursor.mogrify(query, payload))
@@ -107,14 +167,107 @@ class RdsServiceGateway:
         finally:
             self.release_connection(conn)
 
+    def _fetch_within_budget(self, conn: psycopg2.extensions.connection, query: str, payload: Optional[tuple],
+            return_dict: bool, show_query: bool) -> Union[List[Any], _SpillBuffer]:
+        """
+        Fetches a result page by page through a named cursor, keeping rows in memory until their estimated size
+        crosses `result_memory_budget` and spilling all rows to a _SpillBuffer from then on.
+        """
+        rows: List[Any] = []
+        spill: Optional[_SpillBuffer] = None
+        row_size = None
+        page_size = self.config.db_batch_size
+        with conn.cursor(name=f"wrenchcl_{uuid4().hex}", cursor_factory=psycopg2.extras.DictCursor) as cursor:
+            if show_query:
+                logger.context("Mogrified Query:", cursor.mogrify(query, payload))
+            else:
+                logger.debug("Mogrified Query:", cursor.mogrify(query, payload))
+            cursor.execute(query, payload)
+            while True:
+                page = cursor.fetchmany(page_size)
+                if not page:
+                    break
+                page = [dict(row) if return_dict else tuple(row) for row in page]
+                if spill is not None:
+                    spill.extend(page)
+                    continue
+                if row_size is None:
+                    sample = page[:100]
+                    row_size = sum(self._estimate_row_size(row) for row in sample) // len(sample)
+                rows.extend(page)
+                if len(rows) * row_size > self.result_memory_budget:
+                    logger.warning(f"Query result exceeded the memory budget of {self.result_memory_budget} bytes "
+                                   f"after {len(rows)} rows, spilling to disk")
+                    spill = _SpillBuffer(self.spill_directory)
+                    spill.extend(rows)
+                    rows = []
+
+        if spill is None:
+            logger.debug("Fetched data: %s", str(rows)[:100])
+            return rows
+        spill.finalize()
+        logger.debug(f"Fetched {len(spill)} rows, {spill.nbytes} bytes spilled to disk")
+        return spill
+
+    @staticmethod
+    def _estimate_row_size(row: Union[dict, tuple]) -> int:
+        """Approximates the in-memory size of a fetched row, including its values."""
+        values = row.values() if isinstance(row, dict) else row
+        return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in values)
+
+    @staticmethod
+    def _is_read_query(query: Any) -> bool:
+        """Whether a query can run through a server-side cursor, which only accepts SELECT-like statements."""
+        if not isinstance(query, str) or not query.strip():
+            return False
+        return query.split(None, 1)[0].upper() in ('SELECT', 'WITH', 'VALUES', 'TABLE')
+
+    def batch(self, mode: str = 'sequential', raise_on_error: bool = False) -> 'QueryBatch':
+        """
+        Creates a batch that collects several read queries and executes them together.
+
+        'sequential' mode runs the queries one after another on a single connection and transaction. The opt-in
+        'combined' mode ships all queries as one statement in a single round trip: every result set is aggregated on
+        the server into a JSON array of the rows' text values, which are cast back with psycopg2's own typecasters, so
+        the results equal those of 'sequential' mode, including row order and duplicate column names. The column
+        types are learned with one extra ``LIMIT 0`` round trip the first time a query (and parameter types) is seen
+        and cached on the gateway. Since each result is built in server memory, 'combined' suits many small reads.
+
+        **Example**::
+
+            >>> with gateway.batch() as batch:
+            ...     batch.add("SELECT * FROM users WHERE id = %s", (user_id,), fetchall=False)
+            ...     batch.add("SELECT * FROM orders WHERE user_id = %s", (user_id,))
+            >>> user, orders = batch.results
+
+        :param mode: 'sequential', or 'combined' for a single round trip.
+        :type mode: str
+        :param raise_on_error: Whether to raise exceptions on errors instead of returning None results.
+        :type raise_on_error: bool
+        :returns: An empty query batch bound to this gateway.
+        :rtype: QueryBatch
+        """
+        return QueryBatch(self, mode=mode, raise_on_error=raise_on_error)
+
     def update_database(self, query: str, payload: Union[tuple, list[tuple], DataFrame], returning: bool = False,
-            column_order: Optional[List[str]] = None, raise_on_error: bool = True) -> Optional[List[tuple]]:
+            column_order: Optional[List[str]] = None, raise_on_error: bool = True,
+            target_table: Optional[str] = None) -> Optional[List[tuple]]:
         """
         Updates the database by executing the given query with the provided payload.
+
+        When `target_table` is given for a DataFrame payload, the column types of the table are introspected (and
+        cached) and the DataFrame is cast to them before any batch is sent, so type mismatches fail up front.
+        `column_order` then defaults to the table columns present in the DataFrame.
         """
-        conn = self.get_connection()
+        conn = None
         try:
-            payload = self.convert_payload(payload)
+            if target_table and PANDAS_AVAILABLE and isinstance(payload, DataFrame):
+                schema = self.get_table_schema(target_table)
+                column_order = column_order or [col for col in schema if col in payload.columns]
+                payload = self._cast_dataframe_to_schema(payload, schema, column_order)
+            else:
+                payload = self.convert_payload(payload)
+            conn = self.get_connection()
             if isinstance(payload, tuple):
                 with conn.cursor() as cursor:
                     cursor.execute(query, payload)
@@ -155,7 +308,8 @@ class RdsServiceGateway:
 
                     conn.commit()
         except Exception as e:
-            conn.rollback()
+            if conn is not None:
+                conn.rollback()
             if isinstance(e, IndexError):
                 try:
                     logger.error(f"Error processing batch: IndexError | Got {query.count('%s')} placeholders and {len(payload)} values. {e}")
@@ -166,8 +320,417 @@ class RdsServiceGateway:
             if raise_on_error:
                 raise e
         finally:
+            if conn is not None:
+                self.release_connection(conn)
+
+    def copy_from_s3(self, bucket_name: str, object_key: str, table: str, columns: Optional[List[str]] = None,
+            file_format: str = 'csv', compression: Optional[str] = 'auto', header: bool = True, delimiter: str = ',',
+            merge_keys: Optional[List[str]] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+            raise_on_error: bool = True) -> Optional[int]:
+        """
+        Streams a CSV or JSONL object from S3 straight into a table using ``COPY ... FROM STDIN``.
+
+        The S3 body is read in chunks, decompressed on the fly and handed to the database as it arrives, so memory
+        stays flat regardless of the object size. When `merge_keys` is given the data is first copied into a temporary
+        staging table and then merged into the target with ``INSERT ... ON CONFLICT DO UPDATE``, which makes reloading
+        the same object idempotent. Merge keys must be unique within the object.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param table: The target table, optionally schema qualified (e.g. 'public.events').
+        :type table: str
+        :param columns: The target columns in file order. Defaults to all table columns for CSV and to the keys of the
+                        first record for JSONL.
+        :type columns: List[str], optional
+        :param file_format: 'csv' or 'jsonl'.
+        :type file_format: str
+        :param compression: 'auto' to detect from Content-Encoding or the key suffix, 'gzip', 'bz2', 'zstd' or None.
+        :type compression: str, optional
+        :param header: Whether the CSV object starts with a header row.
+        :type header: bool
+        :param delimiter: The CSV field delimiter.
+        :type delimiter: str
+        :param merge_keys: Columns of the target's unique constraint to merge on. If None, rows are appended directly.
+        :type merge_keys: List[str], optional
+        :param chunk_size: The number of bytes read from S3 per chunk.
+        :type chunk_size: int
+        :param raise_on_error: Whether to raise exceptions on errors.
+        :type raise_on_error: bool
+        :returns: The number of rows copied, or None if an error occurred and `raise_on_error` is False.
+        :rtype: Optional[int]
+        """
+        file_format = file_format.lower()
+        if file_format not in ('csv', 'jsonl'):
+            raise ValueError(f"Unsupported file format: {file_format}. Use 'csv' or 'jsonl'.")
+
+        target = sql.Identifier(*table.split('.'))
+        conn = self.get_connection()
+        reader = None
+        start = time.time()
+        try:
+            obj = S3ServiceGateway().s3_client.get_object(Bucket=bucket_name, Key=object_key)
+            if compression == 'auto':
+                compression = _detect_compression(object_key, obj.get('ContentEncoding'))
+            chunks = _decompress_chunks(obj['Body'].iter_chunks(chunk_size), compression)
+
+            if file_format == 'jsonl':
+                lines = (line for line in _iter_lines(chunks) if line.strip())
+                first_line = next(lines, None)
+                if first_line is None:
+                    raise ValueError("The JSONL object is empty.")
+                columns = columns or list(json.loads(first_line).keys())
+                chunks = self._jsonl_to_csv_chunks(itertools.chain([first_line], lines), columns)
+                header, delimiter = False, ','
+
+            reader = _ChunkedStreamReader(chunks)
+            column_list = sql.SQL('') if not columns else sql.SQL(' ({})').format(
+                sql.SQL(', ').join(map(sql.Identifier, columns)))
+            copy_options = sql.SQL("FORMAT csv, HEADER {}, DELIMITER {}").format(
+                sql.SQL('true' if header else 'false'), sql.Literal(delimiter))
+
+            with conn.cursor() as cursor:
+                copy_target = target
+                if merge_keys:
+                    copy_target = sql.Identifier(f"_wrenchcl_stage_{uuid4().hex}")
+                    cursor.execute(sql.SQL("CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP").format(
+                        copy_target, target))
+
+                copy_query = sql.SQL("COPY {}{} FROM STDIN WITH ({})").format(copy_target, column_list, copy_options)
+                cursor.copy_expert(copy_query, reader, size=1024 * 1024)
+                row_count = cursor.rowcount
+
+                if merge_keys:
+                    if not columns:
+                        cursor.execute(sql.SQL("SELECT * FROM {} LIMIT 0").format(copy_target))
+                        columns = [desc[0] for desc in cursor.description]
+                    update_columns = [col for col in columns if col not in merge_keys]
+                    merge_action = sql.SQL("DO NOTHING") if not update_columns else sql.SQL("DO UPDATE SET {}").format(
+                        sql.SQL(', ').join(sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(col))
+                                           for col in update_columns))
+                    column_identifiers = sql.SQL(', ').join(map(sql.Identifier, columns))
+                    cursor.execute(sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} ON CONFLICT ({}) {}").format(
+                        target, column_identifiers, column_identifiers, copy_target,
+                        sql.SQL(', ').join(map(sql.Identifier, merge_keys)), merge_action))
+                    logger.debug(f"Merged {cursor.rowcount} rows from staging into {table}")
+            conn.commit()
+
+            elapsed = max(time.time() - start, 1e-9)
+            logger.debug(f"Copied {row_count} rows from s3://{bucket_name}/{object_key} into {table} | "
+                         f"{reader.bytes_read / elapsed / 1024 / 1024:.2f} MB/s decompressed")
+            return row_count
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error copying s3://{bucket_name}/{object_key} into {table}: {str(e)}", stack_info=True)
+            if raise_on_error:
+                raise e
+        finally:
+            if reader is not None:
+                reader.close()
             self.release_connection(conn)
 
+    def sync_incremental(self, table: str, watermark_column: str, sink: Callable[[List[dict]], Any],
+            key_column: Optional[str] = None, columns: Optional[List[str]] = None, page_size: Optional[int] = None,
+            sync_name: Optional[str] = None, state_table: str = 'wrenchcl_sync_state',
+            state_bucket: Optional[str] = None, state_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extracts only the rows that changed since the previous run, using a stored high-water mark per sync.
+
+        Rows past the mark are read with keyset paging ordered by `watermark_column` (and `key_column` as a tie
+        breaker) and handed to `sink` one page at a time. The mark is advanced only after `sink` returns, so a failed
+        write is retried from the last successfully written page on the next run.
+
+        Each advance is a compare-and-set against the mark this run last read or wrote, so two runs of the same sync
+        can never both advance it: the one that loses raises a ValueError instead of skipping or repeating rows.
+
+        The mark is kept either in a small state table (created once per gateway) or, when `state_bucket` is given, in
+        a JSON object in S3. The S3 mark is compared before it is replaced, which narrows but cannot fully close the
+        window between two concurrent runs. If `key_column` is omitted, `watermark_column` must be unique and
+        monotonically increasing.
+
+        :param table: The source table, optionally schema qualified.
+        :type table: str
+        :param watermark_column: The column that tracks changes, e.g. 'updated_at' or a serial id.
+        :type watermark_column: str
+        :param sink: Callable receiving each page as a list of dictionaries, e.g. a function writing an S3 snapshot.
+        :type sink: Callable[[List[dict]], Any]
+        :param key_column: A unique column used to break ties between rows sharing a watermark value.
+        :type key_column: str, optional
+        :param columns: The columns to extract. Defaults to all columns.
+        :type columns: List[str], optional
+        :param page_size: The number of rows per page. Defaults to the configured database batch size.
+        :type page_size: int, optional
+        :param sync_name: The name the mark is stored under. Defaults to the table name.
+        :type sync_name: str, optional
+        :param state_table: The table holding the marks when no `state_bucket` is given.
+        :type state_table: str
+        :param state_bucket: The S3 bucket holding the marks instead of a state table.
+        :type state_bucket: str, optional
+        :param state_key: The S3 key of the mark object. Defaults to 'wrenchcl/sync_state/<sync_name>.json'.
+        :type state_key: str, optional
+        :returns: A summary with the number of rows and pages extracted and the final mark.
+        :rtype: Dict[str, Any]
+        """
+        sync_name = sync_name or table
+        page_size = page_size or self.config.db_batch_size
+        state_key = state_key or f"wrenchcl/sync_state/{sync_name}.json"
+        state = dict(sync_name=sync_name, state_table=state_table, state_bucket=state_bucket, state_key=state_key)
+
+        watermark, watermark_key = stored = self._load_watermark(**state)
+        order_columns = [watermark_column] + ([key_column] if key_column else [])
+        order_by = sql.SQL(', ').join(map(sql.Identifier, order_columns))
+        select_list = sql.SQL('*') if not columns else sql.SQL(', ').join(
+            map(sql.Identifier, dict.fromkeys(columns + order_columns)))
+
+        summary = dict(rows=0, pages=0, watermark=watermark, watermark_key=watermark_key)
+        logger.debug(f"Starting incremental sync '{sync_name}' on {table} from mark: {watermark}, {watermark_key}")
+        while True:
+            if watermark is None:
+                where, payload = sql.SQL(''), ()
+            elif key_column:
+                where, payload = sql.SQL("WHERE ({}) > (%s, %s)").format(order_by), (watermark, watermark_key)
+            else:
+                where, payload = sql.SQL("WHERE {} > %s").format(order_by), (watermark,)
+            query = sql.SQL("SELECT {} FROM {} {} ORDER BY {} LIMIT %s").format(
+                select_list, sql.Identifier(*table.split('.')), where, order_by)
+
+            conn = self.get_connection()
+            try:
+                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                    cursor.execute(query, payload + (page_size,))
+                    rows = cursor.fetchall()
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self.release_connection(conn)
+
+            if not rows:
+                break
+
+            sink([dict(row) for row in rows])
+            watermark = rows[-1][watermark_column]
+            watermark_key = rows[-1][key_column] if key_column else None
+            stored = self._store_watermark(watermark, watermark_key, stored, **state)
+
+            summary['rows'] += len(rows)
+            summary['pages'] += 1
+            logger.debug(f"Sync '{sync_name}' page {summary['pages']} written, mark advanced to: {watermark}")
+            if len(rows) < page_size:
+                break
+
+        summary.update(watermark=watermark, watermark_key=watermark_key)
+        logger.debug(f"Incremental sync '{sync_name}' finished: {summary['rows']} rows in {summary['pages']} pages")
+        return summary
+
+    def _load_watermark(self, sync_name: str, state_table: str, state_bucket: Optional[str],
+            state_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Loads the stored high-water mark of a sync from S3 or the state table.
+
+        Only a missing mark counts as a first run; errors reading it are raised so a failing lookup never triggers a
+        full re-export.
+
+        :returns: The stored watermark and tie breaker key as strings, or (None, None) if the sync never ran.
+        """
+        if state_bucket:
+            s3_gateway = S3ServiceGateway()
+            if not s3_gateway.check_object_existence(state_bucket, state_key):
+                return None, None
+            state = json.loads(s3_gateway.get_object(state_bucket, state_key).getvalue())
+            return state.get('watermark'), state.get('watermark_key')
+
+        self._ensure_state_table(state_table)
+        rows = self.get_data(sql.SQL("SELECT watermark, watermark_key FROM {} WHERE sync_name = %s").format(
+            sql.Identifier(*state_table.split('.'))), (sync_name,), fetchall=True, return_dict=False,
+            raise_on_error=True)
+        return (rows[0][0], rows[0][1]) if rows else (None, None)
+
+    def _store_watermark(self, watermark: Any, watermark_key: Any, expected: Tuple[Optional[str], Optional[str]],
+            sync_name: str, state_table: str, state_bucket: Optional[str],
+            state_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Advances the stored high-water mark of a sync if it still holds the `expected` mark.
+
+        In the state table this is a single INSERT (on the first run) or UPDATE conditioned on the old mark, committed
+        on its own; in S3 the current mark is read and compared before it is replaced with a single PUT.
+
+        :returns: The stored mark as strings, to be passed as `expected` on the next advance.
+        :raises ValueError: If another run changed the mark since it was read.
+        """
+        new = (self._serialize_watermark(watermark), self._serialize_watermark(watermark_key))
+        if state_bucket:
+            if self._load_watermark(sync_name, state_table, state_bucket, state_key) != expected:
+                raise ValueError(f"The mark of sync '{sync_name}' was changed by another run.")
+            body = json.dumps(dict(sync_name=sync_name, watermark=new[0], watermark_key=new[1],
+                                   updated_at=datetime.now(timezone.utc).isoformat()))
+            S3ServiceGateway().s3_client.put_object(Bucket=state_bucket, Key=state_key, Body=body.encode('utf-8'))
+            return new
+
+        identifier = sql.Identifier(*state_table.split('.'))
+        if expected == (None, None):
+            query = sql.SQL("INSERT INTO {} (sync_name, watermark, watermark_key, updated_at) "
+                            "VALUES (%s, %s, %s, now()) ON CONFLICT (sync_name) DO NOTHING").format(identifier)
+            payload = (sync_name,) + new
+        else:
+            query = sql.SQL("UPDATE {} SET watermark = %s, watermark_key = %s, updated_at = now() "
+                            "WHERE sync_name = %s AND watermark IS NOT DISTINCT FROM %s "
+                            "AND watermark_key IS NOT DISTINCT FROM %s").format(identifier)
+            payload = new + (sync_name,) + expected
+
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(query, payload)
+                if cursor.rowcount != 1:
+                    raise ValueError(f"The mark of sync '{sync_name}' was changed by another run.")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.release_connection(conn)
+        return new
+
+    def _ensure_state_table(self, state_table: str) -> None:
+        """Creates the sync state table if this gateway has not done so yet."""
+        if state_table in self._state_tables:
+            return
+        self.update_database(sql.SQL(
+            "CREATE TABLE IF NOT EXISTS {} (sync_name TEXT PRIMARY KEY, watermark TEXT, watermark_key TEXT, "
+            "updated_at TIMESTAMPTZ NOT NULL DEFAULT now())").format(sql.Identifier(*state_table.split('.'))), ())
+        self._state_tables.add(state_table)
+
+    @staticmethod
+    def _serialize_watermark(value: Any) -> Optional[str]:
+        """Serializes a watermark value to text that Postgres casts back to the column type on comparison."""
+        if value is None:
+            return None
+        return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+    @staticmethod
+    def _jsonl_to_csv_chunks(lines: Iterable[bytes], columns: List[str], batch_size: int = 10000) -> Iterator[bytes]:
+        """
+        Converts JSONL lines into CSV encoded chunks for COPY, `batch_size` records at a time. Nested objects and lists
+        are serialized to JSON so they can be loaded into json/jsonb columns.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        for i, line in enumerate(lines, start=1):
+            record = json.loads(line)
+            writer.writerow([json.dumps(value) if isinstance(value, (dict, list)) else value
+                             for value in (record.get(col) for col in columns)])
+            if i % batch_size == 0:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    def get_table_schema(self, table: str, refresh: bool = False) -> Dict[str, str]:
+        """
+        Returns the column types of a table as reported by ``information_schema.columns``, in column order.
+
+        Results are cached per table for `schema_cache_ttl` seconds.
+
+        :param table: The table name, optionally schema qualified. Unqualified names resolve against current_schema().
+        :type table: str
+        :param refresh: Whether to bypass the cache and introspect the table again.
+        :type refresh: bool
+        :returns: A mapping of column name to Postgres data type (e.g. 'uuid', 'timestamp with time zone').
+        :rtype: Dict[str, str]
+        :raises ValueError: If the table does not exist.
+        """
+        with self._schema_lock:
+            cached = self._schema_cache.get(table)
+        if cached and not refresh and time.monotonic() - cached[0] < self.schema_cache_ttl:
+            return cached[1]
+
+        table_schema, _, table_name = table.rpartition('.')
+        rows = self.get_data(
+            "SELECT column_name, data_type, udt_name FROM information_schema.columns "
+            "WHERE table_schema = COALESCE(%s, current_schema()) AND table_name = %s ORDER BY ordinal_position",
+            (table_schema or None, table_name), return_dict=False, raise_on_error=True)
+        if not rows:
+            raise ValueError(f"Table {table} does not exist or has no visible columns")
+
+        schema = {row[0]: row[2] if row[1] == 'USER-DEFINED' else row[1] for row in rows}
+        with self._schema_lock:
+            self._schema_cache[table] = (time.monotonic(), schema)
+        logger.debug(f"Cached schema for {table}: {schema}")
+        return schema
+
+    def invalidate_schema_cache(self, table: Optional[str] = None) -> None:
+        """
+        Drops cached table schemas, e.g. after a migration.
+
+        :param table: The table to drop from the cache. If None, the whole cache is cleared, including the result
+                      column types cached by 'combined' query batches.
+        :type table: str, optional
+        """
+        with self._schema_lock:
+            if table is None:
+                self._schema_cache.clear()
+                self._result_descriptions.clear()
+            else:
+                self._schema_cache.pop(table, None)
+
+    @staticmethod
+    def _cast_dataframe_to_schema(df: DataFrame, schema: Dict[str, str], column_order: List[str]) -> DataFrame:
+        """
+        Casts the `column_order` columns of a DataFrame to the Python representation of their Postgres column types,
+        one vectorized step per column. Nulls become None. Numeric values are validated but keep their own type, so
+        Decimals and numeric strings reach Postgres without passing through a float.
+
+        :raises ValueError: If a column is missing from the payload or the table.
+        :raises TypeError: If a column cannot be cast to its Postgres type.
+        """
+        missing_columns = set(column_order) - set(df.columns)
+        if missing_columns:
+            raise ValueError(f"The following columns are missing from the payload: {missing_columns}")
+        unknown_columns = set(column_order) - set(schema)
+        if unknown_columns:
+            raise ValueError(f"The following columns do not exist in the target table: {unknown_columns}")
+
+        casted = {}
+        for col in column_order:
+            pg_type = schema[col]
+            series = df[col]
+            try:
+                if pg_type in ('smallint', 'integer', 'bigint'):
+                    series = pd.to_numeric(series).astype('Int64')
+                elif pg_type in ('real', 'double precision'):
+                    series = pd.to_numeric(series).astype('float64')
+                elif pg_type == 'numeric':
+                    pd.to_numeric(series)
+                elif pg_type == 'boolean':
+                    series = series.astype('boolean')
+                elif pg_type.startswith('timestamp'):
+                    series = pd.to_datetime(series)
+                    if pg_type == 'timestamp with time zone' and series.dt.tz is None:
+                        series = series.dt.tz_localize('UTC')
+                    elif pg_type == 'timestamp without time zone' and series.dt.tz is not None:
+                        series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+                elif pg_type == 'date':
+                    series = pd.to_datetime(series).dt.date
+                elif pg_type == 'uuid':
+                    series = _to_uuid_strings(series)
+                elif pg_type in ('json', 'jsonb'):
+                    nested = series.map(type).isin((dict, list))
+                    if nested.any():
+                        series = series.astype(object).mask(nested, series[nested].map(json.dumps))
+                elif pg_type in ('text', 'character varying', 'character'):
+                    series = series.astype('string')
+                elif pg_type == 'interval':
+                    series = pd.to_timedelta(series)
+            except Exception as e:
+                raise TypeError(f"Column '{col}' cannot be cast to Postgres type '{pg_type}': {e}") from e
+            casted[col] = series.astype(object).where(series.notna(), None)
+
+        return pd.DataFrame(casted, index=df.index)
+
     def format_sql_query(self, query: str, payload: tuple) -> None:
         """
         Formats and prints the SQL query with the given payload.
@@ -247,3 +810,159 @@ class RdsServiceGateway:
         else:
             # Return value as-is for basic types like int, float, bool, and None
             return value
+
+
+class QueryBatch:
+    """
+    Collects read queries for a single execution through :meth:`RdsServiceGateway.batch`. Results are returned in the
+    order the queries were added, as a list of dictionaries per query (or a single dictionary if `fetchall` is False).
+
+    Attributes:
+        results (list): The results of the last execution, one entry per query.
+    """
+
+    def __init__(self, gateway, mode: str = 'sequential', raise_on_error: bool = False):
+        """
+        Initializes an empty batch.
+
+        :param gateway: The RdsServiceGateway instance executing the batch.
+        :param mode: 'sequential' or 'combined'.
+        :type mode: str
+        :param raise_on_error: Whether to raise exceptions on errors instead of returning None results.
+        :type raise_on_error: bool
+        """
+        if mode not in ('sequential', 'combined'):
+            raise ValueError(f"Unsupported batch mode: {mode}. Use 'sequential' or 'combined'.")
+        self.gateway = gateway
+        self.mode = mode
+        self.raise_on_error = raise_on_error
+        self.results: List[Any] = []
+        self._queries: List[Tuple[str, Optional[tuple], bool]] = []
+
+    def add(self, query: str, payload: Optional[tuple] = None, fetchall: bool = True) -> 'QueryBatch':
+        """
+        Adds a read query to the batch.
+
+        :param query: The SELECT query to execute. Data modifying statements are not supported in 'combined' mode.
+        :type query: str
+        :param payload: The query parameters.
+        :type payload: tuple, optional
+        :param fetchall: Whether to return all rows or only the first one.
+        :type fetchall: bool
+        :returns: The batch itself, to allow chaining.
+        :rtype: QueryBatch
+        """
+        self._queries.append((query, payload, fetchall))
+        return self
+
+    def execute(self) -> List[Any]:
+        """
+        Executes all collected queries and returns their results in order.
+
+        :returns: One result per query; None for queries without rows or for all queries if the batch failed.
+        :rtype: List[Any]
+        """
+        if not self._queries:
+            self.results = []
+            return self.results
+
+        conn = self.gateway.get_connection()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                if self.mode == 'combined':
+                    raw_results = self._execute_combined(cursor)
+                else:
+                    raw_results = []
+                    for query, payload, _ in self._queries:
+                        cursor.execute(query, payload)
+                        raw_results.append([dict(row) for row in cursor.fetchall()])
+            conn.commit()
+            self.results = [rows if fetchall else (rows[0] if rows else None)
+                            for rows, (_, _, fetchall) in zip(raw_results, self._queries)]
+            logger.debug(f"Executed batch of {len(self._queries)} queries in {self.mode} mode")
+        except Exception as e:
+            conn.rollback()
+            if self.raise_on_error:
+                logger.error(f"Error executing query batch: {e}")
+                raise e
+            logger.debug(f"Query batch returned None: {e}")
+            self.results = [None] * len(self._queries)
+        finally:
+            self.gateway.release_connection(conn)
+        return self.results
+
+    def _execute_combined(self, cursor) -> List[List[dict]]:
+        """
+        Runs all queries as one SELECT with one JSON column per query, costing a single round trip once the result
+        columns of every query are known. Rows are aggregated as arrays of their text values in the order the query
+        returned them, and cast back with the typecasters psycopg2 applies to regular results.
+        """
+        subqueries = [cursor.mogrify(query, payload).decode('utf-8').strip().rstrip(';')
+                      for query, payload, _ in self._queries]
+        descriptions = self._describe(cursor, subqueries)
+        columns = []
+        for i, (subquery, description) in enumerate(zip(subqueries, descriptions)):
+            aliases = f"({', '.join(f'c{j}' for j in range(len(description)))})" if description else ''
+            values = ', '.join(f"c{j}::text" for j in range(len(description)))
+            columns.append(f"(SELECT coalesce(json_agg(ARRAY[{values}]::text[] ORDER BY n), '[]'::json) FROM "
+                           f"(SELECT row_number() OVER () AS n, * FROM ({subquery}) AS s{aliases}) AS q) AS r{i}")
+        cursor.execute("SELECT " + ", ".join(columns))
+        row = cursor.fetchone()
+
+        results = []
+        for i, description in enumerate(descriptions):
+            names = [name for name, _ in description]
+            casters = [self._typecaster(cursor, type_code) for _, type_code in description]
+            results.append([dict(zip(names, (value if value is None or caster is None else caster(value, cursor)
+                                             for caster, value in zip(casters, values))))
+                            for values in row[f"r{i}"]])
+        return results
+
+    def _describe(self, cursor, subqueries: List[str]) -> List[List[Tuple[str, int]]]:
+        """
+        Returns the column names and type OIDs of every query, probing the ones not cached yet together in a single
+        ``LIMIT 0`` statement, which plans the queries without running them.
+        """
+        cache = self.gateway._result_descriptions
+        keys = [self._shape(cursor, query, payload) for query, payload, _ in self._queries]
+        with self.gateway._schema_lock:
+            missing = [i for i, key in enumerate(keys) if key not in cache]
+        if missing:
+            marker = '_wrenchcl_batch_boundary'
+            cursor.execute("SELECT {} FROM {} LIMIT 0".format(
+                ", ".join(f"NULL AS {marker}, p{i}.*" for i in missing),
+                ", ".join(f"({subqueries[i]}) AS p{i}" for i in missing)))
+            probed = []
+            for column in cursor.description:
+                if column.name == marker:
+                    probed.append([])
+                else:
+                    probed[-1].append((column.name, column.type_code))
+            with self.gateway._schema_lock:
+                cache.update((keys[i], description) for i, description in zip(missing, probed))
+            logger.debug(f"Cached the result columns of {len(missing)} batched queries")
+        with self.gateway._schema_lock:
+            return [cache[key] for key in keys]
+
+    @staticmethod
+    def _shape(cursor, query: Any, payload: Any) -> Tuple[str, tuple]:
+        """The cache key of a query's result columns: its text and the types of its parameters."""
+        query = query if isinstance(query, str) else query.as_string(cursor)
+        if isinstance(payload, dict):
+            return query, tuple(sorted((name, type(value).__name__) for name, value in payload.items()))
+        return query, tuple(type(value).__name__ for value in payload or ())
+
+    @staticmethod
+    def _typecaster(cursor, type_code: int) -> Optional[Callable[[str, Any], Any]]:
+        """Finds the typecaster psycopg2 would apply to a column type, or None if values stay strings."""
+        for types in (cursor.string_types, cursor.connection.string_types, psycopg2.extensions.string_types):
+            if types and type_code in types:
+                return types[type_code]
+        return None
+
+    def __enter__(self) -> 'QueryBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
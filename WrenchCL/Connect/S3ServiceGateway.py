@@ -12,24 +12,88 @@
 # 
 #  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
 #
+import atexit
+import base64
 import binascii
 import io
-import base64
 import mimetypes
+import itertools
+import json
+import math
+import mmap
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Union, IO, Optional
-from io import BytesIO
+from typing import Union, IO, Optional, Iterator, Callable, Dict, Any, Iterable, List, NamedTuple, Tuple
 
+from boto3.s3.transfer import ProgressCallbackInvoker, TransferConfig, create_transfer_manager
 from botocore.config import Config
-from botocore.exceptions import ClientError
+from botocore.exceptions import (ClientError, ConnectionClosedError, EndpointConnectionError, IncompleteReadError,
+                                 NoCredentialsError, ReadTimeoutError, ResponseStreamingError)
 from botocore.response import StreamingBody
 import warnings
 
 # Assuming these are your custom modules
-from ..Decorators.Retryable import Retryable
+from ..Decorators.Retryable import Retryable, RetryBudget
 from ..Decorators.SingletonClass import SingletonClass
 from ..Tools import logger
 from .AwsClientHub import AwsClientHub
+from .._Internal._ChunkedStream import (_BufferReader, _ChunkedStreamReader, _b64decode_chunks, _compress_chunks,
+                                        _decompress_chunks, _detect_compression, _new_compressor,
+                                        DEFAULT_CHUNK_SIZE)
+from .._Internal._FileDigest import _DigestingReader, _StreamingDigest, _digest_file, _matches_etag
+from .._Internal._PresignedUrlSigner import _PresignedUrlSigner
+from .._Internal._S3Metrics import _S3Metrics
+from .._Internal._S3RangeReader import _S3RangeReader
+from .._Internal._S3ObjectCache import _S3ObjectCache
+from .._Internal._S3ObjectWriter import _S3ObjectWriter
+from .._Internal._TransferProgress import _KnownTransferSize, _TransferProgress
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    pd = None
+    PANDAS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+DELETE_OBJECTS_PAGE_SIZE = 1000
+MAX_SINGLE_COPY_SIZE = 5 * 1024 ** 3
+MULTIPART_COPY_THRESHOLD = 1024 ** 3
+DEFAULT_COPY_PART_SIZE = 256 * 1024 * 1024
+MAX_MULTIPART_PARTS = 10000
+CONTENT_HASH_METADATA = 'wrenchcl-sha256'
+COMPRESSION_METADATA = 'wrenchcl-compression'
+LIST_PAGE_COST = 4.0
+
+# Errors raised while reading a response body that are worth resuming from the last received byte
+_STREAM_RESUMABLE_ERRORS = (ResponseStreamingError, IncompleteReadError, ReadTimeoutError, ConnectionClosedError,
+                            EndpointConnectionError, ConnectionError)
+# upload_file decorates a fresh retry closure per call, so its attempts draw from one budget across calls
+_UPLOAD_RETRY_BUDGET = RetryBudget()
+
+
+class S3ObjectInfo(NamedTuple):
+    """Compact listing record of an S3 object."""
+    key: str
+    size: int
+    etag: str
+    last_modified: datetime
 
 
 @SingletonClass
@@ -39,14 +103,121 @@ class S3ServiceGateway:
     that a single instance is used throughout the application via the Singleton pattern.
     """
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None, transfer_config: Optional[TransferConfig] = None):
         """
         Initializes the S3ServiceGateway by setting up the S3 client using the AwsClientHub.
+
+        :param config: Optional botocore configuration for the S3 client.
+        :type config: Config, optional
+        :param transfer_config: Default multipart transfer settings for managed uploads and downloads.
+        :type transfer_config: TransferConfig, optional
         """
         client_manager = AwsClientHub()
         self.s3_client = client_manager.get_s3_client(config=config)
+        self.transfer_config = transfer_config or TransferConfig()
+        self.object_cache: Optional[_S3ObjectCache] = None
+        self.url_signer: Optional[_PresignedUrlSigner] = None
+        self.metrics = _S3Metrics()
+        self.metrics.attach(self.s3_client)
+        self._metrics_at_exit = False
         logger.debug("S3ServiceGateway initialized with S3 client.")
 
+    def get_metrics(self, reset: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Returns per-operation S3 statistics recorded by the gateway's client, keyed by operation name and bucket.
+
+        Each entry holds the call count, error codes, botocore retry attempts, bytes received and sent, total, mean
+        and max latency, estimated p50/p90/p99 latency and the latency histogram (bucket upper bounds in seconds).
+        Calls made by managed transfers are recorded under their underlying operations, e.g. UploadPart.
+
+        :param reset: Whether to start a new statistics window afterwards.
+        :type reset: bool
+        :returns: A nested dict of operation -> bucket -> statistics.
+        :rtype: Dict[str, Dict[str, Dict[str, Any]]]
+        """
+        return self.metrics.snapshot(reset=reset)
+
+    def log_metrics_summary(self, reset: bool = True) -> None:
+        """
+        Logs a summary of the S3 statistics, one line per operation and bucket ordered by total time.
+
+        Call this at the end of a Lambda handler to get a summary per invocation, since warm containers keep the
+        gateway (and its statistics) alive between invocations.
+
+        :param reset: Whether to start a new statistics window afterwards.
+        :type reset: bool
+        """
+        self.metrics.log_summary(reset=reset)
+
+    def log_metrics_at_exit(self) -> None:
+        """Logs the S3 statistics summary when the interpreter shuts down."""
+        if not self._metrics_at_exit:
+            atexit.register(self.metrics.log_summary)
+            self._metrics_at_exit = True
+
+    def enable_cache(self, directory: Optional[str] = None, max_bytes: int = 1024 ** 3,
+            max_age: float = 0.0) -> _S3ObjectCache:
+        """
+        Enables a read-through local disk cache for `get_object`, `download_object` and `get_cached_path`.
+
+        Cached objects are revalidated with a conditional GET (``If-None-Match``) on access, so unchanged objects cost
+        a single small request instead of a download. Entries are evicted least recently used first once the cache
+        exceeds `max_bytes`.
+
+        :param directory: The cache directory. Defaults to 'wrenchcl-s3-cache' in the system temp directory (/tmp on
+                          Lambda).
+        :type directory: str, optional
+        :param max_bytes: The size budget of the cache in bytes.
+        :type max_bytes: int
+        :param max_age: Seconds a cached object is served without revalidation. 0 revalidates on every access.
+        :type max_age: float
+        :returns: The enabled cache.
+        :rtype: _S3ObjectCache
+        """
+        directory = directory or os.path.join(tempfile.gettempdir(), 'wrenchcl-s3-cache')
+        self.object_cache = _S3ObjectCache(directory, max_bytes=max_bytes, max_age=max_age)
+        logger.debug(f"S3 object cache enabled in {directory} with a budget of {max_bytes} bytes")
+        return self.object_cache
+
+    def disable_cache(self, clear: bool = False) -> None:
+        """
+        Disables the local disk cache.
+
+        :param clear: Whether to delete the cached files as well.
+        :type clear: bool
+        """
+        if self.object_cache is not None and clear:
+            self.object_cache.clear()
+        self.object_cache = None
+
+    def set_transfer_config(self, multipart_threshold: Optional[int] = None, multipart_chunksize: Optional[int] = None,
+            max_concurrency: Optional[int] = None, use_threads: Optional[bool] = None) -> TransferConfig:
+        """
+        Updates the default multipart transfer settings of the gateway. Arguments left as None keep their value.
+
+        :param multipart_threshold: The size in bytes above which transfers switch to multipart.
+        :type multipart_threshold: int, optional
+        :param multipart_chunksize: The part size in bytes of multipart transfers.
+        :type multipart_chunksize: int, optional
+        :param max_concurrency: The maximum number of parts transferred concurrently.
+        :type max_concurrency: int, optional
+        :param use_threads: Whether transfers may use threads at all.
+        :type use_threads: bool, optional
+        :returns: The new default transfer configuration.
+        :rtype: TransferConfig
+        """
+        current = self.transfer_config
+        self.transfer_config = TransferConfig(
+            multipart_threshold=current.multipart_threshold if multipart_threshold is None else multipart_threshold,
+            multipart_chunksize=current.multipart_chunksize if multipart_chunksize is None else multipart_chunksize,
+            max_concurrency=current.max_request_concurrency if max_concurrency is None else max_concurrency,
+            use_threads=current.use_threads if use_threads is None else use_threads)
+        logger.debug(f"S3 transfer config updated: threshold={self.transfer_config.multipart_threshold}, "
+                     f"chunksize={self.transfer_config.multipart_chunksize}, "
+                     f"concurrency={self.transfer_config.max_request_concurrency}, "
+                     f"use_threads={self.transfer_config.use_threads}")
+        return self.transfer_config
+
     @staticmethod
     def _get_mime_extension(mime_type: str) -> str:
         """Get the file extension for a given MIME type."""
@@ -64,60 +235,278 @@ class S3ServiceGateway:
             object_key = str(Path(object_key).with_suffix(correct_extension))
         return object_key
 
-    @Retryable()
-    def upload_file(self, file: Union[str, Path, bytes, BytesIO, StreamingBody], bucket_name: str, object_key: str,
-            return_url: bool = False) -> Union[None, str]:
+    def upload_file(self, file: Union[str, Path, bytes, bytearray, memoryview, mmap.mmap, IO[bytes], StreamingBody],
+            bucket_name: str, object_key: str, return_url: bool = False,
+            transfer_config: Optional[TransferConfig] = None, progress_callback: Optional[Callable[[int], None]] = None,
+            log_progress: bool = False, encoding: Optional[str] = None,
+            compress: Optional[str] = None, checksum: Optional[str] = None,
+            metadata: Optional[Dict[str, str]] = None,
+            return_checksum: bool = False) -> Union[None, str, Tuple[str, str]]:
         """
-        Uploads a file to S3. Handles file paths, bytes, file-like objects, and StreamingBody.
+        Uploads a file to S3. The upload path is chosen by the type of `file`:
+
+        - ``Path``, or a ``str`` naming an existing file: a local file path, streamed from disk.
+        - ``bytes``, ``bytearray``, ``memoryview`` or ``mmap``: uploaded straight from the buffer without copying it.
+        - A binary file-like object or StreamingBody: streamed as it is read.
 
-        :param file: The file path, bytes, file-like object, or StreamingBody to be uploaded.
-        :type file: Union[str, Path, bytes, BytesIO, StreamingBody]
+        Pass ``encoding='base64'`` to upload the decoded content of a base64 payload, in which case `file` may also be
+        a base64 ``str`` and a ``Path`` names a file holding base64 text; decoding is streamed in chunks. A ``str`` that is neither a file path nor marked as base64 is
+        still uploaded as before, base64 decoded if it decodes and UTF-8 encoded otherwise, but this is deprecated.
+
+        Failed uploads are retried only when the source can be rewound, i.e. paths, buffers and seekable file-like
+        objects, which are sought back to where the upload started before every attempt. Non-seekable streams, such
+        as a StreamingBody or a base64 payload decoded on the fly, are uploaded in a single attempt, since a retry
+        after a partial read would store a truncated object.
+
+        With `compress`, the content is compressed while it is uploaded and tagged with ``Content-Encoding`` and
+        metadata, so the read methods of this gateway decompress it transparently.
+
+        With `checksum`, a digest of the uploaded bytes is computed while they stream, without reading the source
+        twice. SHA-256, CRC32 and CRC32C are also sent as S3 checksums, so S3 validates every request and stores the
+        checksum for verification on download (see :meth:`download_object`). The digest is returned only with
+        `return_checksum`.
+
+        :param file: The file path, bytes-like object, file-like object, or StreamingBody to be uploaded.
+        :type file: Union[str, Path, bytes, bytearray, memoryview, mmap.mmap, IO[bytes], StreamingBody]
         :param bucket_name: The name of the S3 bucket.
         :type bucket_name: str
         :param object_key: The key of the object in the S3 bucket.
         :type object_key: str
         :param return_url: Whether to return the S3 URL of the uploaded file.
         :type return_url: bool
-        :return: The S3 URL of the uploaded file if `return_url` is True, otherwise None.
-        :rtype: Union[None, str]
+        :param transfer_config: Multipart transfer settings for this call. Defaults to the gateway's transfer_config.
+        :type transfer_config: TransferConfig, optional
+        :param progress_callback: A callable receiving the number of bytes sent with every progress update.
+        :type progress_callback: Callable[[int], None], optional
+        :param log_progress: Whether to log progress and throughput while uploading.
+        :type log_progress: bool
+        :param encoding: 'base64' if `file` holds base64 encoded content, otherwise None.
+        :type encoding: str, optional
+        :param compress: 'gzip' or 'zstd' to compress the content on the fly, otherwise None.
+        :type compress: str, optional
+        :param checksum: 'md5', 'sha256', 'crc32' or 'crc32c' to compute a digest of the stored bytes.
+        :type checksum: str, optional
+        :param metadata: Optional user metadata of the object.
+        :type metadata: Dict[str, str], optional
+        :param return_checksum: Whether to return the `checksum` digest as well.
+        :type return_checksum: bool
+        :return: The S3 URL of the uploaded file if `return_url` is True, otherwise None. With `return_checksum`, the
+                 hex digest instead, or a tuple of URL and digest if `return_url` is True as well.
+        :rtype: Union[None, str, Tuple[str, str]]
         """
-        if isinstance(file, (str, Path)) and Path(file).is_file():
-            file_path = Path(file)
-            if file_path.stat().st_size == 0:
-                raise ValueError("The file is empty.")
-            logger.debug(f"Uploading file from path: {file_path} to bucket: {bucket_name} as object: {object_key}")
-            with open(file_path, 'rb') as f:
-                self.s3_client.upload_fileobj(f, bucket_name, object_key)
-        elif isinstance(file, bytes) or (isinstance(file, str) and not Path(file).is_file()):
-            # Handle base64 encoded strings
+        if encoding not in (None, 'base64'):
+            raise ValueError(f"Unsupported encoding: {encoding}. Only 'base64' is supported.")
+        if compress is not None:
+            _new_compressor(compress)  # Fails fast on unknown codecs or a missing zstandard package
+        if checksum is not None:
+            _StreamingDigest(checksum)  # Fails fast on unknown algorithms
+        elif return_checksum:
+            raise ValueError("return_checksum requires a checksum algorithm.")
+        upload_args = dict(Config=transfer_config or self.transfer_config)
+        if metadata:
+            upload_args['ExtraArgs'] = {'Metadata': dict(metadata)}
+
+        source, size, owned = self._open_upload_source(file, encoding)
+        try:
+            logger.debug(f"Uploading {type(file).__name__} to bucket: {bucket_name} as object: {object_key}")
+            if getattr(source, 'seekable', lambda: False)():
+                start = source.tell()
+
+                @Retryable(retry_budget=_UPLOAD_RETRY_BUDGET)
+                def attempt():
+                    source.seek(start)
+                    return self._upload_stream(source, size, bucket_name, object_key, upload_args, compress, checksum,
+                                               progress_callback, log_progress)
+
+                digest = attempt()
+            else:
+                logger.debug(f"Uploading non-seekable {type(file).__name__} to {object_key} without retries")
+                digest = self._upload_stream(source, size, bucket_name, object_key, upload_args, compress, checksum,
+                                             progress_callback, log_progress)
+        finally:
+            if owned:
+                source.close()
+        logger.debug(f"File uploaded to bucket: {bucket_name} as object: {object_key}")
+
+        s3_url = f"https://{bucket_name}.s3.amazonaws.com/{object_key}" if return_url else None
+        if return_checksum:
+            return (s3_url, digest) if return_url else digest
+        return s3_url
+
+    def _upload_stream(self, source: IO[bytes], size: Optional[int], bucket_name: str, object_key: str,
+                       upload_args: Dict[str, Any], compress: Optional[str], checksum: Optional[str],
+                       progress_callback: Optional[Callable[[int], None]], log_progress: bool) -> Optional[str]:
+        """
+        Runs one upload attempt of `source` from its current position. Compression, digest and progress state are
+        created per attempt, so a retried attempt starts from scratch.
+
+        :returns: The hex digest of the stored bytes if `checksum` is given, otherwise None.
+        """
+        upload_args = dict(upload_args)
+        extra_args = {key: dict(value) if isinstance(value, dict) else value
+                      for key, value in upload_args.pop('ExtraArgs', {}).items()}
+        stream = source
+        compression_stats = {}
+        if compress is not None:
+            stream = _ChunkedStreamReader(_compress_chunks(iter(lambda: source.read(DEFAULT_CHUNK_SIZE), b''), compress,
+                                                           stats=compression_stats))
+            size = None
+            extra_args['ContentEncoding'] = compress
+            extra_args.setdefault('Metadata', {})[COMPRESSION_METADATA] = compress
+        digest = _StreamingDigest(checksum) if checksum is not None else None
+        if digest is not None:
+            stream = _DigestingReader(stream, digest)
+            if digest.s3_algorithm is not None:
+                extra_args['ChecksumAlgorithm'] = digest.s3_algorithm
+        if extra_args:
+            upload_args['ExtraArgs'] = extra_args
+        progress = None
+        if progress_callback is not None or log_progress:
+            progress = _TransferProgress(f"s3://{bucket_name}/{object_key}", total_bytes=size,
+                                         callback=progress_callback, log_interval=5.0 if log_progress else None)
+            upload_args['Callback'] = progress
+
+        self.s3_client.upload_fileobj(stream, bucket_name, object_key, **upload_args)
+        if compress is not None:
+            self._log_compression('Compressed', object_key, compress, compression_stats)
+        if progress is not None:
+            progress.finish()
+        if digest is None:
+            return None
+        if not stream.complete:
+            raise ValueError(f"The {checksum} checksum of {object_key} could not be computed in a single pass.")
+        logger.debug(f"Uploaded {object_key} with {checksum} {digest.hexdigest()}")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _open_upload_source(file: Any, encoding: Optional[str]) -> Tuple[IO[bytes], Optional[int], bool]:
+        """
+        Turns an upload payload into a readable stream without copying buffers.
+
+        :returns: The stream, the number of bytes it will produce if known, and whether the caller must close it.
+        """
+        if isinstance(file, str) and encoding is None and not os.path.isfile(file):
+            warnings.warn("Uploading str content is deprecated. Pass bytes, or encoding='base64' for base64 content.",
+                          DeprecationWarning, stacklevel=3)
             try:
-                file_content = base64.b64decode(file) if isinstance(file, str) else file
+                content = base64.b64decode(file)
             except binascii.Error:
-                file_content = file.encode('utf-8') if isinstance(file, str) else file
+                content = file.encode('utf-8')
+            if not content:
+                raise ValueError("The byte content is empty.")
+            reader = _BufferReader(content)
+            return reader, len(reader), True
+
+        if isinstance(file, Path) and encoding == 'base64':
+            if os.path.getsize(file) == 0:
+                raise ValueError("The file is empty.")
 
-            if len(file_content) == 0:
+            def file_chunks():
+                with open(file, 'rb') as f:
+                    yield from iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b'')
+
+            return _ChunkedStreamReader(_b64decode_chunks(file_chunks())), None, True
+
+        if isinstance(file, Path) or (isinstance(file, str) and encoding is None):
+            stream = open(file, 'rb')
+            size = os.fstat(stream.fileno()).st_size
+            if size == 0:
+                stream.close()
+                raise ValueError("The file is empty.")
+            return stream, size, True
+
+        if isinstance(file, (str, bytes, bytearray, memoryview, mmap.mmap)):
+            if isinstance(file, str):
+                if not file:
+                    raise ValueError("The byte content is empty.")
+                chunks = (file[i:i + DEFAULT_CHUNK_SIZE].encode('ascii')
+                          for i in range(0, len(file), DEFAULT_CHUNK_SIZE))
+                return _ChunkedStreamReader(_b64decode_chunks(chunks)), None, True
+            view = memoryview(file).cast('B')
+            if view.nbytes == 0:
                 raise ValueError("The byte content is empty.")
+            if encoding == 'base64':
+                chunks = (view[i:i + DEFAULT_CHUNK_SIZE] for i in range(0, view.nbytes, DEFAULT_CHUNK_SIZE))
+                return _ChunkedStreamReader(_b64decode_chunks(chunks)), None, True
+            reader = _BufferReader(view)
+            return reader, len(reader), True
 
-            file_obj = BytesIO(file_content)
-            logger.debug(f"Uploading bytes object to bucket: {bucket_name} as object: {object_key}")
-            self.s3_client.upload_fileobj(file_obj, bucket_name, object_key)
-        elif hasattr(file, 'read') and callable(file.read):
-            if file.seek(0, 2) == 0:  # Move to the end of the file and check the position
-                raise ValueError("The file-like object is empty.")
-            file.seek(0)  # Move back to the beginning of the file
-            logger.debug(f"Uploading file-like object to bucket: {bucket_name} as object: {object_key}")
-            self.s3_client.upload_fileobj(file, bucket_name, object_key)
-        else:
-            raise ValueError("The file parameter must be a file path, bytes, file-like object, or StreamingBody.")
+        if hasattr(file, 'read') and callable(file.read):
+            size = None
+            if getattr(file, 'seekable', lambda: False)():
+                size = file.seek(0, 2)  # Move to the end of the file and check the position
+                if size == 0:
+                    raise ValueError("The file-like object is empty.")
+                file.seek(0)  # Move back to the beginning of the file
+            if encoding == 'base64':
+                def chunks():
+                    while True:
+                        chunk = file.read(DEFAULT_CHUNK_SIZE)
+                        if not chunk:
+                            return
+                        yield chunk.encode('ascii') if isinstance(chunk, str) else chunk
 
-        logger.debug(f"File uploaded to bucket: {bucket_name} as object: {object_key}")
+                return _ChunkedStreamReader(_b64decode_chunks(chunks())), None, True
+            return file, size, False
+
+        raise ValueError("The file parameter must be a file path, bytes-like object, file-like object, or "
+                         "StreamingBody.")
+
+    def open_writer(self, bucket_name: str, object_key: str, part_size: int = DEFAULT_PART_SIZE,
+            max_in_flight: int = 4, content_type: Optional[str] = None,
+            metadata: Optional[Dict[str, str]] = None) -> _S3ObjectWriter:
+        """
+        Opens a writable, context-managed binary stream into an S3 object, for producing large objects without
+        building them in memory or on disk.
+
+        Full parts are uploaded in the background while the producer keeps writing, so memory is bounded by roughly
+        `part_size` times `max_in_flight` + 1. Closing the writer completes the object. An exception inside the ``with``
+        block aborts the multipart upload instead, so a partial object is never published.
+
+        **Example**::
+
+            >>> with S3ServiceGateway().open_writer('bucket', 'exports/events.jsonl') as writer:
+            ...     for event in events():
+            ...         writer.write(json.dumps(event).encode() + b'\\n')
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param part_size: The size of each uploaded part in bytes, at least 5 MiB. Objects can grow to 10,000 parts.
+        :type part_size: int
+        :param max_in_flight: The maximum number of parts uploading concurrently.
+        :type max_in_flight: int
+        :param content_type: Optional Content-Type of the object.
+        :type content_type: str, optional
+        :param metadata: Optional user metadata of the object.
+        :type metadata: Dict[str, str], optional
+        :returns: A writable file-like object.
+        :rtype: _S3ObjectWriter
+        """
+        extra_args = {}
+        if content_type:
+            extra_args['ContentType'] = content_type
+        if metadata:
+            extra_args['Metadata'] = metadata
+        logger.debug(f"Opening writer for object: {object_key} in bucket: {bucket_name}")
+        return _S3ObjectWriter(self.s3_client, bucket_name, object_key, part_size, max_in_flight, extra_args)
+
+    @staticmethod
+    def _log_compression(action: str, object_key: str, compression: str, stats: Dict[str, Any]) -> None:
+        """Logs the compression ratio and CPU time of a streamed (de)compression."""
+        uncompressed, compressed = (stats['bytes_in'], stats['bytes_out']) if action == 'Compressed' else \
+            (stats['bytes_out'], stats['bytes_in'])
+        logger.debug(f"{action} {object_key} with {compression}: {uncompressed} -> {compressed} bytes "
+                     f"(ratio {uncompressed / max(compressed, 1):.2f}) in {stats['cpu_seconds']:.3f}s CPU")
 
-        if return_url:
-            s3_url = f"https://{bucket_name}.s3.amazonaws.com/{object_key}"
-            return s3_url
+    @staticmethod
+    def _object_compression(response: dict) -> Optional[str]:
+        """Returns the codec an object was compressed with by :meth:`upload_file`, or None."""
+        return response.get('Metadata', {}).get(COMPRESSION_METADATA)
 
     @Retryable()
-    def get_object(self, bucket_name: str, object_key: str) -> io.BytesIO:
+    def get_object(self, bucket_name: str, object_key: str, decompress: bool = True) -> io.BytesIO:
         """
         Retrieves an object from S3 and returns its content as a file stream.
 
@@ -125,19 +514,316 @@ class S3ServiceGateway:
         :type bucket_name: str
         :param object_key: The key of the object in the S3 bucket.
         :type object_key: str
+        :param decompress: Whether to decompress objects uploaded with `compress`.
+        :type decompress: bool
         :returns: The content of the object as a BytesIO stream.
         :rtype: io.BytesIO
         """
         logger.debug(f"Attempting to retrieve object: {object_key} from bucket: {bucket_name}")
+        if self.object_cache is not None and decompress:
+            with self._open_cached(bucket_name, object_key) as f:
+                return io.BytesIO(f.read())
         obj = self.s3_client.get_object(Bucket=bucket_name, Key=object_key)
-        file_stream = io.BytesIO(obj['Body'].read())
+        compression = self._object_compression(obj) if decompress else None
+        if compression is None:
+            file_stream = io.BytesIO(obj['Body'].read())
+        else:
+            stats = {}
+            file_stream = io.BytesIO()
+            for chunk in _decompress_chunks(obj['Body'].iter_chunks(DEFAULT_CHUNK_SIZE), compression, stats=stats):
+                file_stream.write(chunk)
+            file_stream.seek(0)
+            self._log_compression('Decompressed', object_key, compression, stats)
         logger.debug(f"Object retrieved: {object_key} from bucket: {bucket_name}")
         return file_stream
 
+    def get_cached_path(self, bucket_name: str, object_key: str) -> str:
+        """
+        Returns the path of a local copy of an object, served from the disk cache and refreshed only if its ETag
+        changed. Requires :meth:`enable_cache`.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :returns: The path of the cached file, holding decompressed content for objects uploaded with `compress`.
+                  Treat it as read-only.
+        :rtype: str
+        """
+        if self.object_cache is None:
+            raise ValueError("The object cache is not enabled, call enable_cache() first.")
+        return self.object_cache.get_path(bucket_name, object_key,
+                                          lambda etag, path: self._fetch_if_modified(bucket_name, object_key, etag,
+                                                                                     path))
+
+    def _open_cached(self, bucket_name: str, object_key: str) -> IO[bytes]:
+        """Opens the cached copy of an object with a handle that survives concurrent eviction."""
+        if self.object_cache is None:
+            raise ValueError("The object cache is not enabled, call enable_cache() first.")
+        return self.object_cache.open_object(bucket_name, object_key,
+                                             lambda etag, path: self._fetch_if_modified(bucket_name, object_key,
+                                                                                        etag, path))
+
+    def open_cached_object(self, bucket_name: str, object_key: str) -> Union[mmap.mmap, bytes]:
+        """
+        Memory-maps the cached copy of an object for zero-copy reads. Requires :meth:`enable_cache`.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :returns: A read-only memory map of the object, or empty bytes for an empty object. Close the map when done.
+        :rtype: Union[mmap.mmap, bytes]
+        """
+        with self._open_cached(bucket_name, object_key) as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @Retryable()
+    def _fetch_if_modified(self, bucket_name: str, object_key: str, etag: Optional[str], path: str) -> Optional[str]:
+        """Writes the object to `path` and returns its ETag, or returns None if it still matches `etag`."""
+        request = dict(Bucket=bucket_name, Key=object_key)
+        if etag:
+            request['IfNoneMatch'] = etag
+        try:
+            obj = self.s3_client.get_object(**request)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('304', 'NotModified'):
+                return None
+            raise
+        with open(path, 'wb') as f:
+            for chunk in _decompress_chunks(obj['Body'].iter_chunks(DEFAULT_CHUNK_SIZE),
+                                            self._object_compression(obj)):
+                f.write(chunk)
+        return obj['ETag']
+
+    def iter_object(self, bucket_name: str, object_key: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+            max_retries: int = 5, decompress: bool = True) -> Iterator[bytes]:
+        """
+        Streams an object from S3 as a generator of byte chunks, holding at most one chunk in memory.
+
+        If the connection drops mid-stream, the download resumes from the last received byte with a ranged GET. The
+        resumed request is pinned to the original ETag, so an object that is overwritten mid-stream raises instead of
+        yielding mixed content. Objects uploaded with `compress` are decompressed on the fly.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param chunk_size: The maximum number of bytes per chunk.
+        :type chunk_size: int
+        :param max_retries: The number of consecutive resume attempts before giving up.
+        :type max_retries: int
+        :param decompress: Whether to decompress objects uploaded with `compress`.
+        :type decompress: bool
+        :returns: An iterator over the object's bytes.
+        :rtype: Iterator[bytes]
+        """
+        logger.debug(f"Streaming object: {object_key} from bucket: {bucket_name}")
+        first_response = {}
+        raw_chunks = self._iter_object_raw(bucket_name, object_key, chunk_size, max_retries, first_response)
+        try:
+            first = next(raw_chunks, None)
+            if first is None:
+                return
+            chunks = itertools.chain([first], raw_chunks)
+            compression = self._object_compression(first_response) if decompress else None
+            if compression is None:
+                yield from chunks
+                return
+            stats = {}
+            yield from _decompress_chunks(chunks, compression, stats=stats)
+            self._log_compression('Decompressed', object_key, compression, stats)
+        finally:
+            raw_chunks.close()
+
+    def _iter_object_raw(self, bucket_name: str, object_key: str, chunk_size: int, max_retries: int,
+            first_response: dict) -> Iterator[bytes]:
+        """Streams the stored bytes of an object with resume support, recording the metadata of the first GET."""
+        offset = 0
+        attempt = 0
+        etag = None
+        while True:
+            request = dict(Bucket=bucket_name, Key=object_key)
+            if etag is not None:
+                request.update(Range=f"bytes={offset}-", IfMatch=etag)
+            body = None
+            try:
+                obj = self.s3_client.get_object(**request)
+                if etag is None:
+                    first_response['Metadata'] = obj.get('Metadata', {})
+                    first_response['ETag'] = obj.get('ETag')
+                    first_response['ContentEncoding'] = obj.get('ContentEncoding')
+                etag = etag or obj.get('ETag')
+                body = obj['Body']
+                for chunk in body.iter_chunks(chunk_size):
+                    offset += len(chunk)
+                    attempt = 0
+                    yield chunk
+                logger.debug(f"Object streamed: {object_key} from bucket: {bucket_name}, {offset} bytes")
+                return
+            except _STREAM_RESUMABLE_ERRORS as e:
+                attempt += 1
+                if attempt > max_retries:
+                    logger.error(f"Streaming {object_key} failed after {max_retries} resume attempts: {e}")
+                    raise
+                logger.warning(f"Stream of {object_key} interrupted at byte {offset}, resuming "
+                               f"({attempt}/{max_retries}): {e}")
+                time.sleep(min(0.2 * 2 ** attempt, 10))
+            finally:
+                if body is not None:
+                    body.close()
+
+    def open_object(self, bucket_name: str, object_key: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+            max_retries: int = 5, decompress: bool = True) -> _ChunkedStreamReader:
+        """
+        Opens an object in S3 as a readable, context-managed binary stream with constant memory use.
+
+        The stream supports ``read``/``readline`` and yields lines when iterated, which suits JSONL and CSV objects.
+        It can be wrapped in ``io.TextIOWrapper`` or passed to readers such as ``pandas.read_csv``. Dropped
+        connections are resumed and compressed objects are decompressed as described in :meth:`iter_object`.
+
+        **Example**::
+
+            >>> with S3ServiceGateway().open_object('bucket', 'events.jsonl') as stream:
+            ...     for line in stream:
+            ...         process(json.loads(line))
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param chunk_size: The number of bytes fetched from S3 per read.
+        :type chunk_size: int
+        :param max_retries: The number of consecutive resume attempts before giving up.
+        :type max_retries: int
+        :param decompress: Whether to decompress objects uploaded with `compress`.
+        :type decompress: bool
+        :returns: A file-like stream over the object's content.
+        :rtype: _ChunkedStreamReader
+        """
+        return _ChunkedStreamReader(self.iter_object(bucket_name, object_key, chunk_size=chunk_size,
+                                                     max_retries=max_retries, decompress=decompress))
+
+    def read_table(self, bucket_name: str, object_key: str, file_format: Optional[str] = None,
+            chunksize: int = 100_000, columns: Optional[List[str]] = None, row_groups: Optional[List[int]] = None,
+            output: str = 'pandas', **reader_kwargs) -> Iterator[Any]:
+        """
+        Reads a CSV, JSONL or Parquet object in chunks, yielding pandas DataFrames or Arrow record batches.
+
+        CSV and JSONL objects are streamed and decompressed on the fly (gzip, bz2 and zstd, detected from the
+        compression metadata, Content-Encoding or key suffix), so at most one chunk of rows is materialized at a
+        time. Parquet objects are read with ranged GETs: the footer first, and then only the column chunks of the
+        selected `columns` and `row_groups`. Projecting a few columns out of hundreds therefore downloads only those.
+
+        **Example**::
+
+            >>> for frame in S3ServiceGateway().read_table('bucket', 'events.parquet', columns=['id', 'ts']):
+            ...     process(frame)
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param file_format: 'csv', 'jsonl' or 'parquet'. Inferred from the key suffix if None.
+        :type file_format: str, optional
+        :param chunksize: The number of rows per yielded chunk.
+        :type chunksize: int
+        :param columns: The columns to read. Defaults to all columns.
+        :type columns: List[str], optional
+        :param row_groups: The Parquet row groups to read. Defaults to all row groups.
+        :type row_groups: List[int], optional
+        :param output: 'pandas' to yield DataFrames or 'arrow' to yield pyarrow RecordBatches.
+        :type output: str
+        :param reader_kwargs: Extra keyword arguments for ``pandas.read_csv`` or ``pandas.read_json``.
+        :returns: An iterator of DataFrames or RecordBatches.
+        :rtype: Iterator[Union[DataFrame, RecordBatch]]
+        """
+        file_format = file_format or self._detect_table_format(object_key)
+        if output not in ('pandas', 'arrow'):
+            raise ValueError(f"Unsupported output: {output}. Use 'pandas' or 'arrow'.")
+        if (file_format == 'parquet' or output == 'arrow') and not PYARROW_AVAILABLE:
+            raise ImportError("The 'pyarrow' package is required for Parquet and Arrow output.")
+        if output == 'pandas' and not PANDAS_AVAILABLE:
+            raise ImportError("The 'pandas' package is required for DataFrame output.")
+
+        if file_format == 'parquet':
+            yield from self._read_parquet(bucket_name, object_key, chunksize, columns, row_groups, output)
+            return
+        if file_format not in ('csv', 'jsonl'):
+            raise ValueError(f"Unsupported file format: {file_format}. Use 'csv', 'jsonl' or 'parquet'.")
+        if not PANDAS_AVAILABLE:
+            raise ImportError("The 'pandas' package is required for CSV and JSONL objects.")
+
+        logger.debug(f"Reading {file_format} object: {object_key} from bucket: {bucket_name} "
+                     f"in chunks of {chunksize} rows")
+        with _ChunkedStreamReader(self._iter_table_bytes(bucket_name, object_key)) as stream:
+            if file_format == 'csv':
+                reader = pd.read_csv(stream, chunksize=chunksize, usecols=columns, **reader_kwargs)
+            else:
+                reader = pd.read_json(stream, lines=True, chunksize=chunksize, **reader_kwargs)
+            with reader:
+                for frame in reader:
+                    if columns is not None and file_format == 'jsonl':
+                        frame = frame[columns]
+                    yield frame if output == 'pandas' else pa.RecordBatch.from_pandas(frame, preserve_index=False)
+
+    @staticmethod
+    def _detect_table_format(object_key: str) -> str:
+        """Infers the table format from the key suffix, ignoring a trailing compression suffix."""
+        name = object_key.lower()
+        if _detect_compression(name):
+            name = name.rsplit('.', 1)[0]
+        table_suffixes = {'csv': ('.csv', '.tsv', '.txt'), 'jsonl': ('.jsonl', '.ndjson', '.json'),
+                          'parquet': ('.parquet', '.pq')}
+        for file_format, suffixes in table_suffixes.items():
+            if name.endswith(suffixes):
+                return file_format
+        raise ValueError(f"Cannot infer the table format of {object_key}; pass file_format='csv', 'jsonl' or 'parquet'.")
+
+    def _iter_table_bytes(self, bucket_name: str, object_key: str) -> Iterator[bytes]:
+        """Streams an object's content, decompressing it by metadata, Content-Encoding or key suffix."""
+        first_response = {}
+        raw_chunks = self._iter_object_raw(bucket_name, object_key, DEFAULT_CHUNK_SIZE, 5, first_response)
+        try:
+            first = next(raw_chunks, None)
+            if first is None:
+                return
+            compression = self._object_compression(first_response) or \
+                _detect_compression(object_key, first_response.get('ContentEncoding'))
+            yield from _decompress_chunks(itertools.chain([first], raw_chunks), compression)
+        finally:
+            raw_chunks.close()
+
+    def _read_parquet(self, bucket_name: str, object_key: str, chunksize: int, columns: Optional[List[str]],
+            row_groups: Optional[List[int]], output: str) -> Iterator[Any]:
+        """Yields batches of a Parquet object, fetching only the footer and the selected column chunks."""
+        with _S3RangeReader(self.s3_client, bucket_name, object_key) as reader:
+            parquet_file = pq.ParquetFile(reader)
+            logger.debug(f"Reading parquet object: {object_key} from bucket: {bucket_name} with "
+                         f"{parquet_file.metadata.num_row_groups} row groups and "
+                         f"{parquet_file.metadata.num_columns} columns")
+            for batch in parquet_file.iter_batches(batch_size=chunksize, row_groups=row_groups, columns=columns,
+                                                   use_threads=False):
+                yield batch if output == 'arrow' else batch.to_pandas()
+            logger.debug(f"Read parquet object: {object_key}, fetched {reader.bytes_fetched} of {reader.size} bytes "
+                         f"in {reader.requests} requests")
+
     @Retryable()
-    def download_object(self, bucket_name: str, object_key: str, local_path: str) -> None:
+    def download_object(self, bucket_name: str, object_key: str, local_path: str,
+            transfer_config: Optional[TransferConfig] = None,
+            progress_callback: Optional[Callable[[int], None]] = None, log_progress: bool = False,
+            decompress: bool = True, checksum: Optional[str] = None) -> Optional[str]:
         """
-        Downloads an object from S3 to a local file.
+        Downloads an object from S3 to a local file. Objects uploaded with `compress` are decompressed while they are
+        streamed to disk. The compression is read from the HEAD the managed transfer needs for the object size, so
+        detecting it costs no extra request.
+
+        With `checksum`, the object is streamed sequentially and a digest of its stored bytes is computed on the way.
+        The digest is verified against the full-object S3 checksum, the SHA-256 stored by :meth:`sync_up`, or the
+        ETag for MD5, whichever is available. A mismatch removes the file and raises ValueError. Composite checksums
+        of multipart uploads cannot be compared to a full-object digest and were already validated per part by S3.
 
         :param bucket_name: The name of the S3 bucket.
         :type bucket_name: str
@@ -145,12 +831,200 @@ class S3ServiceGateway:
         :type object_key: str
         :param local_path: The local path where the object will be saved.
         :type local_path: str
+        :param transfer_config: Multipart transfer settings for this call. Defaults to the gateway's transfer_config.
+        :type transfer_config: TransferConfig, optional
+        :param progress_callback: A callable receiving the number of bytes received with every progress update.
+        :type progress_callback: Callable[[int], None], optional
+        :param log_progress: Whether to log progress and throughput while downloading.
+        :type log_progress: bool
+        :param decompress: Whether to decompress objects uploaded with `compress`.
+        :type decompress: bool
+        :param checksum: 'md5', 'sha256', 'crc32' or 'crc32c' to compute and verify a digest of the stored bytes.
+        :type checksum: str, optional
+        :returns: The hex digest if `checksum` is given, otherwise None.
+        :rtype: Optional[str]
         """
         logger.debug(f"Downloading object: {object_key} from bucket: {bucket_name} to {local_path}")
-        with open(local_path, 'wb') as f:
-            self.s3_client.download_fileobj(bucket_name, object_key, f)
+        if checksum is not None:
+            return self._download_with_checksum(bucket_name, object_key, local_path, _StreamingDigest(checksum),
+                                                decompress)
+        if self.object_cache is not None and decompress:
+            with self._open_cached(bucket_name, object_key) as source, open(local_path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+            logger.debug(f"Object copied from cache: {object_key} to {local_path}")
+            return
+        # The managed transfer sends a HEAD for the size anyway; sending it here instead also reveals the compression.
+        headers = self.get_object_headers(bucket_name, object_key) if decompress else None
+        if headers is not None and self._object_compression(headers):
+            with open(local_path, 'wb') as f:
+                for chunk in self.iter_object(bucket_name, object_key):
+                    f.write(chunk)
+            logger.debug(f"Object downloaded and decompressed: {object_key} to {local_path}")
+            return
+        subscribers = [] if headers is None else [_KnownTransferSize(headers['ContentLength'])]
+        progress = None
+        if progress_callback is not None or log_progress:
+            progress = _TransferProgress(f"s3://{bucket_name}/{object_key}",
+                                         total_bytes=headers['ContentLength'] if headers else None,
+                                         callback=progress_callback, log_interval=5.0 if log_progress else None)
+            subscribers.append(ProgressCallbackInvoker(progress))
+        with open(local_path, 'wb') as f, \
+                create_transfer_manager(self.s3_client, transfer_config or self.transfer_config) as manager:
+            manager.download(bucket_name, object_key, f, subscribers=subscribers).result()
+        if progress is not None:
+            progress.finish()
         logger.debug(f"Object downloaded: {object_key} to {local_path}")
 
+    def _download_with_checksum(self, bucket_name: str, object_key: str, local_path: str, digest: _StreamingDigest,
+            decompress: bool) -> str:
+        """Streams an object to disk while digesting its stored bytes, then verifies the digest."""
+        headers = self.s3_client.head_object(Bucket=bucket_name, Key=object_key, ChecksumMode='ENABLED')
+        first_response = {}
+        raw_chunks = self._iter_object_raw(bucket_name, object_key, DEFAULT_CHUNK_SIZE, 5, first_response)
+
+        def digested() -> Iterator[bytes]:
+            for chunk in raw_chunks:
+                digest.update(chunk)
+                yield chunk
+
+        compression = self._object_compression(headers) if decompress else None
+        try:
+            with open(local_path, 'wb') as f:
+                for chunk in _decompress_chunks(digested(), compression):
+                    f.write(chunk)
+            if first_response.get('ETag', headers['ETag']) != headers['ETag']:
+                raise ValueError(f"The object {object_key} changed while it was downloaded.")
+            expected = self._reference_digest(headers, digest.algorithm)
+            if expected is not None and expected != digest.hexdigest():
+                raise ValueError(f"The {digest.algorithm} checksum of {object_key} does not match: expected "
+                                 f"{expected}, got {digest.hexdigest()}")
+        except Exception:
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            raise
+        if expected is None:
+            logger.debug(f"No full-object {digest.algorithm} reference for {object_key}, digest not verified")
+        logger.debug(f"Object downloaded: {object_key} to {local_path} with {digest.algorithm} {digest.hexdigest()}")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _reference_digest(headers: dict, algorithm: str) -> Optional[str]:
+        """Finds a full-object hex digest to verify a download against, or None if S3 has none for the algorithm."""
+        stored = headers.get(f"Checksum{algorithm.upper()}")
+        if stored and '-' not in stored:
+            return base64.b64decode(stored).hex()
+        if algorithm == 'sha256' and headers.get('Metadata', {}).get(CONTENT_HASH_METADATA):
+            return headers['Metadata'][CONTENT_HASH_METADATA]
+        etag = headers.get('ETag', '').strip('"')
+        if algorithm == 'md5' and '-' not in etag and headers.get('ServerSideEncryption') != 'aws:kms':
+            return etag
+        return None
+
+    def download_object_parallel(self, bucket_name: str, object_key: str, local_path: str,
+            part_size: int = DEFAULT_PART_SIZE, max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Downloads an object to a local file using concurrent ranged GETs.
+
+        The file is preallocated to the object size and every part is written at its offset with ``os.pwrite`` (or
+        through a memory map where ``pwrite`` is unavailable), so no part is buffered beyond its current chunk.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param local_path: The local path where the object will be saved.
+        :type local_path: str
+        :param part_size: The number of bytes requested per ranged GET.
+        :type part_size: int
+        :param max_workers: The number of parts downloaded concurrently.
+        :type max_workers: int
+        :returns: Transfer statistics: bytes, parts, seconds and gb_per_second.
+        :rtype: Dict[str, Any]
+        """
+        headers = self.get_object_headers(bucket_name, object_key)
+        size = headers['ContentLength']
+        logger.debug(f"Downloading object: {object_key} ({size} bytes) from bucket: {bucket_name} to {local_path} "
+                     f"in parallel")
+        fd = os.open(local_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+        file_map = None
+        try:
+            os.ftruncate(fd, size)
+            if not hasattr(os, 'pwrite') and size:
+                file_map = mmap.mmap(fd, size)
+
+            def write(offset, data):
+                if file_map is None:
+                    os.pwrite(fd, data, offset)
+                else:
+                    file_map[offset:offset + len(data)] = data
+
+            stats = self._parallel_ranged_get(bucket_name, object_key, size, headers['ETag'], write, part_size,
+                                              max_workers)
+            if file_map is not None:
+                file_map.flush()
+        finally:
+            if file_map is not None:
+                file_map.close()
+            os.close(fd)
+        logger.debug(f"Object downloaded: {object_key} to {local_path} | {stats['gb_per_second']:.3f} GB/s")
+        return stats
+
+    def get_object_parallel(self, bucket_name: str, object_key: str, part_size: int = DEFAULT_PART_SIZE,
+            max_workers: int = 8) -> bytearray:
+        """
+        Retrieves an object into memory using concurrent ranged GETs assembled into a single preallocated bytearray.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_key: The key of the object in the S3 bucket.
+        :type object_key: str
+        :param part_size: The number of bytes requested per ranged GET.
+        :type part_size: int
+        :param max_workers: The number of parts downloaded concurrently.
+        :type max_workers: int
+        :returns: The content of the object.
+        :rtype: bytearray
+        """
+        headers = self.get_object_headers(bucket_name, object_key)
+        content = bytearray(headers['ContentLength'])
+        view = memoryview(content)
+
+        def write(offset, data):
+            view[offset:offset + len(data)] = data
+
+        stats = self._parallel_ranged_get(bucket_name, object_key, len(content), headers['ETag'], write, part_size,
+                                          max_workers)
+        logger.debug(f"Object retrieved: {object_key} from bucket: {bucket_name} | {stats['gb_per_second']:.3f} GB/s")
+        return content
+
+    def _parallel_ranged_get(self, bucket_name: str, object_key: str, size: int, etag: str,
+            write: Callable[[int, bytes], Any], part_size: int, max_workers: int) -> Dict[str, Any]:
+        """Downloads all parts of an object across a thread pool, passing each chunk to `write` at its offset."""
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda r: self._download_part(bucket_name, object_key, r[0], r[1], etag, write),
+                              ranges))
+        elapsed = max(time.time() - start_time, 1e-9)
+        return dict(bytes=size, parts=len(ranges), seconds=elapsed, gb_per_second=size / elapsed / 1024 ** 3)
+
+    @Retryable()
+    def _download_part(self, bucket_name: str, object_key: str, first: int, last: int, etag: str,
+            write: Callable[[int, bytes], Any]) -> None:
+        """Downloads the inclusive byte range [first, last] and verifies it against the expected ETag and size."""
+        obj = self.s3_client.get_object(Bucket=bucket_name, Key=object_key, Range=f"bytes={first}-{last}",
+                                        IfMatch=etag)
+        expected = last - first + 1
+        if obj['ContentLength'] != expected or obj.get('ETag') != etag:
+            raise ValueError(f"Part {first}-{last} of {object_key} failed verification: got "
+                             f"{obj['ContentLength']} bytes with ETag {obj.get('ETag')}, expected {expected} with {etag}")
+        offset = first
+        for chunk in obj['Body'].iter_chunks(1024 * 1024):
+            write(offset, chunk)
+            offset += len(chunk)
+        if offset - first != expected:
+            raise ValueError(f"Part {first}-{last} of {object_key} was truncated at {offset - first} bytes")
+
     @Retryable()
     def get_object_headers(self, bucket_name: str, object_key: str) -> dict:
         """
@@ -182,6 +1056,95 @@ class S3ServiceGateway:
         self.s3_client.delete_object(Bucket=bucket_name, Key=object_key)
         logger.debug(f"Object deleted: {object_key} from bucket: {bucket_name}")
 
+    def delete_objects(self, bucket_name: str, keys: Optional[Union[str, Iterable[str]]] = None,
+            max_workers: int = 8, prefix: Optional[str] = None, allow_all: bool = False) -> Dict[str, Any]:
+        """
+        Deletes many objects with ``DeleteObjects`` requests of up to 1,000 keys each, fanned out across a thread pool.
+
+        Objects are selected either by `keys` or, explicitly, by `prefix`. Deleting by prefix is one streaming
+        operation: each listing page is deleted while the next one is being listed, so memory stays bounded by the
+        number of pages in flight. Per-key errors are collected instead of aborting the run.
+
+        **Example**::
+
+            >>> S3ServiceGateway().delete_objects('bucket', ['a/file1', 'a/file2'])
+            >>> S3ServiceGateway().delete_objects('bucket', prefix='tmp/run-42/')
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param keys: The keys to delete. A single string is one key, never a prefix.
+        :type keys: Union[str, Iterable[str]], optional
+        :param max_workers: The number of DeleteObjects requests in flight.
+        :type max_workers: int
+        :param prefix: Delete every object whose key starts with this prefix instead of `keys`.
+        :type prefix: str, optional
+        :param allow_all: Must be True to delete with an empty prefix, i.e. every object in the bucket.
+        :type allow_all: bool
+        :returns: A summary with the number of keys deleted, the number of pages and a list of per-key errors.
+        :rtype: Dict[str, Any]
+        """
+        self._check_selection(keys, prefix, allow_all)
+        if prefix is not None:
+            logger.debug(f"Deleting all objects in bucket: {bucket_name} with prefix: {prefix}")
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = ([item['Key'] for item in page.get('Contents', [])]
+                     for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix,
+                                                    PaginationConfig={'PageSize': DELETE_OBJECTS_PAGE_SIZE}))
+        else:
+            key_iter = iter([keys] if isinstance(keys, str) else keys)
+            pages = iter(lambda: list(itertools.islice(key_iter, DELETE_OBJECTS_PAGE_SIZE)), [])
+
+        summary = dict(deleted=0, pages=0, errors=[])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = set()
+            for page in pages:
+                if not page:
+                    continue
+                if len(in_flight) >= max_workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._merge_delete_result(summary, future.result())
+                in_flight.add(executor.submit(self._delete_page, bucket_name, page))
+            for future in in_flight:
+                self._merge_delete_result(summary, future.result())
+
+        logger.debug(f"Deleted {summary['deleted']} objects from bucket: {bucket_name} in {summary['pages']} requests "
+                     f"with {len(summary['errors'])} errors")
+        if summary['errors']:
+            logger.warning(f"{len(summary['errors'])} objects could not be deleted from bucket: {bucket_name}")
+        return summary
+
+    @staticmethod
+    def _check_selection(keys: Any, prefix: Optional[str], allow_all: bool) -> None:
+        """Validates that exactly one of `keys` and `prefix` is given and that an empty prefix is confirmed."""
+        if (keys is None) == (prefix is None):
+            raise ValueError("Pass exactly one of keys or prefix=.")
+        if prefix == '' and not allow_all:
+            raise ValueError("An empty prefix selects every object in the bucket; pass allow_all=True to confirm.")
+
+    def _delete_page(self, bucket_name: str, keys: List[str]) -> Dict[str, Any]:
+        """Deletes one page of keys, reporting request level failures as errors for every key in the page."""
+        try:
+            response = self._delete_objects_request(bucket_name, keys)
+            errors = response.get('Errors', [])
+        except Exception as e:
+            code = e.response['Error']['Code'] if isinstance(e, ClientError) else type(e).__name__
+            errors = [dict(Key=key, Code=code, Message=str(e)) for key in keys]
+        return dict(deleted=len(keys) - len(errors), errors=errors)
+
+    @Retryable()
+    def _delete_objects_request(self, bucket_name: str, keys: List[str]) -> dict:
+        """Sends a single quiet DeleteObjects request, which only reports the keys that failed."""
+        return self.s3_client.delete_objects(Bucket=bucket_name,
+                                             Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True})
+
+    @staticmethod
+    def _merge_delete_result(summary: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Adds the outcome of one DeleteObjects page to the running summary."""
+        summary['deleted'] += result['deleted']
+        summary['pages'] += 1
+        summary['errors'].extend(result['errors'])
+
     @Retryable()
     def move_object(self, src_bucket_name: str, src_object_key: str, dst_bucket_name: str, dst_object_key: str) -> None:
         """
@@ -221,6 +1184,427 @@ class S3ServiceGateway:
                                    CopySource={'Bucket': src_bucket_name, 'Key': src_object_key})
         logger.debug(f"Object copied: {src_object_key} to {dst_bucket_name}/{dst_object_key}")
 
+    def copy_objects(self, src_bucket_name: str, keys: Optional[Dict[str, str]] = None,
+            dst_bucket_name: Optional[str] = None, dst_prefix: Optional[str] = None,
+            multipart_threshold: int = MULTIPART_COPY_THRESHOLD, part_size: int = DEFAULT_COPY_PART_SIZE,
+            max_workers: int = 16, checkpoint_path: Optional[str] = None, prefix: Optional[str] = None,
+            allow_all: bool = False) -> Dict[str, Any]:
+        """
+        Copies many objects server side across a thread pool.
+
+        Objects are selected either by an explicit mapping of source keys to destination keys, or by a source
+        `prefix` that is rewritten to `dst_prefix`. Objects larger than `multipart_threshold` are copied with a multipart
+        ``UploadPartCopy``, which also lifts the 5 GB limit of a single ``CopyObject``. Per-object failures are
+        collected instead of aborting the run.
+
+        With a `checkpoint_path`, every completed copy is appended to that file and objects already recorded there are
+        skipped, so rerunning after a partial failure resumes where the previous run stopped. The checkpoint is
+        removed once a run completes without errors.
+
+        **Example**::
+
+            >>> S3ServiceGateway().copy_objects('bucket', prefix='raw/2024/', dst_prefix='archive/2024/')
+
+        :param src_bucket_name: The source S3 bucket name.
+        :type src_bucket_name: str
+        :param keys: A mapping of source keys to destination keys. Within one bucket, no destination may also be a
+                     source (e.g. a->b with b->c); such mappings raise a ValueError.
+        :type keys: Dict[str, str], optional
+        :param dst_bucket_name: The destination S3 bucket name. Defaults to the source bucket.
+        :type dst_bucket_name: str, optional
+        :param dst_prefix: The prefix that replaces the source prefix in destination keys. Required with a prefix.
+        :type dst_prefix: str, optional
+        :param multipart_threshold: The size in bytes above which objects are copied in parts. At most 5 GB.
+        :type multipart_threshold: int
+        :param part_size: The size in bytes of each copied part.
+        :type part_size: int
+        :param max_workers: The number of objects copied concurrently.
+        :type max_workers: int
+        :param checkpoint_path: Optional local file that records completed copies for resuming.
+        :type checkpoint_path: str, optional
+        :param prefix: Copy every object under this source prefix instead of `keys`.
+        :type prefix: str, optional
+        :param allow_all: Must be True to copy with an empty prefix, i.e. every object in the bucket.
+        :type allow_all: bool
+        :returns: A summary with the number of objects copied and skipped, the bytes copied, the source keys present
+                  at the destination (copied or skipped) and a list of per-object errors.
+        :rtype: Dict[str, Any]
+        """
+        return self._copy_objects(src_bucket_name, keys, prefix, allow_all, dst_bucket_name, dst_prefix,
+                                  multipart_threshold, part_size, max_workers, checkpoint_path, remove_checkpoint=True)
+
+    def move_objects(self, src_bucket_name: str, keys: Optional[Dict[str, str]] = None,
+            dst_bucket_name: Optional[str] = None, dst_prefix: Optional[str] = None,
+            multipart_threshold: int = MULTIPART_COPY_THRESHOLD, part_size: int = DEFAULT_COPY_PART_SIZE,
+            max_workers: int = 16, checkpoint_path: Optional[str] = None, prefix: Optional[str] = None,
+            allow_all: bool = False) -> Dict[str, Any]:
+        """
+        Moves many objects by copying them with :meth:`copy_objects` and then deleting the copied sources with
+        batched ``DeleteObjects`` requests. Sources that failed to copy are left in place.
+
+        With a `checkpoint_path`, a rerun skips the copies that already completed and still deletes their sources.
+        The checkpoint is removed once both copies and deletes completed without errors.
+
+        :param src_bucket_name: The source S3 bucket name.
+        :type src_bucket_name: str
+        :param keys: A mapping of source keys to destination keys. Within one bucket, no destination may also be a
+                     source (e.g. a->b with b->c); such mappings raise a ValueError.
+        :type keys: Dict[str, str], optional
+        :param dst_bucket_name: The destination S3 bucket name. Defaults to the source bucket.
+        :type dst_bucket_name: str, optional
+        :param dst_prefix: The prefix that replaces the source prefix in destination keys. Required with a prefix.
+        :type dst_prefix: str, optional
+        :param multipart_threshold: The size in bytes above which objects are copied in parts. At most 5 GB.
+        :type multipart_threshold: int
+        :param part_size: The size in bytes of each copied part.
+        :type part_size: int
+        :param max_workers: The number of objects copied concurrently.
+        :type max_workers: int
+        :param checkpoint_path: Optional local file that records completed copies for resuming.
+        :type checkpoint_path: str, optional
+        :param prefix: Move every object under this source prefix instead of `keys`.
+        :type prefix: str, optional
+        :param allow_all: Must be True to move with an empty prefix, i.e. every object in the bucket.
+        :type allow_all: bool
+        :returns: The copy summary extended with the number of deleted sources. Delete failures are added to errors.
+        :rtype: Dict[str, Any]
+        """
+        summary = self._copy_objects(src_bucket_name, keys, prefix, allow_all, dst_bucket_name, dst_prefix,
+                                     multipart_threshold, part_size, max_workers, checkpoint_path,
+                                     remove_checkpoint=False)
+        deleted = self.delete_objects(src_bucket_name, summary['keys'], max_workers=max_workers)
+        summary['deleted'] = deleted['deleted']
+        summary['errors'].extend(deleted['errors'])
+        if checkpoint_path and not summary['errors'] and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        logger.debug(f"Moved {summary['deleted']} objects from bucket: {src_bucket_name}")
+        return summary
+
+    def _copy_objects(self, src_bucket_name: str, keys: Optional[Dict[str, str]], prefix: Optional[str],
+            allow_all: bool, dst_bucket_name: Optional[str], dst_prefix: Optional[str], multipart_threshold: int,
+            part_size: int, max_workers: int, checkpoint_path: Optional[str],
+            remove_checkpoint: bool) -> Dict[str, Any]:
+        """Runs a bulk copy, optionally keeping the checkpoint of a clean run for a follow-up delete."""
+        self._check_selection(keys, prefix, allow_all)
+        dst_bucket_name = dst_bucket_name or src_bucket_name
+        multipart_threshold = min(multipart_threshold, MAX_SINGLE_COPY_SIZE)
+        if prefix is not None:
+            if dst_prefix is None:
+                raise ValueError("A dst_prefix is required when copying by prefix.")
+            if dst_bucket_name == src_bucket_name and dst_prefix.startswith(prefix):
+                raise ValueError("The destination prefix may not lie inside the source prefix of the same bucket.")
+            tasks = ((obj.key, dst_prefix + obj.key[len(prefix):], obj.size)
+                     for obj in self.iter_objects(src_bucket_name, prefix))
+        elif isinstance(keys, dict):
+            if dst_bucket_name == src_bucket_name:
+                chained = sorted(set(keys.values()).intersection(keys))
+                if chained:
+                    raise ValueError(f"Destination keys may not also be source keys in the same bucket, since copies "
+                                     f"run concurrently and a move deletes its sources: {chained[:10]}")
+            tasks = ((src_key, dst_key, None) for src_key, dst_key in keys.items())
+        else:
+            raise TypeError("keys must be a mapping of source keys to destination keys; use prefix= to select a "
+                            "prefix.")
+
+        completed = self._load_copy_checkpoint(checkpoint_path)
+        checkpoint_lock = threading.Lock()
+        checkpoint_file = open(checkpoint_path, 'a', encoding='utf-8') if checkpoint_path else None
+        summary = dict(copied=0, skipped=0, bytes=0, keys=[], errors=[])
+
+        def copy_one(src_key: str, dst_key: str, size: Optional[int]) -> Dict[str, Any]:
+            try:
+                copied = self._copy_single_or_multipart(src_bucket_name, src_key, dst_bucket_name, dst_key, size,
+                                                        multipart_threshold, part_size)
+            except Exception as e:
+                code = e.response['Error']['Code'] if isinstance(e, ClientError) else type(e).__name__
+                return dict(error=dict(Key=src_key, Destination=dst_key, Code=code, Message=str(e)))
+            if checkpoint_file is not None:
+                with checkpoint_lock:
+                    checkpoint_file.write(json.dumps(dict(src=src_key, dst=dst_key)) + '\n')
+                    checkpoint_file.flush()
+            return dict(key=src_key, bytes=copied)
+
+        def merge(result: Dict[str, Any]) -> None:
+            if 'error' in result:
+                summary['errors'].append(result['error'])
+            else:
+                summary['copied'] += 1
+                summary['bytes'] += result['bytes']
+                summary['keys'].append(result['key'])
+
+        logger.debug(f"Copying objects from bucket: {src_bucket_name} to bucket: {dst_bucket_name}")
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = set()
+                for src_key, dst_key, size in tasks:
+                    if completed.get(src_key) == dst_key:
+                        summary['skipped'] += 1
+                        summary['keys'].append(src_key)
+                        continue
+                    if len(in_flight) >= max_workers * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            merge(future.result())
+                    in_flight.add(executor.submit(copy_one, src_key, dst_key, size))
+                for future in in_flight:
+                    merge(future.result())
+        finally:
+            if checkpoint_file is not None:
+                checkpoint_file.close()
+
+        if checkpoint_path and remove_checkpoint and not summary['errors'] and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        logger.debug(f"Copied {summary['copied']} objects ({summary['bytes']} bytes) to bucket: {dst_bucket_name}, "
+                     f"skipped {summary['skipped']} with {len(summary['errors'])} errors")
+        if summary['errors']:
+            logger.warning(f"{len(summary['errors'])} objects could not be copied to bucket: {dst_bucket_name}")
+        return summary
+
+    @staticmethod
+    def _load_copy_checkpoint(checkpoint_path: Optional[str]) -> Dict[str, str]:
+        """Reads the source to destination keys recorded by an earlier interrupted copy."""
+        completed = {}
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+                for line in checkpoint_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # A torn last line from a crashed run
+                    completed[record['src']] = record['dst']
+            logger.debug(f"Resuming from checkpoint {checkpoint_path} with {len(completed)} completed copies")
+        return completed
+
+    def _copy_single_or_multipart(self, src_bucket_name: str, src_object_key: str, dst_bucket_name: str,
+            dst_object_key: str, size: Optional[int], multipart_threshold: int, part_size: int) -> int:
+        """Copies one object, switching to a multipart copy above the threshold, and returns its size."""
+        if size is not None and size <= multipart_threshold:
+            self.copy_object(src_bucket_name, src_object_key, dst_bucket_name, dst_object_key)
+            return size
+        headers = self.get_object_headers(src_bucket_name, src_object_key)
+        if headers['ContentLength'] <= multipart_threshold:
+            self.copy_object(src_bucket_name, src_object_key, dst_bucket_name, dst_object_key)
+        else:
+            self._multipart_copy(src_bucket_name, src_object_key, dst_bucket_name, dst_object_key, headers, part_size)
+        return headers['ContentLength']
+
+    def _multipart_copy(self, src_bucket_name: str, src_object_key: str, dst_bucket_name: str, dst_object_key: str,
+            headers: dict, part_size: int) -> None:
+        """
+        Copies an object server side in parts with UploadPartCopy. The content type and user metadata of the source
+        are carried over, every part is pinned to the source ETag, and the upload is aborted on failure.
+        """
+        size = headers['ContentLength']
+        part_size = max(part_size, math.ceil(size / MAX_MULTIPART_PARTS), 5 * 1024 * 1024)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        params = dict(Bucket=dst_bucket_name, Key=dst_object_key, Metadata=headers.get('Metadata', {}))
+        for header in ('ContentType', 'ContentEncoding', 'ContentDisposition', 'ContentLanguage', 'CacheControl'):
+            if headers.get(header):
+                params[header] = headers[header]
+        logger.debug(f"Copying object: {src_object_key} ({size} bytes) to {dst_bucket_name}/{dst_object_key} in "
+                     f"{len(ranges)} parts")
+        upload_id = self.s3_client.create_multipart_upload(**params)['UploadId']
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(ranges), 8)) as executor:
+                parts = list(executor.map(
+                    lambda numbered: self._copy_part(src_bucket_name, src_object_key, dst_bucket_name, dst_object_key,
+                                                     upload_id, numbered[0], numbered[1], headers['ETag']),
+                    enumerate(ranges, start=1)))
+            self.s3_client.complete_multipart_upload(Bucket=dst_bucket_name, Key=dst_object_key, UploadId=upload_id,
+                                                     MultipartUpload={'Parts': parts})
+        except Exception:
+            self.s3_client.abort_multipart_upload(Bucket=dst_bucket_name, Key=dst_object_key, UploadId=upload_id)
+            raise
+
+    @Retryable()
+    def _copy_part(self, src_bucket_name: str, src_object_key: str, dst_bucket_name: str, dst_object_key: str,
+            upload_id: str, part_number: int, byte_range: Tuple[int, int], etag: str) -> Dict[str, Any]:
+        """Copies the inclusive byte range of the source into one part of a multipart upload."""
+        response = self.s3_client.upload_part_copy(
+            Bucket=dst_bucket_name, Key=dst_object_key, UploadId=upload_id, PartNumber=part_number,
+            CopySource={'Bucket': src_bucket_name, 'Key': src_object_key}, CopySourceIfMatch=etag,
+            CopySourceRange=f"bytes={byte_range[0]}-{byte_range[1]}")
+        return {'PartNumber': part_number, 'ETag': response['CopyPartResult']['ETag']}
+
+    def sync_up(self, local_dir: Union[str, Path], bucket_name: str, prefix: str = '', delete: bool = False,
+            max_workers: int = 8, transfer_config: Optional[TransferConfig] = None,
+            allow_all: bool = False) -> Dict[str, Any]:
+        """
+        Uploads a local directory tree to a prefix, transferring only files that are missing or changed.
+
+        A file is unchanged when its size matches and its content reproduces the remote ETag, including multipart
+        ETags whose part layout is inferred from the part count. Objects whose ETag is not an MD5 (e.g. SSE-KMS) are
+        compared through the SHA-256 stored in their metadata by earlier syncs. Files are compared across a thread
+        pool and uploaded through :meth:`upload_file`, like every other upload of the gateway.
+
+        **Example**::
+
+            >>> S3ServiceGateway().sync_up('build/model', 'bucket', 'models/v3/', delete=True)
+
+        :param local_dir: The local directory to upload.
+        :type local_dir: Union[str, Path]
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param prefix: The key prefix the directory maps to. A trailing '/' is added if missing.
+        :type prefix: str
+        :param delete: Whether to delete objects under the prefix that have no local counterpart.
+        :type delete: bool
+        :param max_workers: The number of files compared and uploaded concurrently.
+        :type max_workers: int
+        :param transfer_config: Multipart transfer settings. Defaults to the gateway's transfer_config.
+        :type transfer_config: TransferConfig, optional
+        :param allow_all: Must be True to combine `delete` with an empty prefix, which deletes every object in the
+                          bucket that is not present locally.
+        :type allow_all: bool
+        :returns: A summary with the number of files and bytes transferred and skipped, the number of deleted objects
+                  and a list of per-file errors.
+        :rtype: Dict[str, Any]
+        """
+        root = Path(local_dir)
+        if not root.is_dir():
+            raise ValueError(f"The local directory does not exist: {local_dir}")
+        prefix = self._sync_prefix(prefix, delete, allow_all)
+        config = transfer_config or self.transfer_config
+        remote = {obj.key: obj for obj in self.iter_objects(bucket_name, prefix)}
+        files = {prefix + path.relative_to(root).as_posix(): path for path in root.rglob('*') if path.is_file()}
+        logger.debug(f"Syncing {len(files)} files from {root} to bucket: {bucket_name} with prefix: {prefix}")
+
+        def sync_file(key: str) -> Tuple[int, bool]:
+            path = str(files[key])
+            size = os.path.getsize(path)
+            in_sync, sha256 = self._is_in_sync(bucket_name, path, size, remote.get(key), config)
+            if in_sync:
+                return size, False
+            self._sync_upload(path, bucket_name, key, config, sha256)
+            return size, True
+
+        summary = self._run_sync(files, sync_file, max_workers)
+        if delete:
+            extras = sorted(set(remote) - set(files))
+            if extras:
+                deleted = self.delete_objects(bucket_name, extras, max_workers=max_workers)
+                summary['deleted'] = deleted['deleted']
+                summary['errors'].extend(deleted['errors'])
+        logger.debug(f"Synced {root} to bucket: {bucket_name}: uploaded {summary['transferred']} files "
+                     f"({summary['transferred_bytes']} bytes), skipped {summary['skipped']} files "
+                     f"({summary['skipped_bytes']} bytes), deleted {summary['deleted']}")
+        return summary
+
+    def sync_down(self, bucket_name: str, prefix: str, local_dir: Union[str, Path], delete: bool = False,
+            max_workers: int = 8, transfer_config: Optional[TransferConfig] = None,
+            allow_all: bool = False) -> Dict[str, Any]:
+        """
+        Downloads a prefix into a local directory tree, transferring only objects that are missing or changed locally.
+
+        Files are compared the same way as in :meth:`sync_up`. Keys that would resolve outside `local_dir` (e.g.
+        containing '..') are reported as errors instead of being written.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param prefix: The key prefix to download. A trailing '/' is added if missing.
+        :type prefix: str
+        :param local_dir: The local directory the prefix maps to. It is created if needed.
+        :type local_dir: Union[str, Path]
+        :param delete: Whether to delete local files that have no counterpart under the prefix.
+        :type delete: bool
+        :param max_workers: The number of objects compared and downloaded concurrently.
+        :type max_workers: int
+        :param transfer_config: Multipart transfer settings. Defaults to the gateway's transfer_config.
+        :type transfer_config: TransferConfig, optional
+        :param allow_all: Must be True to combine `delete` with an empty prefix, i.e. mirroring the whole bucket.
+        :type allow_all: bool
+        :returns: A summary with the number of files and bytes transferred and skipped, the number of deleted files
+                  and a list of per-object errors.
+        :rtype: Dict[str, Any]
+        """
+        prefix = self._sync_prefix(prefix, delete, allow_all)
+        root = Path(local_dir)
+        root.mkdir(parents=True, exist_ok=True)
+        resolved_root = root.resolve()
+        config = transfer_config or self.transfer_config
+        remote = {obj.key: obj for obj in self.iter_objects(bucket_name, prefix) if not obj.key.endswith('/')}
+        logger.debug(f"Syncing {len(remote)} objects from bucket: {bucket_name} with prefix: {prefix} to {root}")
+
+        def sync_object(key: str) -> Tuple[int, bool]:
+            path = root / key[len(prefix):]
+            if not path.resolve().is_relative_to(resolved_root):
+                raise ValueError(f"The key {key} resolves outside of {root}")
+            obj = remote[key]
+            if path.is_file() and self._is_in_sync(bucket_name, str(path), path.stat().st_size, obj, config)[0]:
+                return obj.size, False
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.download_object(bucket_name, key, str(path), transfer_config=config, decompress=False)
+            return obj.size, True
+
+        summary = self._run_sync(remote, sync_object, max_workers)
+        if delete:
+            expected = {(root / key[len(prefix):]).resolve() for key in remote}
+            for path in root.rglob('*'):
+                if path.is_file() and path.resolve() not in expected:
+                    path.unlink()
+                    summary['deleted'] += 1
+        logger.debug(f"Synced bucket: {bucket_name} with prefix: {prefix} to {root}: downloaded "
+                     f"{summary['transferred']} files ({summary['transferred_bytes']} bytes), skipped "
+                     f"{summary['skipped']} files ({summary['skipped_bytes']} bytes), deleted {summary['deleted']}")
+        return summary
+
+    @staticmethod
+    def _sync_prefix(prefix: str, delete: bool, allow_all: bool) -> str:
+        """Normalizes a sync prefix to end with '/' unless it is empty, which `delete` requires `allow_all` for."""
+        if not prefix and delete and not allow_all:
+            raise ValueError("delete=True with an empty prefix covers the whole bucket; pass allow_all=True to "
+                             "confirm.")
+        return prefix.rstrip('/') + '/' if prefix else ''
+
+    @staticmethod
+    def _run_sync(keys: Iterable[str], sync_one: Callable[[str], Tuple[int, bool]],
+            max_workers: int) -> Dict[str, Any]:
+        """Runs `sync_one` for every key across a thread pool and summarizes transferred and skipped bytes."""
+        summary = dict(transferred=0, transferred_bytes=0, skipped=0, skipped_bytes=0, deleted=0, errors=[])
+
+        def guarded(key: str):
+            try:
+                return key, sync_one(key), None
+            except Exception as e:
+                return key, None, e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for key, result, error in executor.map(guarded, keys):
+                if error is not None:
+                    code = error.response['Error']['Code'] if isinstance(error, ClientError) else type(error).__name__
+                    summary['errors'].append(dict(Key=key, Code=code, Message=str(error)))
+                elif result[1]:
+                    summary['transferred'] += 1
+                    summary['transferred_bytes'] += result[0]
+                else:
+                    summary['skipped'] += 1
+                    summary['skipped_bytes'] += result[0]
+        if summary['errors']:
+            logger.warning(f"{len(summary['errors'])} files could not be synced")
+        return summary
+
+    def _is_in_sync(self, bucket_name: str, path: str, size: int, remote: Optional[S3ObjectInfo],
+            config: TransferConfig) -> Tuple[bool, Optional[str]]:
+        """
+        Checks whether a local file matches a remote object by size, then by ETag or stored content hash. The file is
+        read at most once; the SHA-256 of that read is returned so an upload of a changed file can reuse it.
+
+        :returns: Whether the file is in sync, and its hex SHA-256 if the file was read.
+        """
+        if remote is None or remote.size != size:
+            return False, None
+        matches, sha256 = _matches_etag(path, size, remote.etag, config.multipart_chunksize)
+        if matches:
+            return True, sha256
+        stored = self.get_object_headers(bucket_name, remote.key).get('Metadata', {}).get(CONTENT_HASH_METADATA)
+        return stored is not None and stored == sha256, sha256
+
+    def _sync_upload(self, path: str, bucket_name: str, object_key: str, config: TransferConfig,
+            sha256: Optional[str] = None) -> None:
+        """Uploads a file through upload_file with its SHA-256 in the object metadata for later comparisons."""
+        self.upload_file(Path(path), bucket_name, object_key, transfer_config=config,
+                         metadata={CONTENT_HASH_METADATA: sha256 or _digest_file(path)[1]})
+
     @Retryable()
     def check_object_existence(self, bucket_name: str, object_key: str) -> bool:
         """
@@ -245,6 +1629,102 @@ class S3ServiceGateway:
             else:
                 raise
 
+    def check_objects_exist(self, bucket_name: str, object_keys: Iterable[str], metadata: bool = False,
+            max_workers: int = 32, list_page_cost: float = LIST_PAGE_COST) -> Dict[str, Any]:
+        """
+        Checks the existence of many objects, listing dense prefixes and sending HEAD requests for sparse ones.
+
+        Keys are grouped by their parent prefix. For each group a cost model compares one LIST page (up to 1000
+        keys, weighted as `list_page_cost` HEAD requests because pages are fetched sequentially) against one HEAD
+        per key: a group of n keys may spend at most n / `list_page_cost` pages listing the key range it spans,
+        starting right before its first key. If the range is covered within that budget every key in the group is
+        answered from the listing; otherwise the keys past the listed range fall back to concurrent HEAD requests.
+        Groups too small to afford a single page go straight to HEAD requests.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param object_keys: The keys to check.
+        :type object_keys: Iterable[str]
+        :param metadata: Return an S3ObjectInfo record (or None when missing) per key instead of a bool.
+        :type metadata: bool
+        :param max_workers: The number of concurrent HEAD requests.
+        :type max_workers: int
+        :param list_page_cost: The cost of one LIST page expressed in HEAD requests.
+        :type list_page_cost: float
+        :returns: A dict mapping each key to True/False, or to its S3ObjectInfo or None if `metadata` is True.
+        :rtype: Dict[str, Union[bool, Optional[S3ObjectInfo]]]
+        """
+        if list_page_cost <= 0:
+            raise ValueError("list_page_cost must be positive.")
+        keys = list(dict.fromkeys(object_keys))
+        groups: Dict[str, List[str]] = {}
+        for key in keys:
+            groups.setdefault(key[:key.rfind('/') + 1], []).append(key)
+
+        found: Dict[str, Optional[S3ObjectInfo]] = {}
+        head_keys = []
+        pages_listed = 0
+        for prefix, group in groups.items():
+            group.sort()
+            max_pages = int(len(group) / list_page_cost)
+            if max_pages < 1:
+                head_keys.extend(group)
+                continue
+            index, covered_up_to, pages = self._index_key_range(bucket_name, prefix, group, max_pages)
+            pages_listed += pages
+            for key in group:
+                if covered_up_to is None or key <= covered_up_to:
+                    found[key] = index.get(key)
+                else:
+                    head_keys.append(key)
+
+        if head_keys:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(head_keys)))) as executor:
+                for key, info in zip(head_keys, executor.map(
+                        lambda head_key: self._head_object_info(bucket_name, head_key), head_keys)):
+                    found[key] = info
+
+        logger.debug(f"Checked {len(keys)} keys in bucket: {bucket_name} with {pages_listed} list pages over "
+                     f"{len(groups)} prefixes and {len(head_keys)} HEAD requests")
+        if metadata:
+            return {key: found.get(key) for key in keys}
+        return {key: found.get(key) is not None for key in keys}
+
+    def _index_key_range(self, bucket_name: str, prefix: str, sorted_keys: List[str],
+            max_pages: int) -> Tuple[Dict[str, S3ObjectInfo], Optional[str], int]:
+        """
+        Lists the key range spanned by `sorted_keys` for at most `max_pages` pages, indexing the wanted keys.
+
+        Returns the index, the last listed key if the budget ran out first (None if the range was fully covered)
+        and the number of pages fetched.
+        """
+        wanted = set(sorted_keys)
+        index = {}
+        pages = 0
+        for page in self._paginate(bucket_name, prefix, start_after=sorted_keys[0][:-1]):
+            pages += 1
+            contents = page.get('Contents', [])
+            for item in contents:
+                if item['Key'] in wanted:
+                    index[item['Key']] = S3ObjectInfo(item['Key'], item['Size'], item['ETag'], item['LastModified'])
+            last_key = contents[-1]['Key'] if contents else None
+            if not page.get('IsTruncated') or (last_key is not None and last_key >= sorted_keys[-1]):
+                return index, None, pages
+            if pages >= max_pages:
+                return index, last_key or '', pages
+        return index, None, pages
+
+    @Retryable()
+    def _head_object_info(self, bucket_name: str, object_key: str) -> Optional[S3ObjectInfo]:
+        """Returns the S3ObjectInfo of an object from a HEAD request, or None if it does not exist."""
+        try:
+            head = self.s3_client.head_object(Bucket=bucket_name, Key=object_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ("404", "NoSuchKey"):
+                return None
+            raise
+        return S3ObjectInfo(object_key, head['ContentLength'], head['ETag'], head['LastModified'])
+
     @Retryable()
     def list_objects(self, bucket_name: str, prefix: str = None) -> list:
         """
@@ -258,12 +1738,119 @@ class S3ServiceGateway:
         :rtype: list
         """
         logger.debug(f"Listing objects in bucket: {bucket_name} with prefix: {prefix}")
-        paginator = self.s3_client.get_paginator('list_objects_v2')
-        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
-        object_list = [item['Key'] for page in page_iterator for item in page.get('Contents', [])]
+        object_list = [obj.key for obj in self.iter_objects(bucket_name, prefix or '')]
         logger.debug(f"Objects listed in bucket: {bucket_name} with prefix: {prefix}")
         return object_list
 
+    def iter_objects(self, bucket_name: str, prefix: str = '', suffix: Optional[Union[str, Tuple[str, ...]]] = None,
+            modified_since: Optional[datetime] = None, delimiter: Optional[str] = None, fan_out_depth: int = 1,
+            max_workers: int = 8) -> Iterator[S3ObjectInfo]:
+        """
+        Lazily lists objects page by page, yielding compact records with key, size, ETag and last modified time.
+
+        Without a `delimiter` the listing is a single sequential scan in key order. With a `delimiter` (usually '/'),
+        the sub-prefixes up to `fan_out_depth` levels below `prefix` are discovered first and then listed
+        concurrently, which speeds up enumerating wide hierarchies; records are then yielded in no particular order.
+        Filters are applied as pages arrive, so no intermediate lists are built.
+
+        :param bucket_name: The name of the S3 bucket.
+        :type bucket_name: str
+        :param prefix: The prefix to list.
+        :type prefix: str
+        :param suffix: Only yield keys ending with this suffix (or any of these suffixes).
+        :type suffix: Union[str, Tuple[str, ...]], optional
+        :param modified_since: Only yield objects modified at or after this time. Naive datetimes are taken as UTC.
+        :type modified_since: datetime, optional
+        :param delimiter: The hierarchy delimiter used to fan out over sub-prefixes. None lists sequentially.
+        :type delimiter: str, optional
+        :param fan_out_depth: The number of delimiter levels below `prefix` to discover before fanning out.
+        :type fan_out_depth: int
+        :param max_workers: The number of sub-prefixes listed concurrently.
+        :type max_workers: int
+        :returns: An iterator of S3ObjectInfo records.
+        :rtype: Iterator[S3ObjectInfo]
+        """
+        if modified_since is not None and modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=timezone.utc)
+
+        def matches(item: dict) -> bool:
+            if suffix is not None and not item['Key'].endswith(suffix):
+                return False
+            return modified_since is None or item['LastModified'] >= modified_since
+
+        def to_records(contents: List[dict]) -> Iterator[S3ObjectInfo]:
+            for item in contents:
+                if matches(item):
+                    yield S3ObjectInfo(item['Key'], item['Size'], item['ETag'], item['LastModified'])
+
+        if not delimiter:
+            for page in self._paginate(bucket_name, prefix):
+                yield from to_records(page.get('Contents', []))
+            return
+
+        prefixes = [prefix]
+        for _ in range(max(fan_out_depth, 1)):
+            next_prefixes = []
+            for level_prefix in prefixes:
+                for page in self._paginate(bucket_name, level_prefix, delimiter=delimiter):
+                    yield from to_records(page.get('Contents', []))
+                    next_prefixes.extend(common['Prefix'] for common in page.get('CommonPrefixes', []))
+            prefixes = next_prefixes
+        if not prefixes:
+            return
+
+        logger.debug(f"Listing {len(prefixes)} prefixes in bucket: {bucket_name} concurrently")
+        pages: queue.Queue = queue.Queue(maxsize=max_workers * 2)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce(sub_prefix: str) -> None:
+            try:
+                for sub_page in self._paginate(bucket_name, sub_prefix):
+                    if stop.is_set():
+                        return
+                    put(sub_page.get('Contents', []))
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for sub_prefix in prefixes:
+                executor.submit(produce, sub_prefix)
+            remaining = len(prefixes)
+            while remaining:
+                item = pages.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield from to_records(item)
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _paginate(self, bucket_name: str, prefix: str, delimiter: Optional[str] = None,
+            start_after: Optional[str] = None) -> Iterator[dict]:
+        """Iterates the raw ListObjectsV2 pages of a prefix."""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        params = dict(Bucket=bucket_name, Prefix=prefix)
+        if delimiter:
+            params['Delimiter'] = delimiter
+        if start_after:
+            params['StartAfter'] = start_after
+        return iter(paginator.paginate(**params))
+
     @Retryable()
     def check_bucket_permissions(self, bucket_name: str) -> dict:
         """
@@ -322,6 +1909,43 @@ class S3ServiceGateway:
             logger.error(f'Error generating signed URL: {e}')
             raise ValueError('Failed to generate signed URL') from e
 
+    def get_signed_urls(self, bucket_name: str, object_keys: Iterable[str], expiration_seconds: int = 3600,
+            min_validity: float = 60.0) -> Dict[str, str]:
+        """
+        Generates presigned GET URLs for many objects at once, entirely offline.
+
+        URLs are signed with SigV4 by a local signer that derives the signing key once per day and skips the botocore
+        request pipeline and per-URL logging. Signed URLs are cached in a bounded LRU and reused while they remain
+        valid for at least `min_validity` seconds, so a returned URL is valid for between `min_validity` and
+        `expiration_seconds` seconds.
+
+        URLs on AWS use the regional virtual-hosted endpoint (``bucket.s3.<region>.amazonaws.com``). They carry the
+        same signature as botocore's presigner for that host, but differ from :meth:`get_signed_url`, which follows
+        botocore's default of the global ``bucket.s3.amazonaws.com`` host in us-east-1. Both forms are valid.
+
+        :param bucket_name: Name of the S3 bucket
+        :type bucket_name: str
+        :param object_keys: Keys of the S3 objects
+        :type object_keys: Iterable[str]
+        :param expiration_seconds: Time in seconds for newly signed URLs to remain valid, at most seven days
+        :type expiration_seconds: int
+        :param min_validity: Minimum remaining validity in seconds for a cached URL to be reused
+        :type min_validity: float
+        :return: Presigned URLs keyed by object key
+        :rtype: Dict[str, str]
+        :raises NoCredentialsError: If the AWS session has no credentials to sign with.
+        """
+        if self.url_signer is None:
+            session = AwsClientHub().aws_session_client
+            credentials = session.get_credentials() if session is not None else None
+            if credentials is None:
+                raise NoCredentialsError()
+            meta = self.s3_client.meta
+            self.url_signer = _PresignedUrlSigner(credentials, meta.region_name, meta.endpoint_url)
+        urls = self.url_signer.sign(bucket_name, object_keys, expiration_seconds, min_validity)
+        logger.debug(f'Generated {len(urls)} signed URLs for bucket: {bucket_name}')
+        return urls
+
     # Aliases for backward compatibility with deprecation warnings
     def upload_fileobj(self, file_path: Union[str, IO[bytes]], bucket_name: str, object_key: str):
         """
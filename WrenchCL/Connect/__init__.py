@@ -3,5 +3,6 @@
 from .AwsClientHub import *
 from .RdsServiceGateway import *
 from .S3ServiceGateway import *
+from .AsyncS3ServiceGateway import *
 
-__all__ = ['RdsServiceGateway', 'S3ServiceGateway', 'AwsClientHub']
+__all__ = ['RdsServiceGateway', 'S3ServiceGateway', 'AsyncS3ServiceGateway', 'AwsClientHub']
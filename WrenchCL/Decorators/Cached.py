@@ -0,0 +1,308 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import asyncio
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_LEADER_CANCELLED = object()
+
+
+class CacheStats(NamedTuple):
+    """Counters of a cached function."""
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+
+
+class _Flight:
+    """An in-progress call that concurrent misses for the same key wait on."""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _CacheStore:
+    """
+    LRU store with an optional TTL and entry and byte bounds. Not thread-safe on its own; callers hold `lock`.
+
+    Keys with a call in flight carry a generation that `invalidate` and `clear` advance. A call takes the generation
+    when it starts (`begin`) and its result is only stored if the generation is unchanged when it finishes, so an
+    invalidation during the call is not overwritten by the stale result.
+    """
+
+    def __init__(self, ttl: Optional[float], max_entries: Optional[int], max_bytes: Optional[int],
+                 size_of: Callable[[Any], int]):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.lock = threading.Lock()
+        self.entries: OrderedDict = OrderedDict()
+        self.bytes = 0
+        self.epoch = 0
+        self.generations = {}
+        self.in_flight = {}
+        self.hits = self.misses = self.coalesced = self.evictions = self.expirations = 0
+
+    def lookup(self, key: Hashable) -> Any:
+        entry = self.entries.get(key)
+        if entry is not None:
+            value, expires_at, size = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._remove(key)
+            self.expirations += 1
+        self.misses += 1
+        return _MISSING
+
+    def begin(self, key: Hashable) -> tuple:
+        """Registers a call in flight for the key and returns the generation to pass to `put`."""
+        self.in_flight[key] = self.in_flight.get(key, 0) + 1
+        return self.epoch, self.generations.setdefault(key, 0)
+
+    def end(self, key: Hashable) -> None:
+        """Unregisters a call in flight, dropping the key's generation once no call needs it."""
+        remaining = self.in_flight.pop(key) - 1
+        if remaining:
+            self.in_flight[key] = remaining
+        else:
+            self.generations.pop(key, None)
+
+    def put(self, key: Hashable, value: Any, generation: Optional[tuple] = None) -> None:
+        if generation is not None and generation != (self.epoch, self.generations.get(key)):
+            return
+        size = self.size_of(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._remove(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self.entries[key] = (value, expires_at, size)
+        self.bytes += size
+        while ((self.max_entries is not None and len(self.entries) > self.max_entries) or
+               (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            oldest_key, (_, oldest_expiry, _) = next(iter(self.entries.items()))
+            self._remove(oldest_key)
+            if oldest_expiry is not None and oldest_expiry <= time.monotonic():
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        if key in self.generations:
+            self.generations[key] += 1
+        if key not in self.entries:
+            return False
+        self._remove(key)
+        return True
+
+    def clear(self) -> None:
+        self.epoch += 1
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.coalesced, self.evictions, self.expirations,
+                          len(self.entries), self.bytes)
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self.entries.pop(key)
+        self.bytes -= size
+
+
+def _make_key(*args, **kwargs) -> Hashable:
+    """Builds a hashable key from the call arguments, in the same way regardless of keyword argument order."""
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+def _estimate_size(value: Any, _depth: int = 0) -> int:
+    """Estimates the memory footprint of a value, following containers up to three levels deep."""
+    size = sys.getsizeof(value)
+    if _depth < 3:
+        if isinstance(value, dict):
+            size += sum(_estimate_size(k, _depth + 1) + _estimate_size(v, _depth + 1) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(_estimate_size(item, _depth + 1) for item in value)
+    return size
+
+
+def Cached(_func=None, *, ttl: Optional[float] = None, max_entries: Optional[int] = 128,
+           max_bytes: Optional[int] = None, key: Optional[Callable[..., Hashable]] = None,
+           size_of: Callable[[Any], int] = _estimate_size) -> Callable:
+    """
+    A decorator that memoizes a function's results with an optional TTL and LRU bounds on entries or bytes.
+
+    Concurrent misses for the same key are coalesced (single-flight): one caller runs the function while the others
+    wait for its result, so 50 threads or tasks asking for the same secret make a single underlying call. Exceptions
+    are passed to every waiting caller and never cached. If the leading task is cancelled, only it sees the
+    cancellation and one of the waiting tasks takes over the call. A call that finishes after ``invalidate`` or
+    ``cache_clear`` still returns its result but does not cache it. Works on sync and async functions and is thread-safe; for
+    coroutine functions the awaited result is cached.
+
+    The wrapper exposes ``cache_stats()``, ``invalidate(*args, **kwargs)`` and ``cache_clear()``.
+
+    :param ttl: Seconds an entry stays valid. None keeps entries until they are evicted.
+    :type ttl: float, optional
+    :param max_entries: The maximum number of entries. None means unbounded.
+    :type max_entries: int, optional
+    :param max_bytes: The maximum estimated size of all cached values. Values larger than this are not cached.
+    :type max_bytes: int, optional
+    :param key: A callable receiving the call arguments and returning a hashable key. Defaults to all arguments,
+                which must then be hashable.
+    :type key: Callable[..., Hashable], optional
+    :param size_of: A callable estimating the size in bytes of a value, used with `max_bytes`.
+    :type size_of: Callable[[Any], int]
+    :returns: The decorated function.
+    :rtype: Callable
+
+    **Example**::
+
+        >>> @Cached(ttl=300, key=lambda secret_id, **_: secret_id)
+        ... def fetch_secret(secret_id, client=None):
+        ...     return client.get_secret_value(SecretId=secret_id)['SecretString']
+        ...
+        >>> fetch_secret.cache_stats()
+        CacheStats(hits=0, misses=0, coalesced=0, evictions=0, expirations=0, entries=0, bytes=0)
+    """
+    if ttl is not None and ttl <= 0:
+        raise ValueError("ttl must be positive.")
+    if (max_entries is not None and max_entries < 1) or (max_bytes is not None and max_bytes < 1):
+        raise ValueError("max_entries and max_bytes must be positive.")
+    make_key = key or _make_key
+
+    def decorator(func: Callable) -> Callable:
+        store = _CacheStore(ttl, max_entries, max_bytes, size_of)
+        flights = {}
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            flight_key = (id(loop), cache_key)
+            while True:
+                with store.lock:
+                    value = store.lookup(cache_key)
+                    if value is not _MISSING:
+                        return value
+                    future = flights.get(flight_key)
+                    leader = future is None
+                    if leader:
+                        future = flights[flight_key] = loop.create_future()
+                        generation = store.begin(cache_key)
+                    else:
+                        store.coalesced += 1
+                if leader:
+                    break
+                value = await asyncio.shield(future)
+                if value is not _LEADER_CANCELLED:
+                    return value
+                # The leader was cancelled; the waiters elect a new one instead of failing with it
+
+            try:
+                value = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                future.set_result(_LEADER_CANCELLED)
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                future.exception()
+                raise
+            else:
+                with store.lock:
+                    store.put(cache_key, value, generation)
+                future.set_result(value)
+                return value
+            finally:
+                with store.lock:
+                    flights.pop(flight_key, None)
+                    store.end(cache_key)
+
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            with store.lock:
+                value = store.lookup(cache_key)
+                if value is not _MISSING:
+                    return value
+                flight = flights.get(cache_key)
+                leader = flight is None
+                if leader:
+                    flight = flights[cache_key] = _Flight()
+                    generation = store.begin(cache_key)
+                else:
+                    store.coalesced += 1
+            if not leader:
+                flight.event.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+
+            try:
+                flight.result = func(*args, **kwargs)
+                with store.lock:
+                    store.put(cache_key, flight.result, generation)
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with store.lock:
+                    flights.pop(cache_key, None)
+                    store.end(cache_key)
+                flight.event.set()
+
+        def cache_stats() -> CacheStats:
+            """Returns the hit, miss, coalesced, eviction and expiration counters and the current size."""
+            with store.lock:
+                return store.stats()
+
+        def invalidate(*args, **kwargs) -> bool:
+            """Removes the entry of the given call arguments. Returns True if there was one."""
+            cache_key = make_key(*args, **kwargs)
+            with store.lock:
+                return store.invalidate(cache_key)
+
+        def cache_clear() -> None:
+            """Removes all entries."""
+            with store.lock:
+                store.clear()
+
+        wrapper = async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        wrapper.cache_stats = cache_stats
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    if _func is None:
+        return decorator
+    return decorator(_func)
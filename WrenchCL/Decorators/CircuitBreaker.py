@@ -0,0 +1,282 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import asyncio
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Callable, Optional, Tuple, Type
+
+from .Retryable import is_retryable_error
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a function while its circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit '{name}' is open; retry after {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class Circuit:
+    """
+    Thread-safe circuit state shared by every function decorated with it.
+
+    The circuit is closed while the failure rate over the last `window_size` calls stays below `failure_threshold`.
+    Once at least `minimum_calls` outcomes are in the window and the rate reaches the threshold, the circuit opens and
+    calls fail fast with `CircuitOpenError` for `cooldown` seconds. Then it is half-open: up to `half_open_max_calls`
+    trial calls go through; a successful trial closes the circuit and a failed one opens it again.
+
+    Every state change starts a new generation. `before_call` returns the generation a call was admitted in, and
+    outcomes reported with a ticket from an earlier generation are ignored, so a slow call admitted while closed
+    cannot close a half-open circuit or use up its trial slots.
+
+    Attributes:
+        name (str): The name used in log lines and errors.
+        state (str): 'closed', 'open' or 'half_open'.
+    """
+
+    def __init__(self, name: str = 'circuit', failure_threshold: float = 0.5, window_size: int = 20,
+                 minimum_calls: int = 10, cooldown: float = 30.0, half_open_max_calls: int = 1,
+                 failure_exceptions: Optional[Tuple[Type[BaseException], ...]] = None):
+        """
+        Initializes a closed circuit.
+
+        :param name: The name used in log lines and errors.
+        :param failure_threshold: The failure rate (0-1] over the window at which the circuit opens.
+        :param window_size: The number of most recent calls the failure rate is computed over.
+        :param minimum_calls: The number of calls in the window before the failure rate is evaluated.
+        :param cooldown: Seconds the circuit stays open before allowing trial calls.
+        :param half_open_max_calls: The number of concurrent trial calls allowed while half-open.
+        :param failure_exceptions: Exception classes counted as failures. If None, errors classified as transient by
+                                   `is_retryable_error` count as failures and any other exception (e.g. a 404) counts
+                                   as a healthy response from the dependency.
+        """
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1].")
+        if window_size < 1 or minimum_calls < 1 or half_open_max_calls < 1:
+            raise ValueError("window_size, minimum_calls and half_open_max_calls must be positive.")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_exceptions = failure_exceptions
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def failure_rate(self) -> float:
+        """The failure rate over the current window."""
+        with self._lock:
+            return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+    def is_failure(self, error: BaseException) -> bool:
+        """
+        Whether an exception counts against the dependency's health.
+
+        :param error: The exception raised by the protected call.
+        :returns: True if it is a failure.
+        """
+        if self.failure_exceptions is not None:
+            return isinstance(error, self.failure_exceptions)
+        return is_retryable_error(error)
+
+    def before_call(self) -> int:
+        """
+        Admits a call, or raises CircuitOpenError while the circuit is open or its trial calls are taken.
+
+        :returns: The admission ticket to pass to `record_success`, `record_failure` or `release`.
+        :raises CircuitOpenError: If the call is rejected.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, remaining)
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._trial_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._trial_calls += 1
+            return self._generation
+
+    def record_success(self, ticket: Optional[int] = None) -> None:
+        """
+        Records a successful call.
+
+        :param ticket: The ticket returned by `before_call`. Outcomes of an earlier generation are ignored.
+        """
+        with self._lock:
+            if self._is_stale(ticket):
+                return
+            if self.state == HALF_OPEN:
+                self._transition(CLOSED)
+            self._outcomes.append(True)
+
+    def record_failure(self, ticket: Optional[int] = None) -> None:
+        """
+        Records a failed call, opening the circuit if the failure rate reaches the threshold.
+
+        :param ticket: The ticket returned by `before_call`. Outcomes of an earlier generation are ignored.
+        """
+        with self._lock:
+            if self._is_stale(ticket):
+                return
+            if self.state == HALF_OPEN:
+                self._transition(OPEN)
+                return
+            self._outcomes.append(False)
+            if self.state == CLOSED and len(self._outcomes) >= self.minimum_calls:
+                rate = self._outcomes.count(False) / len(self._outcomes)
+                if rate >= self.failure_threshold:
+                    self._transition(OPEN)
+
+    def release(self, ticket: Optional[int] = None) -> None:
+        """
+        Releases an admitted call without recording an outcome, e.g. when it was cancelled.
+
+        :param ticket: The ticket returned by `before_call`. Calls of an earlier generation hold no trial slot.
+        """
+        with self._lock:
+            if self._is_stale(ticket):
+                return
+            if self.state == HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def reset(self) -> None:
+        """Closes the circuit and clears the window."""
+        with self._lock:
+            self._transition(CLOSED)
+            self._generation += 1
+            self._outcomes.clear()
+
+    def _is_stale(self, ticket: Optional[int]) -> bool:
+        return ticket is not None and ticket != self._generation
+
+    def _transition(self, state: str) -> None:
+        from ..Tools import logger
+
+        if state == self.state:
+            return
+        self._generation += 1
+        self._trial_calls = 0
+        previous, self.state = self.state, state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            logger.warning(f"Circuit '{self.name}' {previous} -> open; failing fast for {self.cooldown:.1f}s")
+        else:
+            if state == CLOSED:
+                self._outcomes.clear()
+            logger.info(f"Circuit '{self.name}' {previous} -> {state}")
+
+
+def CircuitBreaker(_func=None, *, circuit: Optional[Circuit] = None, name: Optional[str] = None,
+                   failure_threshold: float = 0.5, window_size: int = 20, minimum_calls: int = 10,
+                   cooldown: float = 30.0, half_open_max_calls: int = 1,
+                   failure_exceptions: Optional[Tuple[Type[BaseException], ...]] = None) -> Callable:
+    """
+    A decorator that stops calling an unhealthy dependency and fails fast with `CircuitOpenError` instead.
+
+    Works on sync and async functions. Pass the same `circuit` to several functions that talk to one dependency so
+    they share its health. Placed below `Retryable`, every attempt is counted and the retry loop stops as soon as the
+    circuit opens, because `CircuitOpenError` is not a retryable error. The circuit is available as the wrapper's
+    `circuit` attribute.
+
+    :param circuit: An existing circuit to share. If None, a new circuit is created from the remaining arguments.
+    :type circuit: Circuit, optional
+    :param name: The circuit name used in logs. Defaults to the function's qualified name.
+    :type name: str, optional
+    :param failure_threshold: The failure rate (0-1] over the window at which the circuit opens.
+    :type failure_threshold: float
+    :param window_size: The number of most recent calls the failure rate is computed over.
+    :type window_size: int
+    :param minimum_calls: The number of calls in the window before the failure rate is evaluated.
+    :type minimum_calls: int
+    :param cooldown: Seconds the circuit stays open before allowing trial calls.
+    :type cooldown: float
+    :param half_open_max_calls: The number of concurrent trial calls allowed while half-open.
+    :type half_open_max_calls: int
+    :param failure_exceptions: Exception classes counted as failures. If None, transient errors (throttling, 5xx,
+                               connection errors) count as failures.
+    :type failure_exceptions: tuple, optional
+    :returns: The decorated function.
+    :rtype: Callable
+
+    **Example**::
+
+        >>> rds_circuit = Circuit('rds', cooldown=60)
+        >>>
+        >>> @Retryable()
+        ... @CircuitBreaker(circuit=rds_circuit)
+        ... def fetch_rows(query):
+        ...     ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        breaker = circuit or Circuit(name or func.__qualname__, failure_threshold=failure_threshold,
+                                     window_size=window_size, minimum_calls=minimum_calls, cooldown=cooldown,
+                                     half_open_max_calls=half_open_max_calls, failure_exceptions=failure_exceptions)
+
+        def record_error(error: BaseException, ticket: int) -> None:
+            if breaker.is_failure(error):
+                breaker.record_failure(ticket)
+            else:
+                breaker.record_success(ticket)
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            ticket = breaker.before_call()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                record_error(e, ticket)
+                raise
+            except BaseException:
+                breaker.release(ticket)
+                raise
+            breaker.record_success(ticket)
+            return result
+
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            ticket = breaker.before_call()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                record_error(e, ticket)
+                raise
+            except BaseException:
+                breaker.release(ticket)
+                raise
+            breaker.record_success(ticket)
+            return result
+
+        wrapper = async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        wrapper.circuit = breaker
+        return wrapper
+
+    if _func is None:
+        return decorator
+    return decorator(_func)
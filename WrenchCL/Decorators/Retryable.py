@@ -1,34 +1,181 @@
 import asyncio
+import random
+import threading
 import time
 from functools import wraps
 from json import JSONDecodeError
+from typing import Optional, Union
 
+import psycopg2
 import requests
-from botocore.exceptions import ClientError, BotoCoreError
+from botocore.exceptions import (ClientError, BotoCoreError, ConnectionError as BotoConnectionError, HTTPClientError,
+                                 IncompleteReadError, ResponseStreamingError)
 
-def Retryable(_func=None, *, max_retries=5, retry_on_exceptions=None, delay=2, verbose=False):
+BACKOFF_STRATEGIES = ('constant', 'exponential', 'decorrelated')
+
+THROTTLING_ERROR_CODES = frozenset({
+    'Throttling', 'ThrottlingException', 'ThrottledException', 'RequestThrottledException', 'RequestThrottled',
+    'TooManyRequestsException', 'ProvisionedThroughputExceededException', 'TransactionInProgressException',
+    'RequestLimitExceeded', 'BandwidthLimitExceeded', 'LimitExceededException', 'SlowDown',
+    'PriorRequestNotComplete', 'EC2ThrottledException',
+})
+TRANSIENT_ERROR_CODES = frozenset({
+    'RequestTimeout', 'RequestTimeoutException', 'InternalError', 'InternalFailure', 'ServiceUnavailable',
+    'ServiceUnavailableException', 'InternalServerError', 'InternalServerException',
+})
+# SQLSTATE classes: connection exception, transaction rollback (serialization failure, deadlock), insufficient
+# resources and operator intervention (e.g. admin shutdown).
+RETRYABLE_PGCODE_PREFIXES = ('08', '40', '53', '57P')
+
+
+class RetryBudget:
+    """
+    Token bucket limiting how many retries a group of callers may make, to stop retry storms during an outage.
+
+    Every retry takes `retry_cost` tokens and is refused once the bucket is empty; tokens come back at `refill_rate`
+    per second and with every successful call. While a dependency is healthy retries are rare and the bucket stays
+    full; when it is failing for everyone, the bucket drains and callers fail fast instead of multiplying the load.
+
+    Attributes:
+        capacity (float): The maximum number of tokens.
+        refill_rate (float): Tokens added per second.
+        retry_cost (float): Tokens taken by one retry.
+        success_credit (float): Tokens returned by one successful call.
+    """
+
+    def __init__(self, capacity: float = 50.0, refill_rate: float = 1.0, retry_cost: float = 1.0,
+                 success_credit: float = 0.1):
+        """
+        Initializes a full retry budget.
+
+        :param capacity: The maximum number of tokens.
+        :param refill_rate: Tokens added per second.
+        :param retry_cost: Tokens taken by one retry.
+        :param success_credit: Tokens returned by one successful call.
+        """
+        if capacity <= 0 or retry_cost <= 0:
+            raise ValueError("capacity and retry_cost must be positive.")
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.retry_cost = retry_cost
+        self.success_credit = success_credit
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def acquire(self) -> bool:
+        """
+        Takes the tokens for one retry.
+
+        :returns: True if the retry may proceed, False if the budget is exhausted.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < self.retry_cost:
+                return False
+            self._tokens -= self.retry_cost
+            return True
+
+    def record_success(self) -> None:
+        """Returns `success_credit` tokens after a successful call."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.success_credit)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+
+# Opt-in budget shared by every function decorated with retry_budget='shared'.
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Classifies an exception as transient (worth retrying) or fatal.
+
+    Retryable: AWS throttling and transient error codes, HTTP 429 and 5xx responses, botocore connection, timeout and
+    truncated-stream errors, psycopg2 connection errors, serialization failures and deadlocks, requests connection
+    errors and timeouts, and builtin ConnectionError/TimeoutError. Everything else, e.g. 403/404 ClientErrors,
+    parameter validation errors, SQL syntax or integrity errors and ValueErrors, is fatal.
+
+    :param error: The exception to classify.
+    :type error: BaseException
+    :returns: True if the call that raised it may succeed when retried.
+    :rtype: bool
     """
-    A decorator that retries a function call a specified number of times if it raises an exception or if the request status code is not 200.
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code', '')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode') or 0
+        return code in THROTTLING_ERROR_CODES or code in TRANSIENT_ERROR_CODES or status == 429 or status >= 500
+    if isinstance(error, BotoCoreError):
+        return isinstance(error, (BotoConnectionError, HTTPClientError, IncompleteReadError, ResponseStreamingError))
+    if isinstance(error, psycopg2.Error):
+        if error.pgcode:
+            return error.pgcode.startswith(RETRYABLE_PGCODE_PREFIXES)
+        return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError))
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = error.response.status_code if error.response is not None else 0
+        return status == 429 or status >= 500 or error.response is None
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                          requests.exceptions.ChunkedEncodingError, JSONDecodeError)):
+        return True
+    return isinstance(error, (ConnectionError, TimeoutError))
 
-    This decorator catches `JSONDecodeError`, specific `requests` exceptions, `botocore` exceptions, and general `Exception` during the function execution,
-    retries the function up to `max_retries` times, and logs warnings and errors based on verbosity. If the maximum number of retries is reached,
-    it raises the last caught exception.
 
-    :param max_retries: The maximum number of retries before giving up. Default is 5.
+def Retryable(_func=None, *, max_retries=5, retry_on_exceptions=None, delay=2, verbose=False, backoff='exponential',
+              max_delay=30.0, deadline: Optional[float] = None,
+              retry_budget: Optional[Union[RetryBudget, str]] = 'function'):
+    """
+    A decorator that retries a function call a specified number of times if it raises a transient exception or if the request status code is not 200.
+
+    By default only errors classified as transient by `is_retryable_error` are retried (throttling, 5xx, connection
+    resets and timeouts from botocore, psycopg2 and requests); fatal errors such as a 404 `ClientError` or a
+    `ValueError` are raised immediately. Earlier versions retried every exception; pass
+    ``retry_on_exceptions=(Exception,)`` to keep that behaviour. Sleeps between attempts follow the `backoff`
+    strategy, so a fleet of callers does not retry in lockstep, and are non-blocking (`asyncio.sleep`) for coroutine
+    functions. Retries stop once `max_retries` attempts were made, once the `deadline` has passed, or when the
+    `retry_budget` is exhausted; the last caught exception is then raised.
+
+    :param max_retries: The maximum number of attempts before giving up. Default is 5.
     :type max_retries: int
-    :param retry_on_exceptions: A tuple of exception classes to retry on. If None, retries on all exceptions.
+    :param retry_on_exceptions: A tuple of exception classes to retry on. If None, retries on errors classified as transient.
     :type retry_on_exceptions: tuple
-    :param delay: The delay in seconds between retries. Default is 2.
-    :type delay: int
+    :param delay: The base delay in seconds between retries. Default is 2.
+    :type delay: float
     :param verbose: If True, logs warnings and errors; if False, logs only errors.
     :type verbose: bool
+    :param backoff: 'exponential' (full jitter: uniform between 0 and delay * 2 ** attempt), 'decorrelated'
+                    (uniform between delay and three times the previous sleep) or 'constant' (always `delay`).
+    :type backoff: str
+    :param max_delay: The upper bound in seconds of a single sleep.
+    :type max_delay: float
+    :param deadline: The total seconds after which no further attempt is started. Sleeps are shortened to the time
+                     left, but a running attempt is never interrupted, so the call can outlast the deadline by the
+                     duration of its last attempt. None means no deadline.
+    :type deadline: float, optional
+    :param retry_budget: The token bucket limiting retries. 'function' (the default) gives every decorated function
+                         its own budget, so an outage of one dependency cannot starve retries of another. 'shared'
+                         uses the process-wide `DEFAULT_RETRY_BUDGET`, a RetryBudget instance is shared by every
+                         function it is passed to, and None disables the budget.
+    :type retry_budget: Union[RetryBudget, str], optional
 
     :return: The result of the decorated function, if it succeeds within the allowed retries.
     """
     from ..Tools import logger
 
-    if retry_on_exceptions is None:
-        retry_on_exceptions = (Exception,)
+    if backoff not in BACKOFF_STRATEGIES:
+        raise ValueError(f"Unsupported backoff: {backoff}. Use one of {BACKOFF_STRATEGIES}.")
+    if isinstance(retry_budget, str) and retry_budget not in ('function', 'shared'):
+        raise ValueError(f"Unsupported retry_budget: {retry_budget}. Use 'function', 'shared', a RetryBudget or None.")
 
     def log_message(level, message):
         if verbose:
@@ -40,78 +187,90 @@ def Retryable(_func=None, *, max_retries=5, retry_on_exceptions=None, delay=2, v
             if level == "error":
                 logger.error(message)
 
+    def should_retry(error):
+        if retry_on_exceptions is not None:
+            return isinstance(error, retry_on_exceptions)
+        return is_retryable_error(error)
+
+    def next_delay(attempt, previous_delay):
+        if backoff == 'constant':
+            return delay
+        if backoff == 'exponential':
+            return random.uniform(0, min(max_delay, delay * 2 ** attempt))
+        return min(max_delay, random.uniform(delay, max(delay, previous_delay * 3)))
+
+    def plan_retry(error, attempt, previous_delay, started, budget):
+        """Returns the seconds to sleep before the next attempt, or None to give up."""
+        if not should_retry(error):
+            logger.debug(f"Not retrying non-retryable error: {error!r}")
+            return None
+        if attempt + 1 >= max_retries:
+            log_message("error", f"Failed after {max_retries} retries with error: {error}")
+            return None
+        sleep = next_delay(attempt, previous_delay)
+        if deadline is not None:
+            remaining = deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                log_message("error", f"Retry deadline of {deadline}s reached after {attempt + 1} attempts with error: {error}")
+                return None
+            sleep = min(sleep, remaining)
+        if budget is not None and not budget.acquire():
+            log_message("error", f"Retry budget exhausted after {attempt + 1} attempts with error: {error}")
+            return None
+        log_message("warning", f"Retry {attempt + 1}/{max_retries} in {sleep:.2f}s failed with error: {error}")
+        return sleep
+
+    def check_response(response):
+        if hasattr(response, 'status_code') and response.status_code != 200:
+            response.raise_for_status()
+
     def decorator_retry(func):
+        if retry_budget == 'function':
+            budget = RetryBudget()
+        elif retry_budget == 'shared':
+            budget = DEFAULT_RETRY_BUDGET
+        else:
+            budget = retry_budget
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            retry_count = 0
-            while retry_count < max_retries:
+            started = time.monotonic()
+            sleep = delay
+            attempt = 0
+            while True:
                 try:
                     response = await func(*args, **kwargs)
-                    if hasattr(response, 'status_code') and response.status_code != 200:
-                        response.raise_for_status()
-                    return response
-                except (JSONDecodeError, requests.exceptions.HTTPError, requests.exceptions.ConnectionError,
-                        requests.exceptions.Timeout, requests.exceptions.RequestException, ClientError,
-                        BotoCoreError) as e:
-                    if retry_count + 1 < max_retries:
-                        log_message("warning", f"Retry {retry_count + 1}/{max_retries} failed with error: {e}")
-                        retry_count += 1
-                        await asyncio.sleep(delay)
-                    else:
-                        log_message("error", f"Failed after {max_retries} retries with error: {e}")
-                        raise e
-                except retry_on_exceptions as e:
-                    if retry_count + 1 < max_retries:
-                        log_message("warning", f"Retry {retry_count + 1}/{max_retries} failed with error: {e}")
-                        retry_count += 1
-                        await asyncio.sleep(delay)
-                    else:
-                        log_message("error", f"Failed after {max_retries} retries with error: {e}")
-                        raise e
+                    check_response(response)
                 except Exception as e:
-                    if retry_count + 1 < max_retries:
-                        log_message("warning", f"Retry {retry_count + 1}/{max_retries} failed with unhandled error: {e}")
-                        retry_count += 1
-                        await asyncio.sleep(delay)
-                    else:
-                        log_message("error", f"Failed after {max_retries} retries with unhandled error: {e}")
-                        raise e
+                    sleep = plan_retry(e, attempt, sleep, started, budget)
+                    if sleep is None:
+                        raise
+                    attempt += 1
+                    await asyncio.sleep(sleep)
+                    continue
+                if budget is not None:
+                    budget.record_success()
+                return response
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            retry_count = 0
-            while retry_count < max_retries:
+            started = time.monotonic()
+            sleep = delay
+            attempt = 0
+            while True:
                 try:
                     response = func(*args, **kwargs)
-                    if hasattr(response, 'status_code') and response.status_code != 200:
-                        response.raise_for_status()
-                    return response
-                except (JSONDecodeError, requests.exceptions.HTTPError, requests.exceptions.ConnectionError,
-                        requests.exceptions.Timeout, requests.exceptions.RequestException, ClientError,
-                        BotoCoreError) as e:
-                    if retry_count + 1 < max_retries:
-                        log_message("warning", f"Retry {retry_count + 1}/{max_retries} failed with error: {e}")
-                        retry_count += 1
-                        time.sleep(delay)
-                    else:
-                        log_message("error", f"Failed after {max_retries} retries with error: {e}")
-                        raise e
-                except retry_on_exceptions as e:
-                    if retry_count + 1 < max_retries:
-                        log_message("warning", f"Retry {retry_count + 1}/{max_retries} failed with error: {e}")
-                        retry_count += 1
-                        time.sleep(delay)
-                    else:
-                        log_message("error", f"Failed after {max_retries} retries with error: {e}")
-                        raise e
+                    check_response(response)
                 except Exception as e:
-                    if retry_count + 1 < max_retries:
-                        log_message("warning", f"Retry {retry_count + 1}/{max_retries} failed with unhandled error: {e}")
-                        retry_count += 1
-                        time.sleep(delay)
-                    else:
-                        log_message("error", f"Failed after {max_retries} retries with unhandled error: {e}")
-                        raise e
+                    sleep = plan_retry(e, attempt, sleep, started, budget)
+                    if sleep is None:
+                        raise
+                    attempt += 1
+                    time.sleep(sleep)
+                    continue
+                if budget is not None:
+                    budget.record_success()
+                return response
 
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -4,5 +4,7 @@ from .Retryable import *
 from .SingletonClass import *
 from .TimedMethod import *
 from .Synchronized import *
+from .CircuitBreaker import *
+from .Cached import *
 
-__all__ = ['Retryable', 'SingletonClass', 'TimedMethod', 'Synchronized']
+__all__ = ['Retryable', 'SingletonClass', 'TimedMethod', 'Synchronized', 'CircuitBreaker', 'Cached']
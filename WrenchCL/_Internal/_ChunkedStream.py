@@ -0,0 +1,370 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+
+import binascii
+import bz2
+import io
+import time
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+_COMPRESSION_SUFFIXES = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.zst': 'zstd',
+    '.zstd': 'zstd',
+}
+
+
+def _detect_compression(object_key: str, content_encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Infers the compression codec of an object from its Content-Encoding header or its key suffix.
+
+    :param object_key: The key (or path) of the object.
+    :param content_encoding: The Content-Encoding header of the object, if known.
+    :returns: 'gzip', 'bz2', 'zstd' or None if the object does not look compressed.
+    """
+    if content_encoding:
+        encoding = content_encoding.lower()
+        if encoding in ('gzip', 'x-gzip'):
+            return 'gzip'
+        if encoding in ('zstd', 'bz2'):
+            return encoding
+    for suffix, codec in _COMPRESSION_SUFFIXES.items():
+        if object_key.lower().endswith(suffix):
+            return codec
+    return None
+
+
+def _new_decompressor(compression: str):
+    """Creates an incremental decompressor object for the given codec."""
+    if compression == 'gzip':
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    if compression == 'bz2':
+        return bz2.BZ2Decompressor()
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("The 'zstandard' package is required for zstd decompression.")
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def _new_compressor(compression: str, level: Optional[int] = None):
+    """Creates an incremental compressor object for the given codec."""
+    if compression == 'gzip':
+        return zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("The 'zstandard' package is required for zstd compression.")
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    raise ValueError(f"Unsupported compression: {compression}. Use 'gzip' or 'zstd'.")
+
+
+def _compress_chunks(chunks: Iterable[bytes], compression: str, level: Optional[int] = None,
+                     stats: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """
+    Compresses a stream of byte chunks on the fly.
+
+    :param chunks: An iterable of uncompressed byte chunks.
+    :param compression: 'gzip' or 'zstd'.
+    :param level: The compression level, or None for the codec default.
+    :param stats: Optional dict that receives bytes_in, bytes_out and the cpu_seconds spent compressing.
+    :returns: An iterator of compressed byte chunks.
+    """
+    compressor = _new_compressor(compression, level)
+    stats = {} if stats is None else stats
+    stats.update(bytes_in=0, bytes_out=0, cpu_seconds=0.0)
+    for chunk in chunks:
+        start = time.thread_time()
+        data = compressor.compress(chunk)
+        stats['cpu_seconds'] += time.thread_time() - start
+        stats['bytes_in'] += len(chunk)
+        if data:
+            stats['bytes_out'] += len(data)
+            yield data
+    start = time.thread_time()
+    tail = compressor.flush()
+    stats['cpu_seconds'] += time.thread_time() - start
+    if tail:
+        stats['bytes_out'] += len(tail)
+        yield tail
+
+
+def _decompress_chunks(chunks: Iterable[bytes], compression: Optional[str],
+                       stats: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """
+    Decompresses a stream of byte chunks on the fly. Concatenated members (e.g. multi-member gzip files) are
+    decompressed back to back.
+
+    :param chunks: An iterable of compressed byte chunks.
+    :param compression: 'gzip', 'bz2', 'zstd' or None to pass chunks through unchanged.
+    :param stats: Optional dict that receives bytes_in, bytes_out and the cpu_seconds spent decompressing.
+    :returns: An iterator of decompressed byte chunks.
+    :raises EOFError: If the stream ends in the middle of a compressed member.
+    """
+    if compression is None:
+        yield from chunks
+        return
+
+    decompressor = _new_decompressor(compression)
+    in_member = False
+    stats = {} if stats is None else stats
+    stats.update(bytes_in=0, bytes_out=0, cpu_seconds=0.0)
+    for chunk in chunks:
+        stats['bytes_in'] += len(chunk)
+        while chunk:
+            in_member = True
+            start = time.thread_time()
+            data = decompressor.decompress(chunk)
+            stats['cpu_seconds'] += time.thread_time() - start
+            if data:
+                stats['bytes_out'] += len(data)
+                yield data
+            if not getattr(decompressor, 'eof', False):
+                break
+            chunk = decompressor.unused_data
+            decompressor = _new_decompressor(compression)
+            in_member = False
+    if hasattr(decompressor, 'flush'):
+        tail = decompressor.flush()
+        if tail:
+            stats['bytes_out'] += len(tail)
+            yield tail
+    if in_member and not decompressor.eof:
+        raise EOFError(f"The {compression} stream ended before the end-of-stream marker was reached.")
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Splits a stream of byte chunks into lines, keeping line endings. Lines spanning chunk boundaries are joined.
+
+    :param chunks: An iterable of byte chunks.
+    :returns: An iterator of lines as bytes.
+    """
+    pending = b''
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(keepends=True)
+        if not lines:
+            continue
+        pending = b'' if lines[-1].endswith((b'\n', b'\r')) else lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _b64decode_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Decodes a stream of base64 chunks incrementally. Whitespace and line breaks are ignored, and groups of four
+    characters split across chunk boundaries are carried over to the next chunk.
+
+    :param chunks: An iterable of base64 encoded byte chunks.
+    :returns: An iterator of decoded byte chunks.
+    :raises ValueError: If the stream contains characters outside the base64 alphabet or is truncated.
+    """
+    pending = b''
+    for chunk in chunks:
+        data = pending + bytes(chunk).translate(None, b' \t\r\n')
+        usable = len(data) - len(data) % 4
+        pending = data[usable:]
+        if usable:
+            yield _b64decode_strict(data[:usable])
+    if pending:
+        raise ValueError("The base64 payload is truncated.")
+
+
+def _b64decode_strict(data: bytes) -> bytes:
+    """Decodes base64 data, rejecting characters outside the alphabet instead of silently dropping them."""
+    try:
+        return binascii.a2b_base64(data, strict_mode=True)
+    except binascii.Error as e:
+        raise ValueError(f"The payload is not valid base64: {e}") from e
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    Seekable, read-only file-like view over a bytes-like object such as bytes, bytearray, memoryview or mmap. The
+    buffer is never copied as a whole; each read only copies the slice it returns.
+    """
+
+    def __init__(self, buffer):
+        """
+        Initializes the reader over the given buffer.
+
+        :param buffer: Any object supporting the buffer protocol.
+        """
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return self._view.nbytes
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        data = self._view[self._position:end].tobytes()
+        self._position = max(end, self._position)
+        return data
+
+    def readinto(self, buffer) -> int:
+        end = min(self._position + len(buffer), len(self._view))
+        count = max(end - self._position, 0)
+        buffer[:count] = self._view[self._position:end]
+        self._position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class _ChunkedStreamReader(io.RawIOBase):
+    """
+    Read-only, file-like adapter over an iterator of byte chunks. Only the chunk currently being consumed is held in
+    memory, which makes it suitable for feeding large S3 bodies into consumers that expect ``read(size)``, such as
+    ``cursor.copy_expert``, ``io.TextIOWrapper`` or ``pandas.read_csv``. Iterating the reader yields lines.
+
+    Attributes:
+        bytes_read (int): The number of bytes handed out to the consumer so far.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        Initializes the reader over the given chunk iterable.
+
+        :param chunks: An iterable of byte chunks.
+        :type chunks: Iterable[bytes]
+        """
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self._exhausted = False
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self, size: int) -> None:
+        """Pulls chunks into the buffer until it holds at least `size` bytes or the source is exhausted."""
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                self._exhausted = True
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads up to `size` bytes, or everything that remains if `size` is negative.
+
+        :param size: The maximum number of bytes to return.
+        :type size: int
+        :returns: The bytes read; an empty bytes object signals the end of the stream.
+        :rtype: bytes
+        """
+        if size is None:
+            size = -1
+        self._fill(size)
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        self.bytes_read += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        """Reads up to `size` bytes, pulling at most one new chunk from the source."""
+        if not self._buffer:
+            self._fill(1)
+        return self.read(len(self._buffer) if size is None or size < 0 else min(size, len(self._buffer)))
+
+    def readinto(self, buffer) -> int:
+        data = self.read1(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readline(self, size: int = -1) -> bytes:
+        """
+        Reads a single line, including its line ending.
+
+        :param size: The maximum number of bytes to return.
+        :type size: int
+        :returns: The line read; an empty bytes object signals the end of the stream.
+        :rtype: bytes
+        """
+        searched = 0
+        while True:
+            newline = self._buffer.find(b'\n', searched)
+            if newline >= 0 or self._exhausted:
+                break
+            searched = len(self._buffer)
+            self._fill(searched + 1)
+        end = len(self._buffer) if newline < 0 else newline + 1
+        if size is not None and 0 <= size < end:
+            end = size
+        return self.read(end)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def close(self) -> None:
+        """Releases the buffered data and closes the underlying chunk source if it supports closing."""
+        if not self.closed:
+            self._buffer.clear()
+            self._exhausted = True
+            close = getattr(self._chunks, 'close', None)
+            if callable(close):
+                close()
+        super().close()
@@ -0,0 +1,206 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import base64
+import hashlib
+import io
+import math
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from awscrt import checksums as crt_checksums
+    CRC32C_AVAILABLE = True
+except ImportError:
+    crt_checksums = None
+    CRC32C_AVAILABLE = False
+
+MB = 1024 * 1024
+_READ_SIZE = MB
+
+
+def _digest_file(path: str, part_sizes: Iterable[Optional[int]] = ()) -> Tuple[Dict[Optional[int], str], str]:
+    """
+    Reads a file once and computes the ETag S3 would report for each upload layout in `part_sizes`, together with the
+    SHA-256 of the file. A part size of None stands for a single PUT.
+
+    :param path: The local file path.
+    :param part_sizes: The layouts to compute ETags for, as multipart part sizes or None.
+    :returns: The ETags without quotes keyed by part size (e.g. '9b2cf535f27731c974343645a3985328' or '...-4'), and the
+              hex SHA-256 of the file.
+    """
+    layouts = {part_size: [hashlib.md5(), 0, []] for part_size in part_sizes}
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_READ_SIZE), b''):
+            sha256.update(block)
+            view = memoryview(block)
+            for part_size, layout in layouts.items():
+                if part_size is None:
+                    layout[0].update(view)
+                    continue
+                offset = 0
+                while offset < len(view):
+                    take = min(part_size - layout[1], len(view) - offset)
+                    layout[0].update(view[offset:offset + take])
+                    layout[1] += take
+                    offset += take
+                    if layout[1] == part_size:
+                        layout[2].append(layout[0].digest())
+                        layout[0], layout[1] = hashlib.md5(), 0
+
+    etags = {}
+    for part_size, (part, filled, part_digests) in layouts.items():
+        if part_size is None:
+            etags[part_size] = part.hexdigest()
+            continue
+        if filled or not part_digests:
+            part_digests.append(part.digest())
+        etags[part_size] = f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+    return etags, sha256.hexdigest()
+
+
+def _candidate_part_sizes(size: int, part_count: int, preferred: int) -> List[int]:
+    """
+    Lists the part sizes that split `size` bytes into exactly `part_count` parts, most likely first: the preferred
+    size, its doublings (as applied by s3transfer above 10,000 parts) and the smallest whole MiB size.
+    """
+    candidates = [preferred * 2 ** i for i in range(8)] + [math.ceil(size / part_count / MB) * MB,
+                                                           math.ceil(size / part_count)]
+    result = []
+    for part_size in candidates:
+        if part_size > 0 and math.ceil(size / part_size) == part_count and part_size not in result:
+            result.append(part_size)
+    return result
+
+
+def _matches_etag(path: str, size: int, etag: str, preferred_part_size: int) -> Tuple[bool, str]:
+    """
+    Checks a local file against an S3 ETag, inferring the multipart layout from the part count in the ETag. All
+    candidate layouts and the SHA-256 are computed in a single read of the file.
+
+    :returns: Whether the file reproduces the ETag, and the hex SHA-256 of the file. The match is False if the file
+              differs, or if the ETag is not MD5 based (e.g. SSE-KMS) or was produced with an unrecognised part layout.
+    """
+    etag = etag.strip('"')
+    count = etag.partition('-')[2]
+    if '-' not in etag:
+        part_sizes = [None]
+    elif count.isdigit():
+        part_sizes = _candidate_part_sizes(size, int(count), preferred_part_size)
+    else:
+        part_sizes = []
+    etags, sha256 = _digest_file(path, part_sizes)
+    return etag in etags.values(), sha256
+
+
+class _StreamingDigest:
+    """
+    Incremental MD5, SHA-256, CRC32 or CRC32C digest over streamed chunks. CRC32C requires the optional `awscrt`
+    package, which also backs botocore's own CRC32C support.
+    """
+
+    ALGORITHMS = ('md5', 'sha256', 'crc32', 'crc32c')
+
+    def __init__(self, algorithm: str):
+        """
+        Initializes the digest.
+
+        :param algorithm: 'md5', 'sha256', 'crc32' or 'crc32c'.
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported checksum: {algorithm}. Use one of {', '.join(self.ALGORITHMS)}.")
+        if algorithm == 'crc32c' and not CRC32C_AVAILABLE:
+            raise ImportError("The 'awscrt' package is required for crc32c checksums.")
+        self.algorithm = algorithm
+        self._hash = hashlib.new(algorithm) if algorithm in ('md5', 'sha256') else None
+        self._crc = 0
+
+    @property
+    def s3_algorithm(self) -> Optional[str]:
+        """The matching S3 ChecksumAlgorithm, or None for MD5, which S3 exposes through the ETag instead."""
+        return None if self.algorithm == 'md5' else self.algorithm.upper()
+
+    def update(self, data) -> None:
+        if self._hash is not None:
+            self._hash.update(data)
+        elif self.algorithm == 'crc32':
+            self._crc = zlib.crc32(data, self._crc)
+        else:
+            self._crc = crt_checksums.crc32c(data, self._crc)
+
+    def digest(self) -> bytes:
+        return self._hash.digest() if self._hash is not None else self._crc.to_bytes(4, 'big')
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def b64digest(self) -> str:
+        """The digest in the base64 form used by S3 checksum headers."""
+        return base64.b64encode(self.digest()).decode('ascii')
+
+
+class _DigestingReader(io.RawIOBase):
+    """
+    File-like wrapper that feeds every byte read from a stream into a digest exactly once. Re-reads after seeking
+    back, such as request retries, are not counted twice; skipping ahead of the digested data invalidates it.
+    """
+
+    def __init__(self, stream, digest: _StreamingDigest):
+        """
+        Initializes the reader.
+
+        :param stream: The binary stream to wrap, read from its current position.
+        :param digest: The digest to update.
+        """
+        super().__init__()
+        self._stream = stream
+        self.digest = digest
+        self._seekable = bool(getattr(stream, 'seekable', lambda: False)())
+        self._start = stream.tell() if self._seekable else 0
+        self._position = self._start
+        self._digested_to = self._start
+        self.complete = True
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._seekable
+
+    def _account(self, data) -> None:
+        end = self._position + len(data)
+        if self._position > self._digested_to:
+            self.complete = False
+        elif end > self._digested_to:
+            self.digest.update(memoryview(data)[self._digested_to - self._position:])
+            self._digested_to = end
+        self._position = end
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(-1 if size is None else size)
+        self._account(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._position = self._stream.seek(offset, whence)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
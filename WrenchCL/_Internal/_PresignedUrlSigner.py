@@ -0,0 +1,139 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+MAX_PRESIGN_EXPIRATION = 7 * 24 * 3600
+
+
+class _PresignedUrlSigner:
+    """
+    Generates SigV4 presigned GET URLs for S3 locally, without any request or botocore event machinery.
+
+    The derived signing key depends only on the secret key, date and region, so it is computed once per day and
+    reused for every URL. Generated URLs are kept in a bounded LRU cache and handed out again while they remain valid
+    for at least the requested minimum, which makes repeated link generation for the same objects nearly free.
+
+    AWS buckets are addressed through the regional virtual host, ``bucket.s3.<region>.amazonaws.com``. URLs match
+    botocore's s3v4 presigner only when botocore signs for that same host; its us-east-1 default is the global
+    ``bucket.s3.amazonaws.com``, which yields a different, equally valid signature.
+    """
+
+    def __init__(self, credentials, region_name: str, endpoint_url: Optional[str] = None, max_entries: int = 100_000):
+        """
+        Initializes the signer.
+
+        :param credentials: botocore credentials; refreshable credentials are frozen once per batch.
+        :param region_name: The region of the buckets to sign for.
+        :param endpoint_url: The client endpoint. AWS endpoints use virtual-hosted URLs, others use path-style URLs.
+        :param max_entries: The maximum number of URLs kept in the cache.
+        """
+        self.credentials = credentials
+        self.region_name = region_name or 'us-east-1'
+        endpoint = urlsplit(endpoint_url or f"https://s3.{self.region_name}.amazonaws.com")
+        self._scheme = endpoint.scheme
+        self._netloc = endpoint.netloc
+        self._virtual_hosted = endpoint.netloc.endswith('amazonaws.com')
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[Tuple[str, str, int, str], Tuple[str, float]]' = OrderedDict()
+        self._signing_key: Tuple[Optional[tuple], bytes] = (None, b'')
+        self._lock = threading.Lock()
+
+    def _get_signing_key(self, secret_key: str, date_stamp: str) -> bytes:
+        """Returns the SigV4 signing key for the day, deriving it only when the day or secret changes."""
+        scope = (secret_key, date_stamp)
+        cached_scope, key = self._signing_key
+        if cached_scope != scope:
+            key = hmac.digest(('AWS4' + secret_key).encode('utf-8'), date_stamp.encode('utf-8'), 'sha256')
+            for part in (self.region_name, 's3', 'aws4_request'):
+                key = hmac.digest(key, part.encode('utf-8'), 'sha256')
+            self._signing_key = (scope, key)
+        return key
+
+    def _location(self, bucket_name: str) -> Tuple[str, str]:
+        """Returns the host and path prefix for a bucket."""
+        if self._virtual_hosted and '.' not in bucket_name and bucket_name == bucket_name.lower():
+            return f"{bucket_name}.s3.{self.region_name}.amazonaws.com", ''
+        return self._netloc, '/' + quote(bucket_name, safe='')
+
+    def sign(self, bucket_name: str, object_keys: Iterable[str], expiration_seconds: int = 3600,
+             min_validity: float = 60.0) -> Dict[str, str]:
+        """
+        Signs GET URLs for many keys of one bucket.
+
+        :param bucket_name: The name of the S3 bucket.
+        :param object_keys: The keys to sign.
+        :param expiration_seconds: The validity of newly signed URLs in seconds, at most seven days.
+        :param min_validity: The minimum remaining validity in seconds of a cached URL for it to be reused.
+        :returns: A mapping of object key to presigned URL.
+        """
+        if not 0 < expiration_seconds <= MAX_PRESIGN_EXPIRATION:
+            raise ValueError(f"expiration_seconds must be between 1 and {MAX_PRESIGN_EXPIRATION}.")
+        frozen = self.credentials.get_frozen_credentials()
+        now = time.time()
+        moment = datetime.fromtimestamp(int(now), timezone.utc)
+        amz_date = moment.strftime('%Y%m%dT%H%M%SZ')
+        date_stamp = amz_date[:8]
+        scope = f"{date_stamp}/{self.region_name}/s3/aws4_request"
+        host, path_prefix = self._location(bucket_name)
+
+        query = (f"X-Amz-Algorithm=AWS4-HMAC-SHA256"
+                 f"&X-Amz-Credential={quote(frozen.access_key + '/' + scope, safe='')}"
+                 f"&X-Amz-Date={amz_date}&X-Amz-Expires={expiration_seconds}")
+        token = f"&X-Amz-Security-Token={quote(frozen.token, safe='')}" if frozen.token else ''
+        # The canonical query is sorted; the URL lists the token after the signed headers, as botocore does
+        url_query = query + "&X-Amz-SignedHeaders=host" + token
+        query += token + "&X-Amz-SignedHeaders=host"
+        request_head = f"GET\n{path_prefix}"
+        request_tail = f"\n{query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign_head = f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+        url_head = f"{self._scheme}://{host}{path_prefix}"
+        url_tail = f"?{url_query}&X-Amz-Signature="
+        expires_at = now + expiration_seconds
+        sha256 = hashlib.sha256
+
+        urls = {}
+        with self._lock:
+            signing_key = self._get_signing_key(frozen.secret_key, date_stamp)
+            cache = self._cache
+            for object_key in object_keys:
+                cache_key = (bucket_name, object_key, expiration_seconds, frozen.access_key)
+                cached = cache.get(cache_key)
+                if cached is not None and cached[1] - now >= min_validity:
+                    cache.move_to_end(cache_key)
+                    urls[object_key] = cached[0]
+                    continue
+                path = '/' + quote(object_key, safe='/~')
+                canonical_request = request_head + path + request_tail
+                string_to_sign = string_to_sign_head + sha256(canonical_request.encode('utf-8')).hexdigest()
+                signature = hmac.digest(signing_key, string_to_sign.encode('utf-8'), 'sha256').hex()
+                url = url_head + path + url_tail + signature
+                urls[object_key] = url
+                cache[cache_key] = (url, expires_at)
+                cache.move_to_end(cache_key)
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+        return urls
+
+    def clear(self) -> None:
+        """Drops all cached URLs."""
+        with self._lock:
+            self._cache.clear()
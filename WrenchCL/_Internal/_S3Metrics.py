@@ -0,0 +1,207 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import bisect
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from ..Tools import logger
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_CONTEXT_KEY = 'wrenchcl_metrics'
+
+
+class _OperationStats:
+    """Accumulated statistics of one (operation, bucket) pair."""
+
+    __slots__ = ('calls', 'errors', 'retries', 'bytes_in', 'bytes_out', 'total_seconds', 'max_seconds', 'histogram')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors: Counter = Counter()
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def percentile(self, fraction: float) -> float:
+        """Estimates a latency percentile as the upper bound of the histogram bucket containing it."""
+        if not self.calls:
+            return 0.0
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank and count:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max_seconds
+        return self.max_seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'errors': dict(self.errors),
+            'retries': self.retries,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.calls if self.calls else 0.0,
+            'max_seconds': self.max_seconds,
+            'p50_seconds': self.percentile(0.5),
+            'p90_seconds': self.percentile(0.9),
+            'p99_seconds': self.percentile(0.99),
+            'latency_histogram': dict(zip([*map(str, LATENCY_BUCKETS), 'inf'], self.histogram)),
+        }
+
+
+class _S3Metrics:
+    """
+    Thread-safe per-operation instrumentation of a botocore S3 client, attached through the client's event hooks.
+
+    Every API call made through the client is recorded, including the calls boto3's transfer manager makes on behalf
+    of managed uploads and downloads (UploadPart, ranged GetObject, ...). Statistics are keyed by operation name and
+    bucket: call count, latency histogram, request and response bytes, botocore retry attempts and error codes.
+
+    Attributes:
+        started (float): The time the current statistics window started.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _OperationStats] = {}
+        self.started = time.time()
+
+    def attach(self, client) -> None:
+        """
+        Registers the instrumentation hooks on a botocore S3 client.
+
+        :param client: The S3 client to instrument.
+        """
+        events = client.meta.events
+        events.register('before-parameter-build.s3', self._before_call, unique_id='wrenchcl-metrics-before')
+        events.register('after-call.s3', self._after_call, unique_id='wrenchcl-metrics-after')
+        events.register('after-call-error.s3', self._after_call_error, unique_id='wrenchcl-metrics-error')
+
+    def detach(self, client) -> None:
+        """
+        Removes the instrumentation hooks from a botocore S3 client.
+
+        :param client: The instrumented S3 client.
+        """
+        events = client.meta.events
+        events.unregister('before-parameter-build.s3', unique_id='wrenchcl-metrics-before')
+        events.unregister('after-call.s3', unique_id='wrenchcl-metrics-after')
+        events.unregister('after-call-error.s3', unique_id='wrenchcl-metrics-error')
+
+    def _before_call(self, params: dict, model, context: dict, **kwargs) -> None:
+        context[_CONTEXT_KEY] = (params.get('Bucket', ''), _body_size(params.get('Body')), time.perf_counter())
+
+    def _after_call(self, http_response, parsed: dict, model, context: dict, **kwargs) -> None:
+        started = context.pop(_CONTEXT_KEY, None)
+        if started is None:
+            return
+        bucket, bytes_out, start = started
+        error_code = None
+        if http_response.status_code >= 300:
+            error_code = parsed.get('Error', {}).get('Code') or str(http_response.status_code)
+        try:
+            bytes_in = int(http_response.headers.get('content-length') or 0)
+        except ValueError:
+            bytes_in = 0
+        retries = parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0)
+        self._record(model.name, bucket, time.perf_counter() - start, bytes_in, bytes_out, retries, error_code)
+
+    def _after_call_error(self, exception: Exception, context: dict, **kwargs) -> None:
+        started = context.pop(_CONTEXT_KEY, None)
+        if started is None:
+            return
+        bucket, bytes_out, start = started
+        operation = kwargs.get('event_name', '').rsplit('.', 1)[-1]
+        self._record(operation, bucket, time.perf_counter() - start, 0, bytes_out, 0, type(exception).__name__)
+
+    def _record(self, operation: str, bucket: str, seconds: float, bytes_in: int, bytes_out: int, retries: int,
+                error_code: Optional[str]) -> None:
+        with self._lock:
+            stats = self._stats.get((operation, bucket))
+            if stats is None:
+                stats = self._stats[(operation, bucket)] = _OperationStats()
+            stats.calls += 1
+            stats.retries += retries
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.histogram[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            if error_code is not None:
+                stats.errors[error_code] += 1
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Returns the statistics as nested dicts: operation -> bucket -> stats.
+
+        :param reset: Whether to start a new statistics window afterwards.
+        :returns: The statistics recorded since the window started.
+        """
+        with self._lock:
+            snapshot: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for (operation, bucket), stats in self._stats.items():
+                snapshot.setdefault(operation, {})[bucket] = stats.as_dict()
+            if reset:
+                self._stats = {}
+                self.started = time.time()
+        return snapshot
+
+    def log_summary(self, reset: bool = False) -> None:
+        """
+        Logs one line per operation and bucket, slowest total time first.
+
+        :param reset: Whether to start a new statistics window afterwards.
+        """
+        window = time.time() - self.started
+        snapshot = self.snapshot(reset=reset)
+        rows = [(operation, bucket, stats) for operation, buckets in snapshot.items() for bucket, stats in
+                buckets.items()]
+        if not rows:
+            logger.info(f"S3 metrics: no calls in the last {window:.1f}s")
+            return
+        rows.sort(key=lambda row: row[2]['total_seconds'], reverse=True)
+        logger.info(f"S3 metrics over {window:.1f}s, {sum(row[2]['calls'] for row in rows)} calls:")
+        for operation, bucket, stats in rows:
+            errors = f" | errors {stats['errors']}" if stats['errors'] else ""
+            logger.info(f"  {operation} {bucket or '-'}: {stats['calls']} calls | total {stats['total_seconds']:.2f}s | "
+                        f"p50 {stats['p50_seconds'] * 1000:.0f}ms p99 {stats['p99_seconds'] * 1000:.0f}ms | "
+                        f"in {stats['bytes_in'] / 1024 ** 2:.1f} MB out {stats['bytes_out'] / 1024 ** 2:.1f} MB | "
+                        f"retries {stats['retries']}{errors}")
+
+
+def _body_size(body) -> int:
+    """Returns the number of bytes a request body will send without consuming it."""
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return memoryview(body).nbytes
+    if isinstance(body, str):
+        return len(body.encode())
+    try:
+        position = body.tell()
+        body.seek(0, 2)
+        end = body.tell()
+        body.seek(position)
+        return max(end - position, 0)
+    except (AttributeError, OSError, ValueError):
+        return 0
@@ -0,0 +1,221 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import IO, Callable, Dict, Optional
+
+from ..Tools import logger
+
+
+class _S3ObjectCache:
+    """
+    Size-bounded, read-through disk cache for S3 objects, keyed by bucket and key.
+
+    Each entry is a data file plus a small JSON sidecar holding its ETag. Files are written to a temporary name and
+    moved into place with ``os.replace``, so readers never see partial content. Entries are evicted least recently
+    used first once the cache grows past `max_bytes`, and a per-entry lock makes concurrent threads asking for the
+    same object wait for a single download. Eviction takes the same lock, and :meth:`open_object` opens the file
+    before releasing it, so a handle stays readable even if the entry is evicted right afterwards. The index is rebuilt from disk on start-up, so warm Lambda containers
+    and repeated batch runs keep their cache.
+
+    Attributes:
+        directory (str): The directory holding the cached files.
+        max_bytes (int): The size budget of the cache.
+        max_age (float): Seconds an entry is trusted without revalidating its ETag against S3.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_age: float = 0.0):
+        """
+        Initializes the cache and loads the entries already present in `directory`.
+
+        :param directory: The directory holding the cached files. Created if missing.
+        :param max_bytes: The size budget of the cache in bytes.
+        :param max_age: Seconds an entry is trusted without revalidation. 0 revalidates on every access.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._index: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._entry_locks: Dict[str, threading.Lock] = {}
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def get_path(self, bucket_name: str, object_key: str,
+                 fetch: Callable[[Optional[str], str], Optional[str]]) -> str:
+        """
+        Returns the local path of a cached object, downloading or revalidating it first if needed.
+
+        :param bucket_name: The name of the S3 bucket.
+        :param object_key: The key of the object in the S3 bucket.
+        :param fetch: Callable taking the cached ETag (or None) and a temporary path. It must either write the current
+                      object to the path and return its ETag, or return None if the cached copy is still current.
+        :returns: The path of the cached data file. Another thread may evict it before it is opened; use
+                  :meth:`open_object` when the cache is shared between threads.
+        """
+        entry_id = self._entry_id(bucket_name, object_key)
+        with self._entry_lock(entry_id):
+            data_path = self._refresh(entry_id, bucket_name, object_key, fetch)
+        self._evict(keep=entry_id)
+        return data_path
+
+    def open_object(self, bucket_name: str, object_key: str,
+                    fetch: Callable[[Optional[str], str], Optional[str]]) -> IO[bytes]:
+        """
+        Opens a cached object for reading, downloading or revalidating it first if needed.
+
+        Unlike :meth:`get_path`, the file is opened while the entry is locked, so the handle stays valid if another
+        thread evicts or refreshes the entry before it is read.
+
+        :param bucket_name: The name of the S3 bucket.
+        :param object_key: The key of the object in the S3 bucket.
+        :param fetch: See :meth:`get_path`.
+        :returns: A binary file handle positioned at the start. The caller closes it.
+        """
+        entry_id = self._entry_id(bucket_name, object_key)
+        with self._entry_lock(entry_id):
+            handle = open(self._refresh(entry_id, bucket_name, object_key, fetch), 'rb')
+        self._evict(keep=entry_id)
+        return handle
+
+    def _refresh(self, entry_id: str, bucket_name: str, object_key: str,
+                 fetch: Callable[[Optional[str], str], Optional[str]]) -> str:
+        """Makes the entry current and returns its data path. The caller holds the entry lock."""
+        data_path = os.path.join(self.directory, f"{entry_id}.data")
+        with self._lock:
+            entry = self._index.get(entry_id)
+        if entry is not None and not os.path.exists(data_path):
+            self._drop_locked(entry_id)
+            entry = None
+
+        if entry is not None and time.time() - entry['validated'] < self.max_age:
+            self._touch(entry_id, data_path)
+            return data_path
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            etag = fetch(entry['etag'] if entry else None, temp_path)
+            if etag is None:
+                logger.debug(f"Cache hit (revalidated): s3://{bucket_name}/{object_key}")
+                entry['validated'] = time.time()
+                self._touch(entry_id, data_path)
+                return data_path
+            os.replace(temp_path, data_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        size = os.path.getsize(data_path)
+        self._write_meta(entry_id, dict(bucket=bucket_name, key=object_key, etag=etag, size=size))
+        with self._lock:
+            previous = self._index.pop(entry_id, None)
+            self._total_bytes += size - (previous['size'] if previous else 0)
+            self._index[entry_id] = dict(etag=etag, size=size, validated=time.time())
+        logger.debug(f"Cache fill: s3://{bucket_name}/{object_key} ({size} bytes)")
+        return data_path
+
+    def invalidate(self, bucket_name: str, object_key: str) -> None:
+        """Removes a single object from the cache."""
+        self._drop(self._entry_id(bucket_name, object_key))
+
+    def clear(self) -> None:
+        """Removes every object from the cache."""
+        with self._lock:
+            entry_ids = list(self._index)
+        for entry_id in entry_ids:
+            self._drop(entry_id)
+
+    @property
+    def total_bytes(self) -> int:
+        """The number of bytes currently cached."""
+        return self._total_bytes
+
+    @staticmethod
+    def _entry_id(bucket_name: str, object_key: str) -> str:
+        return hashlib.sha256(f"{bucket_name}/{object_key}".encode('utf-8')).hexdigest()
+
+    def _entry_lock(self, entry_id: str) -> threading.Lock:
+        with self._lock:
+            return self._entry_locks.setdefault(entry_id, threading.Lock())
+
+    def _touch(self, entry_id: str, data_path: str) -> None:
+        """Marks an entry as most recently used, in memory and through the file's mtime for later processes."""
+        with self._lock:
+            if entry_id in self._index:
+                self._index.move_to_end(entry_id)
+        os.utime(data_path)
+
+    def _evict(self, keep: str) -> None:
+        """Deletes least recently used entries until the cache fits its budget, never evicting `keep`."""
+        while True:
+            with self._lock:
+                if self._total_bytes <= self.max_bytes:
+                    return
+                victim = next((entry_id for entry_id in self._index if entry_id != keep), None)
+            if victim is None:
+                return
+            logger.debug(f"Cache evicting entry {victim}")
+            self._drop(victim)
+
+    def _drop(self, entry_id: str) -> None:
+        """Removes an entry, waiting for any thread filling or opening it."""
+        with self._entry_lock(entry_id):
+            self._drop_locked(entry_id)
+
+    def _drop_locked(self, entry_id: str) -> None:
+        """Removes an entry. The caller holds the entry lock."""
+        with self._lock:
+            entry = self._index.pop(entry_id, None)
+            if entry is not None:
+                self._total_bytes -= entry['size']
+        for suffix in ('.data', '.meta'):
+            try:
+                os.remove(os.path.join(self.directory, entry_id + suffix))
+            except FileNotFoundError:
+                pass
+
+    def _write_meta(self, entry_id: str, meta: Dict) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, os.path.join(self.directory, f"{entry_id}.meta"))
+
+    def _load_index(self) -> None:
+        """Rebuilds the LRU index from the sidecar files on disk, oldest access first."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.meta'):
+                continue
+            entry_id = name[:-len('.meta')]
+            data_path = os.path.join(self.directory, f"{entry_id}.data")
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    meta = json.load(f)
+                entries.append((os.path.getmtime(data_path), entry_id, meta))
+            except (OSError, ValueError):
+                continue
+        for _, entry_id, meta in sorted(entries):
+            self._index[entry_id] = dict(etag=meta['etag'], size=meta['size'], validated=0.0)
+            self._total_bytes += meta['size']
+        if entries:
+            logger.debug(f"Loaded {len(entries)} cached objects ({self._total_bytes} bytes) from {self.directory}")
@@ -0,0 +1,192 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..Decorators.Retryable import Retryable
+from ..Tools import logger
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+
+class _S3ObjectWriter(io.RawIOBase):
+    """
+    Writable file-like object that streams into an S3 object with an incremental multipart upload.
+
+    Written data is buffered until a part is full, and full parts are uploaded by background threads while the
+    producer keeps writing. When `max_in_flight` parts are already uploading, `write` blocks, so memory stays bounded
+    by roughly ``part_size * (max_in_flight + 1)``. Closing the writer uploads the last part and completes the upload;
+    objects smaller than one part are written with a single PUT instead. Leaving a ``with`` block through an exception,
+    or calling :meth:`abort`, aborts the upload so no parts are left behind. A writer that is garbage collected
+    without being closed is aborted as well.
+
+    The maximum object size is ``part_size * 10,000``.
+
+    Attributes:
+        bytes_written (int): The number of bytes accepted so far.
+    """
+
+    def __init__(self, s3_client, bucket_name: str, object_key: str, part_size: int, max_in_flight: int = 4,
+                 extra_args: Optional[Dict[str, Any]] = None):
+        """
+        Initializes the writer. No request is made until the first part is full or the writer is closed.
+
+        :param s3_client: The boto3 S3 client.
+        :param bucket_name: The name of the S3 bucket.
+        :param object_key: The key of the object to write.
+        :param part_size: The size of each uploaded part in bytes, at least 5 MiB.
+        :param max_in_flight: The maximum number of parts uploading concurrently.
+        :param extra_args: Extra CreateMultipartUpload/PutObject arguments such as ContentType or Metadata.
+        """
+        super().__init__()
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes.")
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        self.part_size = part_size
+        self.extra_args = extra_args or {}
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._futures: List[Future] = []
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._aborted = False
+        self._error: Optional[BaseException] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.bytes_written
+
+    def write(self, data) -> int:
+        """
+        Buffers data and submits every full part for upload, blocking while too many parts are in flight.
+
+        :param data: A bytes-like object.
+        :returns: The number of bytes written.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed S3 object writer.")
+        self._raise_failed_part()
+        view = memoryview(data).cast('B')
+        self._buffer += view
+        self.bytes_written += view.nbytes
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[:self.part_size])
+            del self._buffer[:self.part_size]
+            self._submit_part(part)
+        return view.nbytes
+
+    def _submit_part(self, part: bytes) -> None:
+        """Starts the multipart upload if needed and uploads one part in the background."""
+        if self._upload_id is None:
+            self._upload_id = self.s3_client.create_multipart_upload(Bucket=self.bucket_name, Key=self.object_key,
+                                                                     **self.extra_args)['UploadId']
+            logger.debug(f"Started multipart upload of {self.object_key} to bucket: {self.bucket_name}")
+        part_number = len(self._futures) + 1
+        if part_number > MAX_PARTS:
+            raise ValueError(f"The object exceeds {MAX_PARTS} parts; use a larger part_size.")
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._upload_part, part_number, part)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._part_done)
+        self._futures.append(future)
+
+    def _part_done(self, future: Future) -> None:
+        self._slots.release()
+        if not future.cancelled() and future.exception() is not None and self._error is None:
+            self._error = future.exception()
+
+    @Retryable()
+    def _upload_part(self, part_number: int, part: bytes) -> Dict[str, Any]:
+        response = self.s3_client.upload_part(Bucket=self.bucket_name, Key=self.object_key, UploadId=self._upload_id,
+                                              PartNumber=part_number, Body=part)
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    def _raise_failed_part(self) -> None:
+        """Re-raises the error of a failed background part so the producer stops early."""
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """Uploads the remaining data and completes the object. Aborts the upload if that fails."""
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                self._complete()
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._executor.shutdown(wait=True)
+            super().close()
+
+    def _complete(self) -> None:
+        if self._upload_id is None:
+            self.s3_client.put_object(Bucket=self.bucket_name, Key=self.object_key, Body=bytes(self._buffer),
+                                      **self.extra_args)
+            self._buffer.clear()
+            logger.debug(f"Object written: {self.object_key} to bucket: {self.bucket_name}, "
+                         f"{self.bytes_written} bytes in a single PUT")
+            return
+        if self._buffer:
+            part = bytes(self._buffer)
+            self._buffer.clear()
+            self._submit_part(part)
+        parts = [future.result() for future in self._futures]
+        self.s3_client.complete_multipart_upload(Bucket=self.bucket_name, Key=self.object_key,
+                                                 UploadId=self._upload_id, MultipartUpload={'Parts': parts})
+        logger.debug(f"Object written: {self.object_key} to bucket: {self.bucket_name}, {self.bytes_written} bytes in "
+                     f"{len(parts)} parts")
+
+    def abort(self) -> None:
+        """Discards everything written so far and aborts the multipart upload, if one was started."""
+        if self._aborted:
+            return
+        self._aborted = True
+        self._buffer.clear()
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        if self._upload_id is not None:
+            try:
+                self.s3_client.abort_multipart_upload(Bucket=self.bucket_name, Key=self.object_key,
+                                                      UploadId=self._upload_id)
+                logger.warning(f"Aborted multipart upload of {self.object_key} to bucket: {self.bucket_name}")
+            except Exception as e:
+                logger.error(f"Failed to abort multipart upload of {self.object_key}: {e}")
+        if not self.closed:
+            super().close()
+
+    def __del__(self):
+        # An abandoned writer must not publish a truncated object
+        if not self.closed:
+            self.abort()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
@@ -0,0 +1,108 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+import io
+from typing import Optional
+
+from botocore.exceptions import IncompleteReadError
+
+from ..Decorators.Retryable import Retryable
+
+
+class _S3RangeReader(io.RawIOBase):
+    """
+    Seekable, read-only file-like view of an S3 object in which every read is served by a ranged GET. Readers that
+    seek, such as Parquet, then only download the byte ranges they actually touch. All ranges are pinned to the ETag
+    seen when the reader was opened, so a concurrent overwrite raises instead of mixing versions.
+
+    Attributes:
+        size (int): The size of the object in bytes.
+        bytes_fetched (int): The number of bytes downloaded so far.
+        requests (int): The number of ranged GETs issued so far.
+    """
+
+    def __init__(self, s3_client, bucket_name: str, object_key: str, size: Optional[int] = None,
+                 etag: Optional[str] = None):
+        """
+        Initializes the reader. Issues a HEAD request unless both `size` and `etag` are given.
+
+        :param s3_client: The boto3 S3 client.
+        :param bucket_name: The name of the S3 bucket.
+        :param object_key: The key of the object in the S3 bucket.
+        :param size: The known object size in bytes.
+        :param etag: The known ETag of the object.
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        if size is None or etag is None:
+            headers = s3_client.head_object(Bucket=bucket_name, Key=object_key)
+            size, etag = headers['ContentLength'], headers['ETag']
+        self.size = size
+        self.etag = etag
+        self.bytes_fetched = 0
+        self.requests = 0
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        end = self.size if size is None or size < 0 else min(self._position + size, self.size)
+        if end <= self._position:
+            return b''
+        data = self._get_range(self._position, end - 1)
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    @Retryable()
+    def _get_range(self, first: int, last: int) -> bytes:
+        """Downloads the inclusive byte range [first, last] of the object."""
+        obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.object_key, Range=f"bytes={first}-{last}",
+                                        IfMatch=self.etag)
+        data = obj['Body'].read()
+        if len(data) != last - first + 1:
+            raise IncompleteReadError(actual_bytes=len(data), expected_bytes=last - first + 1)
+        self.bytes_fetched += len(data)
+        self.requests += 1
+        return data
@@ -0,0 +1,138 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+
+import mmap
+import pickle
+import tempfile
+from array import array
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+
+class _SpillBuffer:
+    """
+    Append-only, list-like row store backed by a temporary file. Rows are pickled back to back into the file while
+    only their offsets (8 bytes per row) are kept in memory. Once writing is finished the file is memory-mapped, and
+    rows are unpickled lazily on indexing or iteration, so result sets far larger than RAM can be consumed.
+
+    Rows are serialized with `pickle` so database values (Decimal, datetime, UUID, ...) come back with their types.
+    The file is an anonymous temporary file that is written and read only by this buffer and never loaded from
+    elsewhere, so no untrusted data is ever unpickled. For the same reason the buffer itself cannot be pickled; call
+    :meth:`to_list` to pass the rows on.
+
+    The temporary file is removed when the buffer is closed or garbage collected. Any access to the rows after
+    :meth:`close` raises a ValueError.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initializes an empty buffer.
+
+        :param directory: The directory for the temporary file. Defaults to the system temp directory.
+        :type directory: str, optional
+        """
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._offsets = array('Q', [0])
+        self._mmap: Optional[mmap.mmap] = None
+        self._closed = False
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("The spill buffer is closed; its rows were deleted from disk.")
+
+    def append(self, row: Any) -> None:
+        """Appends a single row to the buffer."""
+        self._check_open()
+        if self._mmap is not None:
+            raise ValueError("Cannot append to a finalized spill buffer.")
+        data = pickle.dumps(row, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        """Appends multiple rows to the buffer."""
+        for row in rows:
+            self.append(row)
+
+    def finalize(self) -> '_SpillBuffer':
+        """Flushes pending writes and memory-maps the file for reading. No rows can be appended afterwards."""
+        self._check_open()
+        if self._mmap is None:
+            self._file.flush()
+            if self._offsets[-1] > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._mmap = b''
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes spilled to disk."""
+        return self._offsets[-1]
+
+    def _row(self, index: int) -> Any:
+        self.finalize()
+        return pickle.loads(self._mmap[self._offsets[index]:self._offsets[index + 1]])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, List[Any]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("spill buffer index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        self._check_open()
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        state = ' closed' if self._closed else ''
+        return f"<_SpillBuffer rows={len(self)} bytes={self.nbytes}{state}>"
+
+    def __getstate__(self):
+        raise TypeError("A _SpillBuffer cannot be pickled; use to_list() to pass its rows on.")
+
+    def to_list(self) -> List[Any]:
+        """Materializes all rows in memory."""
+        return list(self)
+
+    def close(self) -> None:
+        """Releases the memory map and deletes the temporary file. Closing twice is allowed."""
+        self._closed = True
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = None
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> '_SpillBuffer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
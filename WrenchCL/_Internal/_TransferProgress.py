@@ -0,0 +1,98 @@
+#  Copyright (c) $YEAR$. Copyright (c) $YEAR$ Wrench.AI., Willem van der Schans, Jeong Kim
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+#  All works within the Software are owned by their respective creators and are distributed by Wrench.AI.
+#
+#  For inquiries, please contact Willem van der Schans through the official Wrench.AI channels or directly via GitHub at [Kydoimos97](https://github.com/Kydoimos97).
+#
+
+import threading
+import time
+from typing import Callable, Optional
+
+from s3transfer.subscribers import BaseSubscriber
+
+from ..Tools import logger
+
+
+class _TransferProgress:
+    """
+    Thread-safe progress callback for boto3 managed transfers. Accumulates transferred bytes reported by the transfer
+    threads, forwards every increment to an optional user callback and periodically logs progress and throughput.
+
+    Attributes:
+        label (str): A description of the transfer used in log lines, e.g. 's3://bucket/key'.
+        total_bytes (int): The expected size of the transfer, or None if unknown.
+        transferred (int): The number of bytes transferred so far.
+    """
+
+    def __init__(self, label: str, total_bytes: Optional[int] = None, callback: Optional[Callable[[int], None]] = None,
+                 log_interval: Optional[float] = 5.0):
+        """
+        Initializes the progress tracker.
+
+        :param label: A description of the transfer used in log lines.
+        :param total_bytes: The expected size of the transfer, if known.
+        :param callback: A callable receiving each increment of transferred bytes.
+        :param log_interval: Seconds between progress log lines. None disables logging.
+        """
+        self.label = label
+        self.total_bytes = total_bytes
+        self.transferred = 0
+        self._callback = callback
+        self._log_interval = log_interval
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._last_log = self._start
+
+    def __call__(self, bytes_amount: int) -> None:
+        with self._lock:
+            self.transferred += bytes_amount
+            now = time.time()
+            should_log = self._log_interval is not None and now - self._last_log >= self._log_interval
+            if should_log:
+                self._last_log = now
+        if self._callback is not None:
+            self._callback(bytes_amount)
+        if should_log:
+            logger.info(self._summary("in progress"))
+
+    @property
+    def throughput(self) -> float:
+        """The average throughput so far in bytes per second."""
+        return self.transferred / max(time.time() - self._start, 1e-9)
+
+    def finish(self) -> None:
+        """Logs the final transfer summary."""
+        if self._log_interval is not None:
+            logger.info(self._summary("finished"))
+
+    def _summary(self, state: str) -> str:
+        total = f"/{self.total_bytes / 1024 ** 2:.1f}" if self.total_bytes else ""
+        return (f"Transfer {state}: {self.label} | {self.transferred / 1024 ** 2:.1f}{total} MB | "
+                f"{self.throughput / 1024 ** 2:.2f} MB/s")
+
+
+class _KnownTransferSize(BaseSubscriber):
+    """
+    s3transfer subscriber that provides the size of a download up front, so the transfer manager skips the
+    ``HeadObject`` it would otherwise send to learn the size.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initializes the subscriber.
+
+        :param size: The size of the object in bytes, e.g. the ContentLength of an earlier HEAD.
+        """
+        self._size = size
+
+    def on_queued(self, future, **kwargs) -> None:
+        future.meta.provide_transfer_size(self._size)
@@ -0,0 +1,58 @@
+"""
+Measures bulk presigned URL generation with the offline signer used by S3ServiceGateway.get_signed_urls.
+
+Signing is purely local, so no S3 endpoint or real credentials are needed. Each round signs a fresh set of keys (a
+cold cache) and then signs the same keys again (a warm cache). boto3's generate_presigned_url is timed on a sample
+for comparison.
+
+Usage::
+
+    python benchmarks/presign_benchmark.py --keys 100000 --rounds 3
+"""
+import argparse
+import time
+
+import botocore.session
+from botocore.config import Config
+
+from WrenchCL._Internal._PresignedUrlSigner import _PresignedUrlSigner
+
+
+def run(key_count, rounds, baseline_sample, bucket, region):
+    session = botocore.session.get_session()
+    session.set_credentials('AKIDBENCHMARK', 'benchmark-secret-key')
+    client = session.create_client('s3', region_name=region, config=Config(signature_version='s3v4'))
+    signer = _PresignedUrlSigner(session.get_credentials(), region, max_entries=key_count)
+
+    start = time.perf_counter()
+    for i in range(baseline_sample):
+        client.generate_presigned_url('get_object', Params={'Bucket': bucket, 'Key': f"baseline/{i}.parquet"},
+                                      ExpiresIn=3600)
+    baseline_rate = baseline_sample / (time.perf_counter() - start)
+    print(f"boto3 generate_presigned_url: {baseline_rate:>12,.0f} URLs/s")
+
+    for round_number in range(rounds):
+        keys = [f"dataset/round={round_number}/part-{i:07d}.parquet" for i in range(key_count)]
+        start = time.perf_counter()
+        signer.sign(bucket, keys)
+        cold_rate = key_count / (time.perf_counter() - start)
+        start = time.perf_counter()
+        signer.sign(bucket, keys)
+        warm_rate = key_count / (time.perf_counter() - start)
+        print(f"round {round_number}: cold {cold_rate:>12,.0f} URLs/s | warm {warm_rate:>12,.0f} URLs/s | "
+              f"{cold_rate / baseline_rate:.0f}x boto3")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keys', type=int, default=100_000, help="Number of keys signed per round")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--baseline-sample', type=int, default=2_000, help="Number of URLs signed with boto3")
+    parser.add_argument('--bucket', default='wrenchcl-presign-benchmark')
+    parser.add_argument('--region', default='us-east-1')
+    args = parser.parse_args()
+    run(args.keys, args.rounds, args.baseline_sample, args.bucket, args.region)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Sweeps multipart part size and concurrency for S3 uploads and downloads against local stand-in storage.
+
+By default the benchmark runs against moto's in-process S3 mock (``pip install moto``), which measures the client side
+overhead of each setting. Pass ``--endpoint-url`` to run against a local S3 compatible server such as MinIO or
+LocalStack for numbers that include real HTTP transfers.
+
+Usage::
+
+    python benchmarks/s3_transfer_benchmark.py --size-mb 256 --part-sizes 8 16 64 --concurrency 4 10 20
+    python benchmarks/s3_transfer_benchmark.py --endpoint-url http://localhost:9000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+
+MB = 1024 * 1024
+
+
+def _client_context(endpoint_url):
+    if endpoint_url:
+        return contextlib.nullcontext(boto3.client('s3', endpoint_url=endpoint_url, region_name='us-east-1'))
+    try:
+        from moto import mock_s3
+    except ImportError:
+        raise SystemExit("Install moto or pass --endpoint-url to point at a local S3 compatible server.")
+
+    @contextlib.contextmanager
+    def mocked():
+        os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+        os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+        with mock_s3():
+            yield boto3.client('s3', region_name='us-east-1')
+
+    return mocked()
+
+
+def run(size_mb, part_sizes_mb, concurrencies, bucket, endpoint_url):
+    payload = os.urandom(size_mb * MB)
+    results = []
+    with _client_context(endpoint_url) as client:
+        with contextlib.suppress(client.exceptions.BucketAlreadyOwnedByYou):
+            client.create_bucket(Bucket=bucket)
+        for part_size in part_sizes_mb:
+            for concurrency in concurrencies:
+                config = TransferConfig(multipart_threshold=part_size * MB, multipart_chunksize=part_size * MB,
+                                        max_concurrency=concurrency, use_threads=concurrency > 1)
+                key = f"benchmark/{part_size}mb-{concurrency}"
+
+                start = time.perf_counter()
+                client.upload_fileobj(io.BytesIO(payload), bucket, key, Config=config)
+                upload_seconds = time.perf_counter() - start
+
+                start = time.perf_counter()
+                client.download_fileobj(bucket, key, io.BytesIO(), Config=config)
+                download_seconds = time.perf_counter() - start
+
+                client.delete_object(Bucket=bucket, Key=key)
+                results.append((part_size, concurrency, size_mb / upload_seconds, size_mb / download_seconds))
+                print(f"part {part_size:>4} MB | concurrency {concurrency:>3} | "
+                      f"upload {results[-1][2]:>9.1f} MB/s | download {results[-1][3]:>9.1f} MB/s")
+
+    best_upload = max(results, key=lambda r: r[2])
+    best_download = max(results, key=lambda r: r[3])
+    print(f"\nBest upload:   part {best_upload[0]} MB, concurrency {best_upload[1]} ({best_upload[2]:.1f} MB/s)")
+    print(f"Best download: part {best_download[0]} MB, concurrency {best_download[1]} ({best_download[3]:.1f} MB/s)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, default=64, help="Size of the test object in MB")
+    parser.add_argument('--part-sizes', type=int, nargs='+', default=[8, 16, 32], help="Part sizes in MB")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 10], help="Max concurrency values")
+    parser.add_argument('--bucket', default='wrenchcl-transfer-benchmark')
+    parser.add_argument('--endpoint-url', default=None, help="Endpoint of a local S3 compatible server")
+    args = parser.parse_args()
+    run(args.size_mb, args.part_sizes, args.concurrency, args.bucket, args.endpoint_url)
+
+
+if __name__ == '__main__':
+    main()
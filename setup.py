@@ -40,6 +40,9 @@ setup(
     url='https://github.com/WrenchAI/WrenchCL',
     packages=find_packages(),
     install_requires=required,
+    extras_require={
+        'async': ['aiobotocore'],
+    },
     python_requires='>=3.11',
     classifiers=[
         'Programming Language :: Python :: 3',
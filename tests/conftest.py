@@ -0,0 +1,76 @@
+import datetime
+import importlib
+import inspect
+import time
+import types
+
+import boto3
+import botocore.auth
+import pytest
+
+BUCKET = 'wrenchcl-test'
+
+
+def singleton_class(module_name, name):
+    """Returns the class wrapped by SingletonClass, so tests get a fresh instance per fixture."""
+    module = importlib.import_module(module_name)
+    return module, inspect.getclosurevars(getattr(module, name)).nonlocals['cls']
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freezes the clock botocore signs with, so presigned URLs can be compared to botocore's own."""
+    moment = datetime.datetime(2024, 5, 6, 7, 8, 9)
+
+    class FrozenDatetime(datetime.datetime):
+        @classmethod
+        def utcnow(cls):
+            return moment
+
+    monkeypatch.setattr(botocore.auth, 'datetime', types.SimpleNamespace(datetime=FrozenDatetime))
+    monkeypatch.setattr(time, 'time', lambda: moment.replace(tzinfo=datetime.timezone.utc).timestamp())
+    return moment
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.delenv('AWS_SESSION_TOKEN', raising=False)
+    monkeypatch.delenv('AWS_PROFILE', raising=False)
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+
+@pytest.fixture
+def s3_client(aws_credentials):
+    moto = pytest.importorskip('moto')
+    mock_s3 = getattr(moto, 'mock_aws', None) or moto.mock_s3
+    with mock_s3():
+        client = boto3.client('s3', region_name='us-east-1')
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def s3_gateway(s3_client, monkeypatch):
+    module, gateway_class = singleton_class('WrenchCL.Connect.S3ServiceGateway', 'S3ServiceGateway')
+
+    class FakeHub:
+        def __init__(self, *args, **kwargs):
+            self.aws_session_client = boto3.session.Session()
+
+        def get_s3_client(self, config=None, force_refresh=False):
+            return s3_client
+
+    monkeypatch.setattr(module, 'AwsClientHub', FakeHub)
+    gateway = gateway_class()
+    monkeypatch.setattr(module, 'S3ServiceGateway', lambda *args, **kwargs: gateway)
+    return gateway
+
+
+@pytest.fixture(scope='session')
+def postgres_uri(tmp_path_factory):
+    pgserver = pytest.importorskip('pgserver')
+    server = pgserver.get_server(tmp_path_factory.mktemp('pgdata'), cleanup_mode='delete')
+    yield server.get_uri()
+    server.cleanup()
@@ -0,0 +1,243 @@
+import asyncio
+import importlib
+import types
+
+import pytest
+from botocore.exceptions import ClientError
+
+async_module = importlib.import_module('WrenchCL.Connect.AsyncS3ServiceGateway')
+retryable_module = importlib.import_module('WrenchCL.Decorators.Retryable')
+
+
+class FakeBody:
+    def __init__(self, content):
+        self.content = content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self.content
+
+
+class FakePaginator:
+    def __init__(self, client):
+        self.client = client
+
+    async def paginate(self, Bucket, Prefix):
+        keys = sorted(key for bucket, key in self.client.objects if bucket == Bucket and key.startswith(Prefix))
+        for start in range(0, len(keys), 2):
+            yield {'Contents': [{'Key': key} for key in keys[start:start + 2]]}
+
+
+class FakeClient:
+    """In-memory stand-in for an aiobotocore S3 client that records how many requests are in flight."""
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+        self.failures = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def _request(self, operation):
+        self.calls.append(operation)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.failures:
+                raise self.failures.pop(0)
+        finally:
+            self.in_flight -= 1
+
+    async def put_object(self, Bucket, Key, Body):
+        await self._request('put_object')
+        self.objects[(Bucket, Key)] = bytes(Body)
+
+    async def get_object(self, Bucket, Key):
+        await self._request('get_object')
+        return {'Body': FakeBody(self.objects[(Bucket, Key)])}
+
+    async def head_object(self, Bucket, Key):
+        await self._request('head_object')
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+        return {'ContentLength': len(self.objects[(Bucket, Key)])}
+
+    async def copy_object(self, Bucket, Key, CopySource):
+        await self._request('copy_object')
+        self.objects[(Bucket, Key)] = self.objects[(CopySource['Bucket'], CopySource['Key'])]
+
+    async def delete_object(self, Bucket, Key):
+        await self._request('delete_object')
+        self.objects.pop((Bucket, Key), None)
+
+    def get_paginator(self, operation):
+        assert operation == 'list_objects_v2'
+        return FakePaginator(self)
+
+    async def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://{Params['Bucket']}.s3.amazonaws.com/{Params['Key']}?Expires={ExpiresIn}"
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeClient()
+    sessions = []
+
+    class FakeSession:
+        def __init__(self, profile=None):
+            self.profile = profile
+            self.credentials = None
+            sessions.append(self)
+
+        def set_credentials(self, access_key, secret_key, token=None):
+            self.credentials = (access_key, secret_key, token)
+
+        def create_client(self, service, region_name=None, config=None, endpoint_url=None):
+            client.options = {'service': service, 'region_name': region_name, 'config': config,
+                              'endpoint_url': endpoint_url}
+            return client
+
+    class FakeHub:
+        def __init__(self, *args, **kwargs):
+            self.aws_session_client = None
+
+        def get_s3_client(self):
+            return types.SimpleNamespace(meta=types.SimpleNamespace(region_name='eu-west-1',
+                                                                    endpoint_url='https://s3.eu-west-1.amazonaws.com'))
+
+        def get_config(self):
+            return types.SimpleNamespace(aws_profile='analytics')
+
+    monkeypatch.setattr(async_module, 'AIOBOTOCORE_AVAILABLE', True)
+    monkeypatch.setattr(async_module, 'AioConfig', lambda **kwargs: kwargs)
+    monkeypatch.setattr(async_module, 'AioSession', FakeSession)
+    monkeypatch.setattr(async_module, 'AwsClientHub', FakeHub)
+    client.sessions = sessions
+    return client
+
+
+def test_async_gateway_requires_aiobotocore(monkeypatch):
+    monkeypatch.setattr(async_module, 'AIOBOTOCORE_AVAILABLE', False)
+    with pytest.raises(ImportError, match='aiobotocore'):
+        async_module.AsyncS3ServiceGateway()
+
+
+def test_async_gateway_round_trip(fake_client):
+    async def main():
+        async with async_module.AsyncS3ServiceGateway(max_concurrency=8) as s3:
+            url = await s3.upload_file(b'{"a": 1}', 'bucket', 'json/a.json', return_url=True)
+            await s3.upload_file(memoryview(b'thumb'), 'bucket', 'img/1.png')
+            content = (await s3.get_object('bucket', 'json/a.json')).read()
+            exists = await s3.check_object_existence('bucket', 'img/1.png')
+            missing = await s3.check_object_existence('bucket', 'img/2.png')
+            await s3.copy_object('bucket', 'img/1.png', 'bucket', 'img/2.png')
+            await s3.delete_object('bucket', 'img/1.png')
+            listed = await s3.list_objects('bucket', prefix='img/')
+            signed = await s3.get_signed_url('bucket', 'img/2.png', expiration_seconds=60)
+        return url, content, exists, missing, listed, signed
+
+    url, content, exists, missing, listed, signed = asyncio.run(main())
+    assert url == 'https://bucket.s3.amazonaws.com/json/a.json'
+    assert content == b'{"a": 1}'
+    assert exists and not missing
+    assert listed == ['img/2.png']
+    assert signed == 'https://bucket.s3.amazonaws.com/img/2.png?Expires=60'
+    assert fake_client.closed
+    assert fake_client.options == {'service': 's3', 'region_name': 'eu-west-1',
+                                   'config': {'max_pool_connections': 8},
+                                   'endpoint_url': 'https://s3.eu-west-1.amazonaws.com'}
+    assert [session.profile for session in fake_client.sessions] == ['analytics']
+
+
+def test_async_gateway_bounds_requests_in_flight(fake_client):
+    async def main():
+        async with async_module.AsyncS3ServiceGateway(max_concurrency=4) as s3:
+            await s3.gather((s3.upload_file(b'x', 'bucket', f'k/{i}') for i in range(40)), limit=40)
+
+    asyncio.run(main())
+    assert len(fake_client.objects) == 40
+    assert fake_client.max_in_flight == 4
+
+
+def test_async_gateway_retries_without_blocking(fake_client, monkeypatch):
+    sleeps = []
+
+    async def record_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(retryable_module, 'asyncio', types.SimpleNamespace(sleep=record_sleep))
+    fake_client.objects[('bucket', 'k')] = b'payload'
+    fake_client.failures.append(ClientError({'Error': {'Code': 'SlowDown', 'Message': 'Reduce'}}, 'GetObject'))
+
+    async def main():
+        async with async_module.AsyncS3ServiceGateway() as s3:
+            return (await s3.get_object('bucket', 'k')).read()
+
+    assert asyncio.run(main()) == b'payload'
+    assert fake_client.calls == ['get_object', 'get_object']
+    assert len(sleeps) == 1
+
+
+def test_async_gateway_map_creates_calls_lazily(fake_client):
+    started = []
+    pulled_ahead = []
+    running = 0
+    most_running = 0
+
+    def items():
+        for i in range(20):
+            started.append(i)
+            yield i
+
+    async def work(i):
+        nonlocal running, most_running
+        pulled_ahead.append(len(started) - i)
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return i * 2
+
+    async def main():
+        s3 = async_module.AsyncS3ServiceGateway()
+        return await s3.map(work, items(), limit=3)
+
+    assert asyncio.run(main()) == [i * 2 for i in range(20)]
+    assert most_running == 3
+    assert max(pulled_ahead) <= 3
+
+
+def test_async_gateway_map_stops_after_first_failure(fake_client):
+    done = []
+
+    async def work(i):
+        await asyncio.sleep(0.001)
+        if i == 2:
+            raise ValueError('bad item')
+        done.append(i)
+        return i
+
+    async def main(return_exceptions):
+        s3 = async_module.AsyncS3ServiceGateway()
+        return await s3.map(work, range(50), limit=2, return_exceptions=return_exceptions)
+
+    with pytest.raises(ValueError, match='bad item'):
+        asyncio.run(main(False))
+    assert len(done) < 10
+
+    results = asyncio.run(main(True))
+    assert isinstance(results[2], ValueError)
+    assert results[:2] + results[3:] == [i for i in range(50) if i != 2]
@@ -0,0 +1,353 @@
+import asyncio
+import threading
+import time
+
+import psycopg2
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError
+
+from WrenchCL.Decorators import Retryable, CircuitBreaker, Cached
+from WrenchCL.Decorators.CircuitBreaker import Circuit, CircuitOpenError
+from WrenchCL.Decorators.Retryable import RetryBudget, is_retryable_error
+
+
+def client_error(code, status):
+    return ClientError({'Error': {'Code': code}, 'ResponseMetadata': {'HTTPStatusCode': status}}, 'HeadObject')
+
+
+def flaky(errors):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return 'ok'
+
+    return func, calls
+
+
+def test_is_retryable_error():
+    assert is_retryable_error(client_error('SlowDown', 503))
+    assert is_retryable_error(client_error('ThrottlingException', 400))
+    assert is_retryable_error(client_error('InternalError', 500))
+    assert is_retryable_error(EndpointConnectionError(endpoint_url='http://localhost'))
+    assert is_retryable_error(ConnectionResetError())
+    assert is_retryable_error(psycopg2.OperationalError("server closed the connection unexpectedly"))
+    assert not is_retryable_error(client_error('404', 404))
+    assert not is_retryable_error(client_error('AccessDenied', 403))
+    assert not is_retryable_error(NoCredentialsError())
+    assert not is_retryable_error(ValueError("The file is empty."))
+    assert not is_retryable_error(psycopg2.ProgrammingError("syntax error"))
+
+
+def test_retryable_retries_transient_errors():
+    func, calls = flaky([client_error('SlowDown', 503), ConnectionResetError()])
+    assert Retryable(func, delay=0, retry_budget=None)() == 'ok'
+    assert len(calls) == 3
+
+
+def test_retryable_raises_fatal_errors_immediately():
+    func, calls = flaky([ValueError("The file is empty.")])
+    with pytest.raises(ValueError):
+        Retryable(func, delay=0, retry_budget=None)()
+    assert len(calls) == 1
+
+
+def test_retryable_gives_up_after_max_retries():
+    func, calls = flaky([TimeoutError()] * 10)
+    with pytest.raises(TimeoutError):
+        Retryable(func, max_retries=3, delay=0, retry_budget=None)()
+    assert len(calls) == 3
+
+
+def test_retryable_respects_retry_on_exceptions():
+    func, calls = flaky([KeyError('x')])
+    assert Retryable(func, retry_on_exceptions=(KeyError,), delay=0, retry_budget=None)() == 'ok'
+    assert len(calls) == 2
+
+
+def test_retryable_deadline_caps_the_sleep():
+    func, calls = flaky([TimeoutError()] * 10)
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        Retryable(func, backoff='constant', delay=5, deadline=0.2, retry_budget=None)()
+    assert len(calls) == 2
+    assert 0.2 <= time.monotonic() - started < 1
+
+
+def test_retryable_budget_stops_retry_storms():
+    budget = RetryBudget(capacity=2, refill_rate=0)
+    func, calls = flaky([TimeoutError()] * 10)
+    with pytest.raises(TimeoutError):
+        Retryable(func, max_retries=10, delay=0, retry_budget=budget)()
+    assert len(calls) == 3
+    assert budget.tokens < budget.retry_cost
+
+
+def test_retryable_budget_is_per_function_by_default():
+    func, calls = flaky([ConnectionError()] * 100)
+    with pytest.raises(ConnectionError):
+        Retryable(func, max_retries=100, delay=0)()
+    assert len(calls) < 60
+    func, calls = flaky([ConnectionError()])
+    assert Retryable(func, delay=0)() == 'ok'
+
+    shared = RetryBudget(capacity=1, refill_rate=0)
+    func, calls = flaky([ConnectionError()] * 2)
+    with pytest.raises(ConnectionError):
+        Retryable(func, delay=0, retry_budget=shared)()
+    func, calls = flaky([ConnectionError()])
+    with pytest.raises(ConnectionError):
+        Retryable(func, delay=0, retry_budget=shared)()
+    with pytest.raises(ValueError):
+        Retryable(retry_budget='global')
+
+
+def test_retryable_backoff_strategies():
+    with pytest.raises(ValueError):
+        Retryable(backoff='linear')
+    for backoff in ('constant', 'exponential', 'decorrelated'):
+        func, calls = flaky([TimeoutError()])
+        assert Retryable(func, backoff=backoff, delay=0.001, retry_budget=None)() == 'ok'
+
+
+def test_retryable_async():
+    func, calls = flaky([client_error('RequestTimeout', 400)])
+
+    @Retryable(delay=0, retry_budget=None)
+    async def async_func():
+        return func()
+
+    assert asyncio.run(async_func()) == 'ok'
+    assert len(calls) == 2
+
+
+def test_circuit_breaker_opens_and_recovers():
+    circuit = Circuit('test', window_size=4, minimum_calls=4, failure_threshold=0.5, cooldown=0.05)
+    protected = CircuitBreaker(lambda: 'ok', circuit=circuit)
+    assert protected() == 'ok' and protected() == 'ok'
+    func, calls = flaky([TimeoutError()] * 3)
+    protected = CircuitBreaker(func, circuit=circuit)
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            protected()
+    assert circuit.state == 'open'
+    with pytest.raises(CircuitOpenError):
+        protected()
+    assert len(calls) == 2
+
+    time.sleep(0.06)
+    with pytest.raises(TimeoutError):
+        protected()
+    assert circuit.state == 'open'
+    time.sleep(0.06)
+    assert protected() == 'ok'
+    assert circuit.state == 'closed'
+
+
+def test_circuit_breaker_ignores_fatal_errors():
+    @CircuitBreaker(window_size=2, minimum_calls=2)
+    def not_found():
+        raise client_error('404', 404)
+
+    for _ in range(5):
+        with pytest.raises(ClientError):
+            not_found()
+    assert not_found.circuit.state == 'closed'
+
+
+def test_circuit_ignores_outcomes_admitted_in_an_earlier_state():
+    circuit = Circuit('stale', minimum_calls=2, window_size=2, cooldown=0.05)
+    slow_success = circuit.before_call()
+    slow_failure = circuit.before_call()
+    circuit.record_failure(circuit.before_call())
+    circuit.record_failure(circuit.before_call())
+    assert circuit.state == 'open'
+    time.sleep(0.06)
+    trial = circuit.before_call()
+    assert circuit.state == 'half_open'
+
+    circuit.record_success(slow_success)
+    circuit.release(slow_failure)
+    assert circuit.state == 'half_open'
+    with pytest.raises(CircuitOpenError):
+        circuit.before_call()
+    circuit.record_failure(trial)
+    assert circuit.state == 'open'
+
+    time.sleep(0.06)
+    trial = circuit.before_call()
+    circuit.record_failure(slow_failure)
+    assert circuit.state == 'half_open'
+    circuit.record_success(trial)
+    assert circuit.state == 'closed'
+
+
+def test_circuit_breaker_composes_with_retryable():
+    circuit = Circuit('retry', window_size=2, minimum_calls=2, cooldown=60)
+    func, calls = flaky([ConnectionResetError()] * 10)
+    protected = Retryable(CircuitBreaker(func, circuit=circuit), max_retries=5, delay=0, retry_budget=None)
+    with pytest.raises(CircuitOpenError):
+        protected()
+    assert len(calls) == 2
+
+
+def test_circuit_breaker_async():
+    @CircuitBreaker(window_size=1, minimum_calls=1, cooldown=60)
+    async def failing():
+        raise TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(failing())
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(failing())
+
+
+def test_cached_hits_ttl_and_invalidation():
+    calls = []
+
+    @Cached(ttl=0.05)
+    def square(x, power=2):
+        calls.append(x)
+        return x ** power
+
+    assert square(3) == 9 and square(3) == 9 and square(x=3) == 9
+    assert square(3, power=3) == 27
+    assert square.cache_stats().hits == 1
+    assert square.invalidate(3) is True
+    assert square(3) == 9
+    time.sleep(0.06)
+    assert square(3) == 9
+    assert calls == [3, 3, 3, 3, 3]
+    assert square.cache_stats().expirations == 1
+
+
+def test_cached_lru_bounds():
+    @Cached(max_entries=2)
+    def identity(x):
+        return x
+
+    identity(1), identity(2), identity(1), identity(3)
+    stats = identity.cache_stats()
+    assert stats.entries == 2 and stats.evictions == 1
+    identity(1)
+    assert identity.cache_stats().hits == 2
+
+    @Cached(max_entries=None, max_bytes=1000, size_of=len)
+    def payload(size):
+        return b'x' * size
+
+    payload(400), payload(400.0), payload(300), payload(2000)
+    stats = payload.cache_stats()
+    assert stats.bytes <= 1000 and stats.entries == 2
+
+
+def test_cached_single_flight_threads():
+    calls = []
+    barrier = threading.Barrier(20)
+
+    @Cached(key=lambda secret_id, **_: secret_id)
+    def get_secret(secret_id, client=None):
+        calls.append(secret_id)
+        time.sleep(0.05)
+        return {'id': secret_id}
+
+    def worker():
+        barrier.wait()
+        assert get_secret('db', client=object()) == {'id': 'db'}
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ['db']
+    assert get_secret.cache_stats().coalesced + get_secret.cache_stats().hits == 19
+
+
+def test_cached_async_single_flight_and_errors():
+    calls = []
+
+    @Cached()
+    async def lookup(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        if x < 0:
+            raise ValueError(x)
+        return x * 2
+
+    async def main():
+        results = await asyncio.gather(*(lookup(1) for _ in range(50)))
+        errors = await asyncio.gather(*(lookup(-1) for _ in range(5)), return_exceptions=True)
+        return results, errors
+
+    results, errors = asyncio.run(main())
+    assert results == [2] * 50
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert calls == [1, -1]
+    assert lookup.cache_stats().entries == 1
+
+
+def test_cached_async_leader_cancellation_elects_new_leader():
+    calls = []
+
+    @Cached()
+    async def lookup(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    async def main():
+        leader = asyncio.ensure_future(lookup(3))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(lookup(3)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    assert asyncio.run(main()) == [6] * 5
+    assert calls == [3, 3]
+    assert lookup.cache_stats().entries == 1
+
+
+def test_cached_drops_results_invalidated_while_in_flight():
+    started, release = threading.Event(), threading.Event()
+    version = [1]
+
+    @Cached()
+    def load(x):
+        value = version[0]
+        started.set()
+        release.wait(5)
+        return value
+
+    result = []
+    thread = threading.Thread(target=lambda: result.append(load('k')))
+    thread.start()
+    started.wait(5)
+    version[0] = 2
+    assert load.invalidate('k') is False
+    release.set()
+    thread.join()
+    assert result == [1]
+    assert load.cache_stats().entries == 0
+    assert load('k') == 2
+
+    @Cached()
+    async def fetch(x):
+        value = version[0]
+        await asyncio.sleep(0.02)
+        return value
+
+    async def main():
+        task = asyncio.ensure_future(fetch('k'))
+        await asyncio.sleep(0)
+        fetch.cache_clear()
+        version[0] = 3
+        return await task, await fetch('k')
+
+    assert asyncio.run(main()) == (2, 3)
@@ -10,7 +10,7 @@ def test_internal_import():
 
 def test_connect_import():
     try:
-        from WrenchCL.Connect import S3ServiceGateway, RdsServiceGateway, AwsClientHub
+        from WrenchCL.Connect import S3ServiceGateway, AsyncS3ServiceGateway, RdsServiceGateway, AwsClientHub
     except ImportError as e:
         pytest.fail(f"Importing from WrenchCL.Connect failed: {e}")
 
@@ -28,7 +28,7 @@ def test_dataflow_import():
 
 def test_decorators_import():
     try:
-        from WrenchCL.Decorators import Retryable, SingletonClass, TimedMethod
+        from WrenchCL.Decorators import Retryable, SingletonClass, TimedMethod, CircuitBreaker, Cached
     except ImportError as e:
         pytest.fail(f"Importing from WrenchCL.Decorators failed: {e}")
 
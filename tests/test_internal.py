@@ -0,0 +1,106 @@
+import datetime
+import gc
+import pickle
+import random
+import threading
+from decimal import Decimal
+from uuid import UUID
+
+import botocore.session
+import pytest
+from botocore.config import Config
+
+from WrenchCL._Internal._PresignedUrlSigner import _PresignedUrlSigner
+from WrenchCL._Internal._S3ObjectCache import _S3ObjectCache
+from WrenchCL._Internal._SpillBuffer import _SpillBuffer
+
+
+def test_object_cache_handles_survive_concurrent_eviction(tmp_path):
+    cache = _S3ObjectCache(str(tmp_path), max_bytes=2500)
+    errors = []
+
+    def content(key):
+        return key.encode() * (1000 // len(key))
+
+    def fetch_for(key):
+        def fetch(etag, path):
+            if etag is not None:
+                return None
+            with open(path, 'wb') as f:
+                f.write(content(key))
+            return f'"{key}"'
+        return fetch
+
+    def worker(seed):
+        rng = random.Random(seed)
+        try:
+            for _ in range(200):
+                key = f"key{rng.randrange(10)}"
+                with cache.open_object('bucket', key, fetch_for(key)) as f:
+                    assert f.read() == content(key)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert cache.total_bytes <= 2500
+
+
+def test_presigned_urls_match_botocore_on_the_regional_host(frozen_clock):
+    keys = ['plain.txt', 'dir/sub dir/file name+1.csv', 'unicode/\u00e9t\u00e9~(1).json']
+    for region, token in (('us-east-1', None), ('eu-west-1', 'session-token/=+')):
+        session = botocore.session.get_session()
+        session.set_credentials('AKIDEXAMPLE', 'secret/key+example', token)
+        client = session.create_client('s3', region_name=region, endpoint_url=f"https://s3.{region}.amazonaws.com",
+                                       config=Config(signature_version='s3v4', s3={'addressing_style': 'virtual'}))
+        signer = _PresignedUrlSigner(session.get_credentials(), region)
+        urls = signer.sign('my-bucket', keys, expiration_seconds=900)
+        for key in keys:
+            expected = client.generate_presigned_url('get_object', Params={'Bucket': 'my-bucket', 'Key': key},
+                                                     ExpiresIn=900)
+            assert urls[key] == expected
+
+
+def test_spill_buffer_indexes_and_iterates_typed_rows(tmp_path):
+    rows = [{'id': i, 'amount': Decimal(i) / 3, 'at': datetime.datetime(2024, 1, 1, i % 24), 'ref': UUID(int=i)}
+            for i in range(1000)]
+    with _SpillBuffer(str(tmp_path)) as buffer:
+        buffer.extend(rows)
+        assert len(buffer) == 1000 and buffer.nbytes > 0
+        assert buffer[0] == rows[0] and buffer[-1] == rows[-1] and buffer[500] == rows[500]
+        assert buffer[10:20:3] == rows[10:20:3]
+        assert list(buffer) == rows and buffer.to_list() == rows
+        with pytest.raises(IndexError):
+            buffer[1000]
+        with pytest.raises(ValueError, match='finalized'):
+            buffer.append({'id': 1000})
+
+    with _SpillBuffer(str(tmp_path)) as empty:
+        assert not empty and list(empty.finalize()) == []
+
+
+def test_spill_buffer_deletes_its_file_and_refuses_access_after_close(tmp_path):
+    buffer = _SpillBuffer(str(tmp_path))
+    buffer.extend([(1, 'a'), (2, 'b')])
+    assert buffer[1] == (2, 'b')
+    with pytest.raises(TypeError, match='to_list'):
+        pickle.dumps(buffer)
+
+    spill_file = buffer._file
+    buffer.close()
+    buffer.close()
+    assert spill_file.closed and list(tmp_path.iterdir()) == []
+    for access in (lambda: buffer[0], lambda: list(buffer), lambda: buffer.append((3, 'c'))):
+        with pytest.raises(ValueError, match='closed'):
+            access()
+
+    collected = _SpillBuffer(str(tmp_path))
+    collected.append((1,))
+    spill_file = collected._file
+    del collected
+    gc.collect()
+    assert spill_file.closed
@@ -0,0 +1,293 @@
+import datetime
+import json
+import re
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import psycopg2
+import psycopg2.extras
+import pytest
+from psycopg2 import sql
+
+from conftest import BUCKET, singleton_class
+from WrenchCL._Internal._SpillBuffer import _SpillBuffer
+
+rds_module, RdsGateway = singleton_class('WrenchCL.Connect.RdsServiceGateway', 'RdsServiceGateway')
+
+
+class _Config:
+    db_batch_size = 1000
+
+
+def make_gateway(monkeypatch, connection, **kwargs):
+    class FakeHub:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def get_config(self):
+            return _Config()
+
+        def get_db_uri(self):
+            return None
+
+        def get_db_client(self):
+            return connection
+
+    monkeypatch.setattr(rds_module, 'AwsClientHub', FakeHub)
+    return RdsGateway(**kwargs)
+
+
+@pytest.fixture
+def pg_gateway(postgres_uri, monkeypatch):
+    connection = psycopg2.connect(postgres_uri)
+    with connection.cursor() as cursor:
+        cursor.execute("DROP SCHEMA IF EXISTS wrenchcl_test CASCADE; CREATE SCHEMA wrenchcl_test; "
+                       "SET search_path TO wrenchcl_test")
+    connection.commit()
+    yield make_gateway(monkeypatch, connection)
+    connection.close()
+
+
+def render(composable):
+    """Renders a psycopg2 sql composition without a connection, quoting identifiers the way Postgres does."""
+    if isinstance(composable, sql.Composed):
+        return ''.join(render(part) for part in composable.seq)
+    if isinstance(composable, sql.Identifier):
+        return '.'.join('"%s"' % name.replace('"', '""') for name in composable.strings)
+    if isinstance(composable, sql.Literal):
+        return repr(composable.wrapped)
+    return composable.string
+
+
+def test_jsonl_to_csv_chunks_serializes_nested_values_in_batches():
+    lines = [json.dumps({'id': i, 'name': f'row "{i}", quoted', 'tags': ['a', i], 'extra': 1}).encode()
+             for i in range(5)] + [b'{"id": 5}']
+    chunks = list(RdsGateway._jsonl_to_csv_chunks(lines, ['id', 'name', 'tags'], batch_size=2))
+    assert len(chunks) == 3
+    rows = b''.join(chunks).decode().splitlines()
+    assert rows[1] == '1,"row ""1"", quoted","[""a"", 1]"'
+    assert rows[5] == '5,,'
+
+
+def test_copy_from_s3_merges_through_a_staging_table(s3_gateway, monkeypatch):
+    connection = MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    copied = []
+    cursor.copy_expert.side_effect = lambda query, reader, size: copied.append(reader.read())
+    cursor.rowcount = 2
+    gateway = make_gateway(monkeypatch, connection)
+    monkeypatch.setattr(rds_module, 'S3ServiceGateway', lambda *args, **kwargs: s3_gateway)
+    s3_gateway.upload_file(b'{"id": 1, "na\\"me": "a", "tags": {"k": 1}}\n\n{"id": 2, "na\\"me": "b"}\n', BUCKET,
+                           'events.jsonl', compress='gzip')
+
+    assert gateway.copy_from_s3(BUCKET, 'events.jsonl', 'public.events', file_format='jsonl',
+                                merge_keys=['id']) == 2
+    create, merge = (render(call.args[0]) for call in cursor.execute.call_args_list)
+    stage = re.fullmatch(r'CREATE TEMP TABLE ("_wrenchcl_stage_[0-9a-f]{32}") \(LIKE "public"\."events" INCLUDING '
+                         r'DEFAULTS\) ON COMMIT DROP', create).group(1)
+    columns = '"id", "na""me", "tags"'
+    assert render(cursor.copy_expert.call_args.args[0]) == (
+        f"COPY {stage} ({columns}) FROM STDIN WITH (FORMAT csv, HEADER false, DELIMITER ',')")
+    assert merge == (f'INSERT INTO "public"."events" ({columns}) SELECT {columns} FROM {stage} ON CONFLICT ("id") '
+                     f'DO UPDATE SET "na""me" = EXCLUDED."na""me", "tags" = EXCLUDED."tags"')
+    assert copied == [b'1,a,"{""k"": 1}"\n2,b,\n']
+    connection.commit.assert_called_once()
+
+
+def test_combined_batch_returns_the_same_values_as_sequential(pg_gateway, monkeypatch):
+    pg_gateway.update_database(
+        "CREATE TABLE items (id int PRIMARY KEY, amount numeric(30, 12), ratio float8, created timestamptz, "
+        "ref uuid, tags text[], doc jsonb)", ())
+    pg_gateway.update_database(
+        "INSERT INTO items SELECT i, 123456789012.123456789012 * i, i / 3.0, "
+        "timestamptz '2024-01-01 12:00+00' + i * interval '1 day', ('00000000-0000-0000-0000-00000000000' || i)::uuid, "
+        "ARRAY['a', i::text], jsonb_build_object('i', i) FROM generate_series(1, 5) AS i", ())
+    pg_gateway.update_database("INSERT INTO items (id) VALUES (6)", ())
+
+    def run(mode):
+        with pg_gateway.batch(mode=mode, raise_on_error=True) as batch:
+            batch.add("SELECT id, amount, created, ref FROM items ORDER BY created DESC NULLS LAST, id")
+            batch.add("SELECT id AS x, amount AS x, ratio, tags, doc FROM items WHERE id = %s", (2,), fetchall=False)
+            batch.add("SELECT count(*) AS n, sum(amount) AS total, array_agg(id ORDER BY id DESC) AS ids FROM items")
+            batch.add("SELECT * FROM items WHERE id > %s", (100,))
+        return batch.results
+
+    sequential = run('sequential')
+    assert [row['id'] for row in sequential[0]] == [5, 4, 3, 2, 1, 6]
+    assert sequential[0][1]['amount'] == Decimal('493827156048.493827156048')
+    assert sequential[0][0]['created'] == datetime.datetime(2024, 1, 6, 12, tzinfo=datetime.timezone.utc)
+    assert sequential[0][0]['ref'] == UUID(int=5)
+    assert run('combined') == sequential
+
+    statements = []
+    execute = psycopg2.extras.RealDictCursor.execute
+    monkeypatch.setattr(psycopg2.extras.RealDictCursor, 'execute',
+                        lambda cursor, query, vars=None: statements.append(query) or execute(cursor, query, vars))
+    assert run('combined') == sequential
+    assert len(statements) == 1
+    assert len(pg_gateway._result_descriptions) == 4
+    assert pg_gateway.batch().mode == 'sequential'
+
+
+def test_cast_dataframe_keeps_numeric_precision_and_normalizes_values():
+    pd = pytest.importorskip('pandas')
+    ref = UUID('12345678-1234-5678-1234-567812345678')
+    df = pd.DataFrame({
+        'amount': [Decimal('12345678901234567890.123456789'), '0.1', None],
+        'ratio': ['0.5', 1, None],
+        'ref': [ref, '{12345678-1234-5678-1234-567812345678}', None],
+        'doc': [{'a': [1]}, '{"b": 2}', None],
+        'label': [1, 'x', None],
+        'count': ['3', 4, None],
+    })
+    schema = {'amount': 'numeric', 'ratio': 'double precision', 'ref': 'uuid', 'doc': 'jsonb', 'label': 'text',
+              'count': 'bigint'}
+    casted = RdsGateway._cast_dataframe_to_schema(df.iloc[:2], schema, list(schema))
+    assert casted['amount'].tolist() == [Decimal('12345678901234567890.123456789'), '0.1']
+    assert casted['ratio'].tolist() == [0.5, 1.0]
+    assert casted['ref'].tolist() == [str(ref)] * 2
+    assert casted['doc'].tolist() == ['{"a": [1]}', '{"b": 2}']
+    assert casted['label'].tolist() == ['1', 'x']
+    assert casted['count'].tolist() == [3, 4]
+
+    casted = RdsGateway._cast_dataframe_to_schema(df.iloc[2:], schema, list(schema))
+    assert casted.iloc[0].tolist() == [None] * len(schema)
+    raw = pd.DataFrame({'ref': [ref.bytes, 'URN:UUID:' + ref.hex.upper()]})
+    assert RdsGateway._cast_dataframe_to_schema(raw, schema, ['ref'])['ref'].tolist() == [str(ref)] * 2
+
+
+@pytest.mark.parametrize('column, value', [('amount', 'abc'), ('ref', 'not-a-uuid'), ('ref', 12345), ('count', 'x')])
+def test_cast_dataframe_rejects_type_mismatches(column, value):
+    pd = pytest.importorskip('pandas')
+    schema = {'amount': 'numeric', 'ref': 'uuid', 'count': 'integer'}
+    with pytest.raises(TypeError, match=column):
+        RdsGateway._cast_dataframe_to_schema(pd.DataFrame({column: [value]}), schema, [column])
+
+
+def test_update_database_casts_to_the_table_schema(pg_gateway):
+    pd = pytest.importorskip('pandas')
+    pg_gateway.update_database("CREATE TABLE ledger (id uuid PRIMARY KEY, amount numeric(40, 20), note text)", ())
+    ref = UUID(int=7)
+    df = pd.DataFrame({'note': [7, 'x'], 'amount': ['12345678901234567890.12345678901234567890', None],
+                       'id': [str(ref).upper(), ref.bytes[::-1]]})
+    pg_gateway.update_database("INSERT INTO ledger (id, amount, note) VALUES %s", df, target_table='ledger')
+    rows = pg_gateway.get_data("SELECT id, amount, note FROM ledger ORDER BY note", return_dict=False)
+    assert [tuple(row) for row in rows] == [(ref, Decimal('12345678901234567890.12345678901234567890'), '7'),
+                                             (UUID(bytes=ref.bytes[::-1]), None, 'x')]
+
+    with pytest.raises(TypeError):
+        pg_gateway.update_database("INSERT INTO ledger (id) VALUES %s", pd.DataFrame({'id': [1]}),
+                                   target_table='ledger')
+    assert pg_gateway.update_database("INSERT INTO missing (id) VALUES %s", df, target_table='missing',
+                                      raise_on_error=False) is None
+
+
+def create_events(gateway, count, start=1):
+    gateway.update_database("CREATE TABLE IF NOT EXISTS events (id int PRIMARY KEY, updated_at timestamp, body text)",
+                            ())
+    gateway.update_database("INSERT INTO events SELECT i, timestamp '2024-01-01' + (i / 2) * interval '1 hour', "
+                            "'event ' || i FROM generate_series(%s, %s) AS i", (start, start + count - 1))
+
+
+def test_sync_incremental_pages_past_the_stored_mark(pg_gateway):
+    create_events(pg_gateway, 5)
+    pages = []
+
+    summary = pg_gateway.sync_incremental('events', 'updated_at', pages.append, key_column='id', page_size=2)
+    assert [[row['id'] for row in page] for page in pages] == [[1, 2], [3, 4], [5]]
+    assert summary['rows'] == 5 and summary['pages'] == 3
+    assert summary['watermark'] == datetime.datetime(2024, 1, 1, 2) and summary['watermark_key'] == 5
+    state = pg_gateway.get_data("SELECT watermark, watermark_key FROM wrenchcl_sync_state WHERE sync_name = 'events'",
+                                fetchall=False)
+    assert state == {'watermark': '2024-01-01T02:00:00', 'watermark_key': '5'}
+
+    create_events(pg_gateway, 2, start=6)
+    pages.clear()
+    assert pg_gateway.sync_incremental('events', 'updated_at', pages.append, key_column='id')['rows'] == 2
+    assert [row['id'] for row in pages[0]] == [6, 7]
+    assert pg_gateway.sync_incremental('events', 'updated_at', pages.append, key_column='id')['rows'] == 0
+
+
+def test_sync_incremental_resumes_after_a_failed_write(pg_gateway):
+    create_events(pg_gateway, 6)
+    written = []
+
+    def failing_sink(rows):
+        if rows[0]['id'] == 3:
+            raise IOError('snapshot write failed')
+        written.extend(row['id'] for row in rows)
+
+    with pytest.raises(IOError):
+        pg_gateway.sync_incremental('events', 'id', failing_sink, columns=['body'], page_size=2)
+    assert written == [1, 2]
+
+    pg_gateway.sync_incremental('events', 'id', lambda rows: written.extend(row['id'] for row in rows), page_size=2)
+    assert written == [1, 2, 3, 4, 5, 6]
+
+
+def test_sync_incremental_refuses_to_advance_a_mark_changed_by_another_run(pg_gateway, postgres_uri):
+    create_events(pg_gateway, 4)
+    pg_gateway.sync_incremental('events', 'id', lambda rows: None, page_size=2)
+    create_events(pg_gateway, 2, start=5)
+
+    def concurrent_sink(rows):
+        other = psycopg2.connect(postgres_uri)
+        with other, other.cursor() as cursor:
+            cursor.execute("UPDATE wrenchcl_test.wrenchcl_sync_state SET watermark = '9' WHERE sync_name = 'events'")
+        other.close()
+
+    with pytest.raises(ValueError, match='another run'):
+        pg_gateway.sync_incremental('events', 'id', concurrent_sink)
+    assert pg_gateway.get_data("SELECT watermark FROM wrenchcl_sync_state", fetchall=False) == {'watermark': '9'}
+
+
+def test_sync_incremental_creates_the_state_table_once(pg_gateway, monkeypatch):
+    create_events(pg_gateway, 1)
+    queries = []
+    update_database = pg_gateway.update_database
+
+    def recording_update(query, *args, **kwargs):
+        queries.append(render(query) if isinstance(query, sql.Composable) else query)
+        return update_database(query, *args, **kwargs)
+
+    monkeypatch.setattr(pg_gateway, 'update_database', recording_update)
+
+    for _ in range(3):
+        pg_gateway.sync_incremental('events', 'id', lambda rows: None)
+    assert sum(query.startswith('CREATE TABLE IF NOT EXISTS') for query in queries) == 1
+
+
+def test_sync_incremental_keeps_the_mark_in_s3(pg_gateway, s3_gateway, monkeypatch):
+    monkeypatch.setattr(rds_module, 'S3ServiceGateway', lambda *args, **kwargs: s3_gateway)
+    create_events(pg_gateway, 3)
+    state = dict(state_bucket=BUCKET, state_key='sync/events.json')
+
+    assert pg_gateway.sync_incremental('events', 'id', lambda rows: None, page_size=2, **state)['rows'] == 3
+    mark = json.loads(s3_gateway.get_object(BUCKET, 'sync/events.json').getvalue())
+    assert (mark['sync_name'], mark['watermark'], mark['watermark_key']) == ('events', '3', None)
+
+    create_events(pg_gateway, 1, start=4)
+
+    def concurrent_sink(rows):
+        s3_gateway.s3_client.put_object(Bucket=BUCKET, Key='sync/events.json', Body=b'{"watermark": "9"}')
+
+    with pytest.raises(ValueError, match='another run'):
+        pg_gateway.sync_incremental('events', 'id', concurrent_sink, **state)
+
+
+def test_get_data_spills_results_past_the_memory_budget(pg_gateway):
+    pg_gateway.config.db_batch_size = 50
+    pg_gateway.result_memory_budget = 20000
+    query = "SELECT i AS id, repeat('x', 20) AS body FROM generate_series(1, %s) AS i"
+
+    small = pg_gateway.get_data(query, (10,))
+    assert isinstance(small, list) and small[-1] == {'id': 10, 'body': 'x' * 20}
+
+    spilled = pg_gateway.get_data(query, (1000,), return_dict=False)
+    assert isinstance(spilled, _SpillBuffer) and len(spilled) == 1000
+    assert spilled[0] == (1, 'x' * 20) and spilled[-1] == (1000, 'x' * 20)
+    assert [row[0] for row in spilled] == list(range(1, 1001))
+    spilled.close()
+    with pytest.raises(ValueError, match='closed'):
+        spilled[0]
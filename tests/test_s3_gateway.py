@@ -0,0 +1,554 @@
+import array
+import base64
+import datetime
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import time
+
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError, EndpointConnectionError, ResponseStreamingError
+
+from conftest import BUCKET, singleton_class
+from WrenchCL._Internal import _FileDigest as file_digest_module
+from WrenchCL._Internal._S3Metrics import _S3Metrics
+
+gateway_module, _ = singleton_class('WrenchCL.Connect.S3ServiceGateway', 'S3ServiceGateway')
+
+
+def put(gateway, key, body, **kwargs):
+    gateway.s3_client.put_object(Bucket=BUCKET, Key=key, Body=body, **kwargs)
+
+
+def keys_under(gateway, prefix=''):
+    return sorted(obj.key for obj in gateway.iter_objects(BUCKET, prefix))
+
+
+def test_truncated_compressed_object_raises(s3_gateway):
+    put(s3_gateway, 'cut.csv.gz', gzip.compress(b'a,b\n' * 10000)[:-16], ContentEncoding='gzip',
+        Metadata={gateway_module.COMPRESSION_METADATA: 'gzip'})
+    with pytest.raises(EOFError):
+        s3_gateway.get_object(BUCKET, 'cut.csv.gz')
+    with pytest.raises(EOFError):
+        b''.join(s3_gateway.iter_object(BUCKET, 'cut.csv.gz'))
+
+
+def test_parallel_get_and_download_including_empty_objects(s3_gateway, tmp_path):
+    data = bytes(range(256)) * 4000
+    put(s3_gateway, 'big.bin', data)
+    put(s3_gateway, 'empty.bin', b'')
+    assert s3_gateway.get_object_parallel(BUCKET, 'big.bin', part_size=100_000, max_workers=4) == data
+    assert s3_gateway.get_object_parallel(BUCKET, 'empty.bin') == bytearray()
+
+    stats = s3_gateway.download_object_parallel(BUCKET, 'big.bin', str(tmp_path / 'big.bin'), part_size=300_000)
+    assert stats['parts'] == 4
+    assert (tmp_path / 'big.bin').read_bytes() == data
+    s3_gateway.download_object_parallel(BUCKET, 'empty.bin', str(tmp_path / 'empty.bin'))
+    assert (tmp_path / 'empty.bin').read_bytes() == b''
+
+
+def test_delete_objects_separates_keys_from_prefixes(s3_gateway):
+    for key in ('logs', 'logs/a', 'logs/b', 'other'):
+        put(s3_gateway, key, b'1')
+    assert s3_gateway.delete_objects(BUCKET, 'logs')['deleted'] == 1
+    assert keys_under(s3_gateway) == ['logs/a', 'logs/b', 'other']
+
+    assert s3_gateway.delete_objects(BUCKET, prefix='logs/')['deleted'] == 2
+    assert keys_under(s3_gateway) == ['other']
+
+    with pytest.raises(ValueError):
+        s3_gateway.delete_objects(BUCKET, prefix='')
+    with pytest.raises(ValueError):
+        s3_gateway.delete_objects(BUCKET, ['other'], prefix='logs/')
+    assert keys_under(s3_gateway) == ['other']
+    assert s3_gateway.delete_objects(BUCKET, prefix='', allow_all=True)['deleted'] == 1
+
+
+def test_object_cache_evicts_and_revalidates(s3_gateway, tmp_path):
+    cache = s3_gateway.enable_cache(str(tmp_path / 'cache'), max_bytes=2500)
+    try:
+        for i in range(5):
+            put(s3_gateway, f'cached/{i}', bytes([i]) * 1000)
+        for i in range(5):
+            assert s3_gateway.get_object(BUCKET, f'cached/{i}').read() == bytes([i]) * 1000
+        assert cache.total_bytes <= 2500
+
+        put(s3_gateway, 'cached/4', b'new')
+        assert s3_gateway.get_object(BUCKET, 'cached/4').read() == b'new'
+        assert s3_gateway.get_object(BUCKET, 'cached/0').read() == bytes([0]) * 1000
+        assert cache.total_bytes <= 2500
+    finally:
+        s3_gateway.disable_cache(clear=True)
+
+
+def test_copy_and_move_resume_from_checkpoint(s3_gateway, tmp_path):
+    for i in range(5):
+        put(s3_gateway, f'src/{i}.txt', b'content %d' % i)
+    checkpoint = tmp_path / 'copy.checkpoint'
+    checkpoint.write_text(json.dumps({'src': 'src/0.txt', 'dst': 'dst/0.txt'}) + '\n{"src": "torn')
+
+    summary = s3_gateway.copy_objects(BUCKET, prefix='src/', dst_prefix='dst/', checkpoint_path=str(checkpoint))
+    assert (summary['copied'], summary['skipped'], summary['errors']) == (4, 1, [])
+    assert not checkpoint.exists()
+    assert keys_under(s3_gateway, 'dst/') == [f'dst/{i}.txt' for i in range(1, 5)]
+
+    checkpoint.write_text(json.dumps({'src': 'src/0.txt', 'dst': 'moved/0.txt'}) + '\n')
+    put(s3_gateway, 'moved/0.txt', b'content 0')
+    summary = s3_gateway.move_objects(BUCKET, prefix='src/', dst_prefix='moved/', checkpoint_path=str(checkpoint))
+    assert (summary['copied'], summary['skipped'], summary['deleted']) == (4, 1, 5)
+    assert keys_under(s3_gateway, 'src/') == []
+    assert s3_gateway.get_object(BUCKET, 'moved/3.txt').read() == b'content 3'
+    assert not checkpoint.exists()
+
+
+def test_move_rejects_chained_mappings(s3_gateway):
+    put(s3_gateway, 'a', b'a')
+    put(s3_gateway, 'b', b'b')
+    for mapping in ({'a': 'b', 'b': 'c'}, {'a': 'a'}):
+        with pytest.raises(ValueError):
+            s3_gateway.move_objects(BUCKET, mapping)
+    assert keys_under(s3_gateway) == ['a', 'b']
+
+    summary = s3_gateway.move_objects(BUCKET, {'a': 'c', 'b': 'd'})
+    assert (summary['copied'], summary['deleted']) == (2, 2)
+    assert keys_under(s3_gateway) == ['c', 'd']
+
+
+def test_signed_urls_use_the_session_credentials(s3_gateway, frozen_clock):
+    regional = boto3.client('s3', region_name='us-east-1', endpoint_url='https://s3.us-east-1.amazonaws.com',
+                            config=Config(signature_version='s3v4', s3={'addressing_style': 'virtual'}))
+    keys = ['report.pdf', 'nested/with space.csv']
+    urls = s3_gateway.get_signed_urls(BUCKET, keys, expiration_seconds=600)
+    for key in keys:
+        assert urls[key] == regional.generate_presigned_url('get_object', Params={'Bucket': BUCKET, 'Key': key},
+                                                            ExpiresIn=600)
+
+
+def test_sync_up_and_down_are_idempotent(s3_gateway, tmp_path):
+    source = tmp_path / 'source'
+    (source / 'nested').mkdir(parents=True)
+    (source / 'a.txt').write_bytes(b'alpha')
+    (source / 'nested' / 'b.txt').write_bytes(b'beta' * 1000)
+
+    first = s3_gateway.sync_up(source, BUCKET, 'mirror')
+    assert (first['transferred'], first['skipped']) == (2, 0)
+    second = s3_gateway.sync_up(source, BUCKET, 'mirror')
+    assert (second['transferred'], second['skipped']) == (0, 2)
+
+    (source / 'a.txt').write_bytes(b'changed')
+    (source / 'nested' / 'b.txt').unlink()
+    third = s3_gateway.sync_up(source, BUCKET, 'mirror', delete=True)
+    assert (third['transferred'], third['deleted']) == (1, 1)
+    assert keys_under(s3_gateway, 'mirror/') == ['mirror/a.txt']
+
+    target = tmp_path / 'target'
+    assert s3_gateway.sync_down(BUCKET, 'mirror', target)['transferred'] == 1
+    assert s3_gateway.sync_down(BUCKET, 'mirror', target)['skipped'] == 1
+    assert (target / 'a.txt').read_bytes() == b'changed'
+    with pytest.raises(ValueError):
+        s3_gateway.sync_up(source, BUCKET, '', delete=True)
+
+
+def test_multipart_sync_reads_a_changed_file_once(s3_gateway, tmp_path, monkeypatch):
+    source = tmp_path / 'source'
+    source.mkdir()
+    path = source / 'big.bin'
+    path.write_bytes(b'0' * (11 * 1024 * 1024))
+    config = TransferConfig(multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024)
+    assert s3_gateway.sync_up(source, BUCKET, 'mirror', transfer_config=config)['transferred'] == 1
+    assert s3_gateway.sync_up(source, BUCKET, 'mirror', transfer_config=config)['skipped'] == 1
+
+    path.write_bytes(b'1' * (11 * 1024 * 1024))
+    passes = []
+    digest_file = file_digest_module._digest_file
+
+    def counting_digest_file(*args, **kwargs):
+        passes.append(args[0])
+        return digest_file(*args, **kwargs)
+
+    monkeypatch.setattr(file_digest_module, '_digest_file', counting_digest_file)
+    monkeypatch.setattr(gateway_module, '_digest_file', counting_digest_file)
+    assert s3_gateway.sync_up(source, BUCKET, 'mirror', transfer_config=config)['transferred'] == 1
+    assert passes == [str(path)]
+    stored = s3_gateway.get_object_headers(BUCKET, 'mirror/big.bin')['Metadata'][gateway_module.CONTENT_HASH_METADATA]
+    assert stored == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_digest_file_computes_every_layout_in_one_pass(tmp_path):
+    path = tmp_path / 'data.bin'
+    data = bytes(range(256)) * 10000
+    path.write_bytes(data)
+    etags, sha256 = file_digest_module._digest_file(str(path), [None, 1_000_000, 300_000])
+    assert sha256 == hashlib.sha256(data).hexdigest()
+    assert etags[None] == hashlib.md5(data).hexdigest()
+    for part_size in (1_000_000, 300_000):
+        parts = [hashlib.md5(data[i:i + part_size]).digest() for i in range(0, len(data), part_size)]
+        assert etags[part_size] == f"{hashlib.md5(b''.join(parts)).hexdigest()}-{len(parts)}"
+
+
+def test_upload_and_download_compressed_objects(s3_gateway, tmp_path):
+    data = b''.join(b'%d,row\n' % i for i in range(20000))
+    s3_gateway.upload_file(data, BUCKET, 'data.csv', compress='gzip')
+    stored = s3_gateway.s3_client.get_object(Bucket=BUCKET, Key='data.csv')
+    assert stored['ContentEncoding'].split(',')[0] == 'gzip'
+    assert gzip.decompress(stored['Body'].read()) == data
+    assert s3_gateway.get_object(BUCKET, 'data.csv').read() == data
+
+    s3_gateway.get_metrics(reset=True)
+    s3_gateway.download_object(BUCKET, 'data.csv', str(tmp_path / 'data.csv'))
+    assert (tmp_path / 'data.csv').read_bytes() == data
+    calls = s3_gateway.get_metrics(reset=True)
+    assert (calls['HeadObject'][BUCKET]['calls'], calls['GetObject'][BUCKET]['calls']) == (1, 1)
+
+
+def test_plain_download_sends_a_single_head(s3_gateway, tmp_path):
+    data = bytes(range(256)) * 100
+    put(s3_gateway, 'plain.bin', data)
+    progress = []
+    s3_gateway.get_metrics(reset=True)
+    s3_gateway.download_object(BUCKET, 'plain.bin', str(tmp_path / 'plain.bin'), progress_callback=progress.append)
+    assert (tmp_path / 'plain.bin').read_bytes() == data
+    assert sum(progress) == len(data)
+    calls = s3_gateway.get_metrics(reset=True)
+    assert (calls['HeadObject'][BUCKET]['calls'], calls['GetObject'][BUCKET]['calls']) == (1, 1)
+
+
+def test_upload_and_download_checksums(s3_gateway, tmp_path):
+    data = b''.join(b'%d,row\n' % i for i in range(20000))
+    digest = s3_gateway.upload_file(data, BUCKET, 'data.csv', compress='gzip', checksum='sha256',
+                                    return_checksum=True)
+    raw = s3_gateway.s3_client.get_object(Bucket=BUCKET, Key='data.csv')['Body'].read()
+    assert digest == hashlib.sha256(raw).hexdigest()
+
+    local_path = tmp_path / 'data.csv'
+    assert s3_gateway.download_object(BUCKET, 'data.csv', str(local_path), checksum='sha256') == digest
+    assert local_path.read_bytes() == data
+    assert s3_gateway.upload_file(io.BytesIO(data), BUCKET, 'plain.csv', checksum='crc32') is None
+
+
+def test_writer_aborts_multipart_upload_on_error(s3_gateway):
+    part = b'x' * (5 * 1024 * 1024)
+    with pytest.raises(RuntimeError):
+        with s3_gateway.open_writer(BUCKET, 'partial.bin', part_size=len(part)) as writer:
+            writer.write(part)
+            writer.write(part)
+            raise RuntimeError('producer failed')
+    assert s3_gateway.s3_client.list_multipart_uploads(Bucket=BUCKET).get('Uploads', []) == []
+    assert not s3_gateway.check_object_existence(BUCKET, 'partial.bin')
+
+    with s3_gateway.open_writer(BUCKET, 'complete.bin', part_size=len(part)) as writer:
+        writer.write(part)
+        writer.write(b'tail')
+    assert s3_gateway.get_object_headers(BUCKET, 'complete.bin')['ContentLength'] == len(part) + 4
+
+
+def test_check_objects_exist_listing_and_head_modes(s3_gateway):
+    present = [f'dense/{i:03d}' for i in range(0, 40, 2)]
+    for key in present + ['sparse/x']:
+        put(s3_gateway, key, b'1')
+    dense = [f'dense/{i:03d}' for i in range(40)]
+
+    s3_gateway.get_metrics(reset=True)
+    listed = s3_gateway.check_objects_exist(BUCKET, dense, list_page_cost=1.0)
+    assert listed == {key: key in present for key in dense}
+    calls = s3_gateway.get_metrics(reset=True)
+    assert 'ListObjectsV2' in calls and 'HeadObject' not in calls
+
+    headed = s3_gateway.check_objects_exist(BUCKET, ['sparse/x', 'sparse/y'], metadata=True)
+    calls = s3_gateway.get_metrics(reset=True)
+    assert 'HeadObject' in calls and 'ListObjectsV2' not in calls
+    assert headed['sparse/y'] is None
+    assert (headed['sparse/x'].key, headed['sparse/x'].size) == ('sparse/x', 1)
+
+
+@pytest.mark.parametrize('make_payload', [bytes, bytearray, lambda data: memoryview(array.array('B', data)),
+                                          lambda data: memoryview(bytearray(data))[::1]])
+def test_buffers_upload_without_copying(s3_gateway, make_payload):
+    data = b'zero copy ' * 1000
+    payload = make_payload(data)
+    source, size, owned = type(s3_gateway)._open_upload_source(payload, None)
+    assert source._view.obj is (payload.obj if isinstance(payload, memoryview) else payload)
+    assert (size, owned) == (len(data), True)
+    source.close()
+
+    s3_gateway.upload_file(payload, BUCKET, 'buffer.bin')
+    assert s3_gateway.get_object(BUCKET, 'buffer.bin').read() == data
+
+
+def test_mmap_uploads_from_the_mapping(s3_gateway, tmp_path):
+    path = tmp_path / 'mapped.bin'
+    path.write_bytes(bytes(range(256)) * 100)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        source, size, _ = type(s3_gateway)._open_upload_source(mapping, None)
+        assert source._view.obj is mapping and size == len(mapping)
+        source.close()
+        s3_gateway.upload_file(mapping, BUCKET, 'mapped.bin')
+    assert s3_gateway.get_object(BUCKET, 'mapped.bin').read() == path.read_bytes()
+
+
+def test_base64_payloads_are_decoded_while_streaming(s3_gateway, tmp_path):
+    data = bytes(range(256)) * 3000
+    encoded = base64.encodebytes(data)
+    encoded_path = tmp_path / 'payload.b64'
+    encoded_path.write_bytes(encoded)
+    payloads = [encoded.decode('ascii'), encoded, io.BytesIO(encoded), io.StringIO(encoded.decode('ascii')),
+                encoded_path]
+    for i, payload in enumerate(payloads):
+        s3_gateway.upload_file(payload, BUCKET, f'decoded/{i}', encoding='base64')
+        assert s3_gateway.get_object(BUCKET, f'decoded/{i}').read() == data
+
+    source, size, _ = type(s3_gateway)._open_upload_source(encoded.decode('ascii'), 'base64')
+    assert size is None and not source.seekable()
+    source.close()
+    with pytest.raises(ValueError):
+        s3_gateway.upload_file(b'not base64!', BUCKET, 'invalid', encoding='base64')
+
+
+def test_plain_str_uploads_are_deprecated(s3_gateway):
+    with pytest.warns(DeprecationWarning):
+        s3_gateway.upload_file(base64.b64encode(b'hello').decode('ascii'), BUCKET, 'decoded')
+    with pytest.warns(DeprecationWarning):
+        s3_gateway.upload_file('plain text!', BUCKET, 'text')
+    assert s3_gateway.get_object(BUCKET, 'decoded').read() == b'hello'
+    assert s3_gateway.get_object(BUCKET, 'text').read() == b'plain text!'
+
+
+def test_failed_uploads_are_rewound_and_retried_only_when_seekable(s3_gateway, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    upload_fileobj = s3_gateway.s3_client.upload_fileobj
+    attempts = []
+
+    def flaky_upload(stream, *args, **kwargs):
+        attempts.append(stream.read(3))
+        if len(attempts) == 1:
+            raise ClientError({'Error': {'Code': 'SlowDown'}, 'ResponseMetadata': {'HTTPStatusCode': 503}},
+                              'PutObject')
+        stream.seek(stream.tell() - 3)
+        return upload_fileobj(stream, *args, **kwargs)
+
+    monkeypatch.setattr(s3_gateway.s3_client, 'upload_fileobj', flaky_upload)
+    s3_gateway.upload_file(io.BytesIO(b'payload'), BUCKET, 'retried')
+    assert attempts == [b'pay', b'pay']
+    assert s3_gateway.get_object(BUCKET, 'retried').read() == b'payload'
+
+    attempts.clear()
+    with pytest.raises(ClientError):
+        s3_gateway.upload_file(base64.b64encode(b'payload'), BUCKET, 'streamed', encoding='base64')
+    assert len(attempts) == 1
+
+
+def test_iter_and_open_object_stream_in_chunks_and_lines(s3_gateway):
+    lines = [json.dumps({'id': i, 'name': f'row {i}'}).encode() + b'\n' for i in range(2000)]
+    put(s3_gateway, 'events.jsonl', b''.join(lines))
+
+    chunks = list(s3_gateway.iter_object(BUCKET, 'events.jsonl', chunk_size=4096))
+    assert b''.join(chunks) == b''.join(lines)
+    assert max(map(len, chunks)) <= 4096 and len(chunks) > 1
+
+    with s3_gateway.open_object(BUCKET, 'events.jsonl', chunk_size=1000) as stream:
+        assert stream.readline() == lines[0]
+        assert stream.read(len(lines[1])) == lines[1]
+        assert list(stream) == lines[2:]
+    put(s3_gateway, 'empty.jsonl', b'')
+    assert list(s3_gateway.iter_object(BUCKET, 'empty.jsonl')) == []
+    with s3_gateway.open_object(BUCKET, 'empty.jsonl') as stream:
+        assert stream.read() == b''
+
+
+def test_iter_object_resumes_a_dropped_stream_from_the_last_byte(s3_gateway, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    data = bytes(range(256)) * 1000
+    put(s3_gateway, 'big.bin', data)
+    get_object = s3_gateway.s3_client.get_object
+    requests = []
+
+    def dropping_get(**kwargs):
+        requests.append(kwargs)
+        response = get_object(**kwargs)
+        if len(requests) == 1:
+            body = response['Body']
+
+            def drop_after_first_chunk(chunk_size):
+                yield body.read(chunk_size)
+                raise ResponseStreamingError(error='connection reset by peer')
+
+            body.iter_chunks = drop_after_first_chunk
+        return response
+
+    monkeypatch.setattr(s3_gateway.s3_client, 'get_object', dropping_get)
+    assert b''.join(s3_gateway.iter_object(BUCKET, 'big.bin', chunk_size=100_000)) == data
+    etag = s3_gateway.s3_client.head_object(Bucket=BUCKET, Key='big.bin')['ETag']
+    assert requests == [{'Bucket': BUCKET, 'Key': 'big.bin'},
+                        {'Bucket': BUCKET, 'Key': 'big.bin', 'Range': 'bytes=100000-', 'IfMatch': etag}]
+
+
+def test_transfer_config_is_applied_per_gateway_and_per_call(s3_gateway, tmp_path):
+    config = s3_gateway.set_transfer_config(multipart_threshold=5 * 1024 ** 2, multipart_chunksize=5 * 1024 ** 2,
+                                            max_concurrency=2)
+    assert (config.multipart_threshold, config.max_request_concurrency) == (5 * 1024 ** 2, 2)
+    config = s3_gateway.set_transfer_config(use_threads=False)
+    assert (config.multipart_chunksize, config.max_request_concurrency, config.use_threads) == (5 * 1024 ** 2, 2, False)
+
+    data = bytes(range(256)) * (11 * 1024 ** 2 // 256)
+    progress = []
+    s3_gateway.upload_file(data, BUCKET, 'multipart.bin', progress_callback=progress.append)
+    assert sum(progress) == len(data)
+    assert s3_gateway.s3_client.head_object(Bucket=BUCKET, Key='multipart.bin')['ETag'].endswith('-3"')
+
+    single_part = TransferConfig(multipart_threshold=64 * 1024 ** 2)
+    s3_gateway.upload_file(data, BUCKET, 'single.bin', transfer_config=single_part)
+    assert '-' not in s3_gateway.s3_client.head_object(Bucket=BUCKET, Key='single.bin')['ETag']
+
+    s3_gateway.get_metrics(reset=True)
+    received = []
+    s3_gateway.download_object(BUCKET, 'multipart.bin', str(tmp_path / 'multipart.bin'),
+                               transfer_config=TransferConfig(multipart_threshold=5 * 1024 ** 2,
+                                                              multipart_chunksize=4 * 1024 ** 2),
+                               progress_callback=received.append, log_progress=True)
+    assert (tmp_path / 'multipart.bin').read_bytes() == data
+    assert sum(received) == len(data)
+    assert s3_gateway.get_metrics()['GetObject'][BUCKET]['calls'] == 3
+
+
+def test_iter_objects_yields_records_and_fans_out_over_prefixes(s3_gateway, monkeypatch):
+    keys = ['root.csv'] + [f'data/{region}/{day}/part-{i}.{ext}' for region in ('eu', 'us', 'ap')
+                           for day in ('d1', 'd2') for i, ext in enumerate(('csv', 'json'))]
+    for key in keys:
+        put(s3_gateway, key, key.encode())
+
+    records = list(s3_gateway.iter_objects(BUCKET))
+    assert [record.key for record in records] == sorted(keys)
+    first = records[0]
+    assert (first.size, first.etag) == (len(first.key), hashlib.md5(first.key.encode()).hexdigest().join('""'))
+    assert first.last_modified.tzinfo is not None
+
+    assert sorted(obj.key for obj in s3_gateway.iter_objects(BUCKET, suffix=('.json',))) == \
+        sorted(key for key in keys if key.endswith('.json'))
+    modified = first.last_modified.replace(tzinfo=None)
+    assert len(list(s3_gateway.iter_objects(BUCKET, modified_since=modified))) == len(keys)
+    assert list(s3_gateway.iter_objects(BUCKET, modified_since=modified + datetime.timedelta(days=1))) == []
+
+    s3_gateway.get_metrics(reset=True)
+    fanned = [obj.key for obj in s3_gateway.iter_objects(BUCKET, delimiter='/', fan_out_depth=3, max_workers=3)]
+    assert sorted(fanned) == sorted(keys)
+    # One listing each for '', 'data/' and the three regions, then one per day prefix
+    assert s3_gateway.get_metrics()['ListObjectsV2'][BUCKET]['calls'] == 5 + 6
+    assert sorted(obj.key for obj in s3_gateway.iter_objects(BUCKET, 'data/', suffix='.csv', delimiter='/')) == \
+        sorted(key for key in keys if key.startswith('data/') and key.endswith('.csv'))
+
+    paginate = s3_gateway._paginate
+
+    def failing_paginate(bucket, prefix, **kwargs):
+        if prefix == 'data/us/':
+            raise ClientError({'Error': {'Code': 'AccessDenied'}}, 'ListObjectsV2')
+        return paginate(bucket, prefix, **kwargs)
+
+    monkeypatch.setattr(s3_gateway, '_paginate', failing_paginate)
+    with pytest.raises(ClientError):
+        list(s3_gateway.iter_objects(BUCKET, 'data/', delimiter='/'))
+
+
+def test_read_table_streams_csv_and_jsonl_in_chunks(s3_gateway):
+    pd = pytest.importorskip('pandas')
+    frame = pd.DataFrame({'id': range(25), 'name': [f'row {i}' for i in range(25)], 'score': [i / 4 for i in range(25)]})
+    put(s3_gateway, 'table.csv.gz', gzip.compress(frame.to_csv(index=False).encode()))
+    s3_gateway.upload_file(frame.to_json(orient='records', lines=True).encode(), BUCKET, 'table.data',
+                           compress='gzip')
+
+    chunks = list(s3_gateway.read_table(BUCKET, 'table.csv.gz', chunksize=10, columns=['id', 'score']))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), frame[['id', 'score']])
+
+    chunks = list(s3_gateway.read_table(BUCKET, 'table.data', file_format='jsonl', chunksize=10,
+                                        columns=['name', 'id']))
+    assert [list(chunk.columns) for chunk in chunks] == [['name', 'id']] * 3
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), frame[['name', 'id']])
+
+    pytest.importorskip('pyarrow')
+    batches = list(s3_gateway.read_table(BUCKET, 'table.csv.gz', chunksize=20, output='arrow'))
+    assert [batch.num_rows for batch in batches] == [20, 5]
+    assert batches[0].column_names == ['id', 'name', 'score']
+
+    with pytest.raises(ValueError, match='file_format'):
+        next(s3_gateway.read_table(BUCKET, 'table.data'))
+    with pytest.raises(ValueError, match='output'):
+        next(s3_gateway.read_table(BUCKET, 'table.csv.gz', output='polars'))
+
+
+def test_read_table_fetches_only_the_selected_parquet_columns(s3_gateway):
+    pd = pytest.importorskip('pandas')
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    table = pa.table({f'c{i}': [f'{i}-{row}' * 20 for row in range(4000)] for i in range(40)})
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=1000, compression='none')
+    put(s3_gateway, 'wide.parquet', buffer.getvalue())
+
+    s3_gateway.get_metrics(reset=True)
+    frames = list(s3_gateway.read_table(BUCKET, 'wide.parquet', columns=['c3', 'c17'], chunksize=1000))
+    fetched = s3_gateway.get_metrics()['GetObject'][BUCKET]['bytes_in']
+    assert [len(frame) for frame in frames] == [1000] * 4
+    pd.testing.assert_frame_equal(pd.concat(frames, ignore_index=True),
+                                  table.select(['c3', 'c17']).to_pandas())
+    assert fetched < len(buffer.getvalue()) / 10
+
+    batches = list(s3_gateway.read_table(BUCKET, 'wide.parquet', columns=['c5'], row_groups=[2], output='arrow'))
+    assert [batch.num_rows for batch in batches] == [1000]
+    assert batches[0].column('c5')[0].as_py() == '5-2000' * 20
+
+
+def test_metrics_record_calls_bytes_and_errors_per_operation_and_bucket(s3_gateway, monkeypatch, caplog):
+    s3_gateway.s3_client.create_bucket(Bucket='other')
+    s3_gateway.get_metrics(reset=True)
+    s3_gateway.upload_file(b'x' * 1000, BUCKET, 'a.bin')
+    s3_gateway.upload_file(b'y' * 500, 'other', 'b.bin')
+    assert s3_gateway.get_object(BUCKET, 'a.bin').read() == b'x' * 1000
+    assert not s3_gateway.check_object_existence(BUCKET, 'missing.bin')
+    with pytest.raises(ClientError):
+        s3_gateway.s3_client.get_object(Bucket=BUCKET, Key='missing.bin')
+
+    metrics = s3_gateway.get_metrics(reset=True)
+    assert metrics['PutObject'][BUCKET]['bytes_out'] == 1000 and metrics['PutObject']['other']['bytes_out'] == 500
+    get = metrics['GetObject'][BUCKET]
+    assert (get['calls'], get['errors']) == (2, {'NoSuchKey': 1})
+    assert get['bytes_in'] >= 1000
+    assert metrics['HeadObject'][BUCKET]['errors'] == {'404': 1}
+    assert sum(get['latency_histogram'].values()) == 2
+    assert 0 < get['mean_seconds'] <= get['max_seconds'] and get['p50_seconds'] <= get['p99_seconds']
+    assert s3_gateway.get_metrics() == {}
+
+    s3_gateway.list_objects(BUCKET)
+    with caplog.at_level('INFO'):
+        s3_gateway.log_metrics_summary()
+    assert 'ListObjectsV2 wrenchcl-test: 1 calls' in caplog.text
+    assert s3_gateway.get_metrics() == {}
+
+    registered = []
+    monkeypatch.setattr(gateway_module.atexit, 'register', registered.append)
+    s3_gateway.log_metrics_at_exit()
+    s3_gateway.log_metrics_at_exit()
+    assert registered == [s3_gateway.metrics.log_summary]
+
+    s3_gateway.metrics.detach(s3_gateway.s3_client)
+    s3_gateway.list_objects(BUCKET)
+    assert s3_gateway.get_metrics() == {}
+
+
+def test_metrics_record_connection_errors(aws_credentials):
+    client = boto3.client('s3', region_name='us-east-1', config=Config(retries={'max_attempts': 0}))
+
+    def refuse(**kwargs):
+        raise EndpointConnectionError(endpoint_url='https://s3.amazonaws.com')
+
+    client.meta.events.register('before-send.s3', refuse)
+    metrics = _S3Metrics()
+    metrics.attach(client)
+    with pytest.raises(EndpointConnectionError):
+        client.head_object(Bucket=BUCKET, Key='a.bin')
+    stats = metrics.snapshot()['HeadObject'][BUCKET]
+    assert (stats['calls'], stats['errors'], stats['bytes_in']) == (1, {'EndpointConnectionError': 1}, 0)